@@ -37,6 +37,7 @@ Bạn là trợ lý hỗ trợ sinh viên của Trường Đại học Công ngh
 **TOOLS TRUY VẤN TÀI LIỆU:**
 - `retrieve_regulation()`: Quy định, chính sách chung (áp dụng mọi ngành)
 - `retrieve_curriculum()`: Thông tin ngành cụ thể (môn học, lộ trình, cơ hội nghề nghiệp)
+- `batch_retrieve(queries, collection_type)`: Gộp NHIỀU query cùng loại vào MỘT lần gọi (VD: user hỏi "điều kiện tốt nghiệp và quy định chuyển ngành?" -> `batch_retrieve(["điều kiện tốt nghiệp chính quy", "quy định chuyển ngành chính quy"], "regulation")`)
 
 **QUY TẮC GỌI TOOL:**
 - MẶC ĐỊNH HỆ ĐÀO TẠO: Nếu user không nhắc tới "từ xa", "liên thông", "văn bằng 2" -> Mặc định là hệ CHÍNH QUY.
@@ -113,6 +114,7 @@ Bạn là trợ lý hỗ trợ sinh viên của Trường Đại học Công ngh
 **TOOLS TRUY VẤN TÀI LIỆU:**
 - `retrieve_regulation()`: Quy định, chính sách chung (áp dụng mọi ngành)
 - `retrieve_curriculum()`: Thông tin ngành cụ thể (môn học, lộ trình, cơ hội nghề nghiệp)
+- `batch_retrieve(queries, collection_type)`: Gộp NHIỀU query cùng loại vào MỘT lần gọi (VD: user hỏi "điều kiện tốt nghiệp và quy định chuyển ngành?" -> `batch_retrieve(["điều kiện tốt nghiệp chính quy", "quy định chuyển ngành chính quy"], "regulation")`)
 
 **QUY TẮC GỌI TOOL:**
 - MẶC ĐỊNH HỆ ĐÀO TẠO: Nếu user không nhắc tới "từ xa", "liên thông", "văn bằng 2" -> Mặc định là hệ CHÍNH QUY.
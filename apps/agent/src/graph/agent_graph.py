@@ -2,6 +2,7 @@
 LangGraph agent workflow definition.
 """
 import asyncio
+import logging
 
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode
@@ -13,6 +14,73 @@ from .nodes import agent_node, should_continue
 from ..utils.logger import logger
 
 
+async def _execute_tool_with_timeout(tool_call, tools_by_name, timeout):
+    """Execute single tool with timeout."""
+    tool_name = tool_call["name"]
+    tool_call_id = tool_call["id"]
+    args = tool_call.get("args", {})
+
+    logger.info("[%s] Starting... Args: %s", tool_name, args)
+
+    try:
+        # Lookup tool
+        if tool_name not in tools_by_name:
+            error_msg = f"Error: Tool '{tool_name}' not found"
+            logger.error("    Status: ERROR - %s", error_msg)
+            return ToolMessage(
+                content=error_msg,
+                tool_call_id=tool_call_id,
+                status="error"
+            )
+
+        tool = tools_by_name[tool_name]
+
+        # Execute with timeout
+        # Try async first (MCP tools), fallback to sync in thread
+        if hasattr(tool, 'ainvoke'):
+            result = await asyncio.wait_for(
+                tool.ainvoke(args),
+                timeout=timeout
+            )
+        else:
+            result = await asyncio.wait_for(
+                asyncio.to_thread(tool.invoke, args),
+                timeout=timeout
+            )
+
+        # Truncate for logging (only stringify the result when it will be logged)
+        if logger.isEnabledFor(logging.INFO):
+            result_str = str(result)
+            preview = result_str[:500] + "..." if len(result_str) > 500 else result_str
+            logger.info("    [%s] Status: SUCCESS | Output: %s", tool_name, preview)
+
+        return ToolMessage(
+            content=result,
+            tool_call_id=tool_call_id,
+        )
+
+    except asyncio.TimeoutError:
+        error_msg = (
+            f"Tool '{tool_name}' timed out after {timeout}s. "
+            f"The MCP server may be unresponsive or the operation is taking too long."
+        )
+        logger.error("    [%s] Status: TIMEOUT - %s", tool_name, error_msg)
+        return ToolMessage(
+            content=error_msg,
+            tool_call_id=tool_call_id,
+            status="error"
+        )
+
+    except Exception as e:
+        error_msg = f"Tool '{tool_name}' failed: {str(e)}"
+        logger.error("    [%s] Status: ERROR - %s", tool_name, error_msg)
+        return ToolMessage(
+            content=error_msg,
+            tool_call_id=tool_call_id,
+            status="error"
+        )
+
+
 def _create_tool_node_with_logging_and_timeout(tools, timeout=120):
     """
     Create custom tool execution node with timeout and logging.
@@ -36,83 +104,16 @@ def _create_tool_node_with_logging_and_timeout(tools, timeout=120):
         last_message = messages[-1]
 
         # Extract tool calls from last AI message
-        tool_calls = last_message.tool_calls if hasattr(last_message, "tool_calls") else []
+        tool_calls = getattr(last_message, "tool_calls", None) or []
 
         if not tool_calls:
             return {"messages": []}
 
-        logger.info(f"[TOOLS] Executing {len(tool_calls)} tool(s) with {timeout}s timeout each")
-
-        # Execute tools in parallel with timeout
-        async def execute_tool_with_timeout(tool_call):
-            """Execute single tool with timeout."""
-            tool_name = tool_call["name"]
-            tool_call_id = tool_call["id"]
-            args = tool_call.get("args", {})
-
-            logger.info(f"[{tool_name}] Starting... Args: {args}")
-
-            try:
-                # Lookup tool
-                if tool_name not in tools_by_name:
-                    error_msg = f"Error: Tool '{tool_name}' not found"
-                    logger.error(f"    Status: ERROR - {error_msg}")
-                    return ToolMessage(
-                        content=error_msg,
-                        tool_call_id=tool_call_id,
-                        status="error"
-                    )
-
-                tool = tools_by_name[tool_name]
-
-                # Execute with timeout
-                # Try async first (MCP tools), fallback to sync in thread
-                if hasattr(tool, 'ainvoke'):
-                    result = await asyncio.wait_for(
-                        tool.ainvoke(args),
-                        timeout=timeout
-                    )
-                else:
-                    result = await asyncio.wait_for(
-                        asyncio.to_thread(tool.invoke, args),
-                        timeout=timeout
-                    )
-
-                # Truncate for logging
-                result_str = str(result)
-                preview = result_str[:500] + "..." if len(result_str) > 500 else result_str
-
-                logger.info(f"    [{tool_name}] Status: SUCCESS | Output: {preview}")
-
-                return ToolMessage(
-                    content=result,
-                    tool_call_id=tool_call_id,
-                )
-
-            except asyncio.TimeoutError:
-                error_msg = (
-                    f"Tool '{tool_name}' timed out after {timeout}s. "
-                    f"The MCP server may be unresponsive or the operation is taking too long."
-                )
-                logger.error(f"    [{tool_name}] Status: TIMEOUT - {error_msg}")
-                return ToolMessage(
-                    content=error_msg,
-                    tool_call_id=tool_call_id,
-                    status="error"
-                )
-
-            except Exception as e:
-                error_msg = f"Tool '{tool_name}' failed: {str(e)}"
-                logger.error(f"    [{tool_name}] Status: ERROR - {error_msg}")
-                return ToolMessage(
-                    content=error_msg,
-                    tool_call_id=tool_call_id,
-                    status="error"
-                )
+        logger.info("[TOOLS] Executing %d tool(s) with %ss timeout each", len(tool_calls), timeout)
 
         # Execute all tools in parallel
         tool_messages = await asyncio.gather(*[
-            execute_tool_with_timeout(tc) for tc in tool_calls
+            _execute_tool_with_timeout(tc, tools_by_name, timeout) for tc in tool_calls
         ])
 
         return {"messages": tool_messages}
@@ -2,12 +2,58 @@
 Checkpointer for LangGraph state persistence.
 """
 
+from collections import OrderedDict
+
 from langgraph.checkpoint.memory import MemorySaver
 # from langgraph.checkpoint.postgres import PostgresSaver
 # from langgraph.checkpoint.redis import RedisSaver
+from src.config.settings import settings
 from src.utils.logger import logger
 
 
+class BoundedMemorySaver(MemorySaver):
+    """
+    MemorySaver that keeps at most `max_threads` conversations.
+
+    The stock MemorySaver never forgets a thread, so a long-running server
+    grows by one full checkpoint history per distinct thread_id. Threads are
+    tracked in LRU order (reads and writes both count as use) and the least
+    recently used one is deleted once the cap is exceeded.
+    """
+
+    def __init__(self, max_threads: int, **kwargs):
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self._thread_lru = OrderedDict()
+
+    def _touch(self, config):
+        thread_id = config["configurable"]["thread_id"]
+        if thread_id in self._thread_lru:
+            self._thread_lru.move_to_end(thread_id)
+        else:
+            self._thread_lru[thread_id] = None
+
+        while len(self._thread_lru) > self.max_threads:
+            evicted, _ = self._thread_lru.popitem(last=False)
+            self.delete_thread(evicted)
+            logger.debug(f"[CHECKPOINTER] Evicted thread {evicted}")
+
+    def get_tuple(self, config):
+        checkpoint_tuple = super().get_tuple(config)
+        if checkpoint_tuple is not None:
+            self._touch(config)
+        return checkpoint_tuple
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        self._touch(config)
+        return next_config
+
+    def delete_thread(self, thread_id):
+        super().delete_thread(thread_id)
+        self._thread_lru.pop(thread_id, None)
+
+
 def create_checkpointer(backend: str = "memory"):
     """
     Create checkpointer for state persistence.
@@ -47,8 +93,13 @@ def _create_memory_checkpointer():
     Note: State is lost when process exits.
     Use PostgreSQL or Redis for production.
     """
-    logger.info("[CHECKPOINTER] Creating in-memory checkpointer")
-    checkpointer = MemorySaver()
+    max_threads = settings.checkpointer.MAX_THREADS
+    if max_threads > 0:
+        logger.info(f"[CHECKPOINTER] Creating in-memory checkpointer (max {max_threads} threads)")
+        checkpointer = BoundedMemorySaver(max_threads=max_threads)
+    else:
+        logger.info("[CHECKPOINTER] Creating in-memory checkpointer (unbounded)")
+        checkpointer = MemorySaver()
     logger.info("[CHECKPOINTER] ✅ In-memory checkpointer created (state will be lost on restart)")
     return checkpointer
 
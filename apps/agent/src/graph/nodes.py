@@ -2,11 +2,14 @@
 Graph nodes for LangGraph agent workflow.
 """
 
+import hashlib
+import logging
+from functools import lru_cache
 from typing import Literal
-from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
+from langchain_core.messages import AIMessage, SystemMessage, HumanMessage, RemoveMessage, ToolMessage
 
 from .state import AgentState
-from ..config import BENCHMARK_PROMPT
+from ..config import BENCHMARK_PROMPT, settings
 from ..query_refinement.refiner import QueryRefiner
 from ..utils.logger import logger
 
@@ -14,6 +17,28 @@ from ..utils.logger import logger
 # System prompt for UIT AI Assistant (imported from config/prompts.py)
 SYSTEM_PROMPT = BENCHMARK_PROMPT
 
+# Static first message, byte-identical for every user and turn so the
+# provider can serve it from its prompt cache
+SYSTEM_MESSAGE = SystemMessage(content=SYSTEM_PROMPT)
+
+# Logged at startup; a changed hash means cached prefixes were invalidated
+SYSTEM_PROMPT_HASH = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+# OpenAI prompt_cache_key routing (see settings.llm.PROMPT_CACHE_KEY)
+USE_PROMPT_CACHE_KEY = settings.llm.PROMPT_CACHE_KEY and settings.llm.PROVIDER.lower() == "openai"
+
+# Per-user section, sent as a separate message after the static prompt
+USER_CONTEXT_TEMPLATE = (
+    "## THÔNG TIN NGƯỜI DÙNG HIỆN TẠI\nUser ID: {user_id}\n\n"
+    "Khi gọi tool `get_user_credential`, LUÔN LUÔN sử dụng user_id này."
+)
+
+# Appended to tool outputs from earlier turns that were cut short
+STALE_TOOL_OUTPUT_MARKER = "\n...[đã lược bớt kết quả tool của lượt trước]"
+
+# Log banner separator
+_RULE = "=" * 70
+
 # Initialize query refiner (singleton)
 _query_refiner = None
 
@@ -25,6 +50,93 @@ def get_query_refiner():
     return _query_refiner
 
 
+@lru_cache(maxsize=4096)
+def _get_user_context_message(user_id: str) -> SystemMessage:
+    """
+    Build the per-user context message once and reuse it on every turn.
+
+    Kept out of SYSTEM_MESSAGE so the large static prefix stays identical
+    across users and remains cacheable by the provider.
+    """
+    return SystemMessage(content=USER_CONTEXT_TEMPLATE.format(user_id=user_id))
+
+
+def _window_history(messages: list, max_turns: int) -> list:
+    """
+    Keep only the last `max_turns` user turns of the conversation.
+
+    The cut always lands on a HumanMessage, so an AIMessage with tool_calls is
+    never separated from its ToolMessages. Counting messages instead of tokens
+    keeps tokenization off the hot path.
+    """
+    turns = 0
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            turns += 1
+            if turns == max_turns:
+                return messages[i:]
+    return messages
+
+
+def _tool_output_text(content) -> str | None:
+    """
+    Text of a ToolMessage's content, or None if it holds non-text blocks.
+
+    Content is either a plain string or a list of content blocks (strings or
+    {"type": "text", "text": ...} dicts). Messages with image/file blocks are
+    left alone: flattening them to text would silently drop the attachment.
+    """
+    if isinstance(content, str):
+        return content
+
+    parts = []
+    for block in content:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and block.get("type") == "text":
+            parts.append(block.get("text", ""))
+        else:
+            return None
+    return "".join(parts)
+
+
+def _trim_stale_tool_outputs(messages: list, limit: int) -> None:
+    """
+    Cut tool outputs from earlier turns down to `limit` chars, in place.
+
+    Retrieval results are several KB of JSON each and the assistant's answer
+    derived from them is already in the history, so resending them in full
+    on every later turn mostly burns prompt tokens. Only messages before the
+    latest user message are touched; the current turn's tool outputs stay
+    intact. List content is flattened to its text before cutting.
+
+    This trades some prompt caching for size: the previous turn's outputs are
+    sent in full during that turn and cut on the next one, so the cached
+    prefix only reaches up to the first of them. Older turns were cut the
+    same way before (truncation is deterministic), so that part of the prefix
+    stays stable.
+    """
+    last_human = None
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            last_human = i
+            break
+
+    if last_human is None:
+        return
+
+    for i in range(last_human):
+        message = messages[i]
+        if not isinstance(message, ToolMessage):
+            continue
+
+        text = _tool_output_text(message.content)
+        if text is not None and len(text) > limit:
+            messages[i] = message.model_copy(
+                update={"content": text[:limit] + STALE_TOOL_OUTPUT_MARKER}
+            )
+
+
 def agent_node(state: AgentState, llm_with_tools):
     """
     Agent reasoning node - LLM decides whether to use tools or respond.
@@ -45,41 +157,65 @@ def agent_node(state: AgentState, llm_with_tools):
     user_id = state["user_id"]
 
     # Step 1: Expand acronyms in latest user message
-    refiner = get_query_refiner()
+    refined_message = None
     if messages and isinstance(messages[-1], HumanMessage):
         user_query = messages[-1].content
-        refined_query = refiner.refine(user_query, partial=True)
+        refined_query = get_query_refiner().refine(user_query, partial=True)
 
         if refined_query and refined_query != user_query:
-            # Replace last message with refined version
-            messages = messages[:-1] + [HumanMessage(content=refined_query)]
-            logger.info(f"[QUERY REFINER] Expanded: {user_query} -> {refined_query}")
+            refined_message = HumanMessage(content=refined_query)
+            logger.info("[QUERY REFINER] Expanded: %s -> %s", user_query, refined_query)
 
     # Step 2: Add system prompt if not already present (first invocation)
-    has_system_prompt = (
-        len(messages) > 0 and
-        isinstance(messages[0], SystemMessage)
-    )
-
-    if not has_system_prompt:
-        # Inject user_id into system prompt
-        system_prompt_with_user_id = SYSTEM_PROMPT + f"\n\n## THÔNG TIN NGƯỜI DÙNG HIỆN TẠI\nUser ID: {user_id}\n\nKhi gọi tool `get_user_credential`, LUÔN LUÔN sử dụng user_id này."
-        messages = [SystemMessage(content=system_prompt_with_user_id)] + messages
+    has_system_prompt = bool(messages) and isinstance(messages[0], SystemMessage)
+
+    # Build the LLM input with a single copy of the (windowed) history
+    if has_system_prompt:
+        prefix, history = messages[:1], messages[1:]
+    else:
+        # Static prompt first (prompt-cache prefix), then user_id context
+        prefix, history = [SYSTEM_MESSAGE, _get_user_context_message(user_id)], messages
+
+    removals = []
+    if settings.llm.HISTORY_MAX_TURNS > 0:
+        windowed = _window_history(history, settings.llm.HISTORY_MAX_TURNS)
+        if settings.llm.PRUNE_HISTORY and len(windowed) < len(history):
+            # Turns that fell out of the window are never sent again; remove
+            # them from state instead of re-checkpointing them every step
+            dropped = history[:len(history) - len(windowed)]
+            removals = [RemoveMessage(id=msg.id) for msg in dropped if msg.id]
+        history = windowed
+
+    messages = [*prefix, *history]
+
+    if refined_message is not None:
+        # Replace last message with refined version
+        messages[-1] = refined_message
+
+    if settings.llm.HISTORY_TOOL_OUTPUT_CHARS > 0:
+        _trim_stale_tool_outputs(messages, settings.llm.HISTORY_TOOL_OUTPUT_CHARS)
 
     # Step 3: Invoke LLM with tools
-    response = llm_with_tools.invoke(messages)
+    if USE_PROMPT_CACHE_KEY:
+        # Keep this user's conversation on one cache shard; the whole history
+        # is a prefix of the next turn's input
+        response = llm_with_tools.invoke(
+            messages, prompt_cache_key=f"{SYSTEM_PROMPT_HASH}:{user_id}"
+        )
+    else:
+        response = llm_with_tools.invoke(messages)
 
     # Log final answer if no tool calls
-    if not hasattr(response, "tool_calls") or not response.tool_calls:
+    if not getattr(response, "tool_calls", None) and logger.isEnabledFor(logging.INFO):
         # Find original user query (latest HumanMessage)
         original_query = "Unknown"
         for msg in reversed(messages):
             if isinstance(msg, HumanMessage):
                 original_query = msg.content
                 break
-        logger.info(f"[FINAL ANSWER] Query: {original_query} | Answer: {response.content}")
+        logger.info("[FINAL ANSWER] Query: %s | Answer: %s", original_query, response.content)
 
-    return {"messages": [response]}
+    return {"messages": [*removals, response]}
 
 
 def should_continue(state: AgentState) -> Literal["tools", "end"]:
@@ -92,21 +228,22 @@ def should_continue(state: AgentState) -> Literal["tools", "end"]:
     Returns:
         "tools" if LLM wants to call tools, "end" otherwise
     """
-    last_message = state["messages"][-1]
+    tool_calls = getattr(state["messages"][-1], "tool_calls", None)
 
     # If LLM called tools -> route to tools node
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        logger.info("\n" + "="*70)
-        logger.info("[AGENT] Tool calls requested:")
-        for i, tool_call in enumerate(last_message.tool_calls, 1):
-            logger.info(f"  [{i}] Tool: {tool_call['name']}")
-            logger.info(f"      Args: {tool_call['args']}")
-            logger.info(f"      Call ID: {tool_call['id']}")
-        logger.info("="*70 + "\n")
+    if tool_calls:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", _RULE)
+            logger.info("[AGENT] Tool calls requested:")
+            for i, tool_call in enumerate(tool_calls, 1):
+                logger.info("  [%d] Tool: %s", i, tool_call['name'])
+                logger.info("      Args: %s", tool_call['args'])
+                logger.info("      Call ID: %s", tool_call['id'])
+            logger.info("%s\n", _RULE)
         return "tools"
 
     # Otherwise, finish
-    logger.info("\n" + "="*70)
+    logger.info("\n%s", _RULE)
     logger.info("[AGENT] No tool calls - finishing")
-    logger.info("="*70 + "\n")
+    logger.info("%s\n", _RULE)
     return "end"
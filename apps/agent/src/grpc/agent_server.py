@@ -6,36 +6,73 @@ This server:
 2. Receives requests with user_id + thread_id (no history needed)
 3. Uses thread_id to load conversation state from checkpointer
 4. Invokes agent graph with state management
-5. Returns response to API server (which stores in MongoDB for UI)
+5. Returns response to API server (which stores in MongoDB for UI),
+   either in one piece (Chat) or streamed as it is generated (ChatStream)
 """
 
 import asyncio
+import logging
+import queue
+import threading
 from concurrent import futures
 import grpc
+from langchain_core.messages import AIMessage, HumanMessage
 
 from src.config.llm_provider import create_llm
 from src.config.settings import settings
-from src.tools.mcp_loader import load_mcp_tools
+from src.tools.mcp_loader import close_mcp_session, load_mcp_tools
 from src.tools.credential_tool import get_user_credential
 from src.graph.agent_graph import create_agent_graph
 from src.graph.checkpointer import create_checkpointer
+from src.graph.nodes import SYSTEM_PROMPT_HASH, get_query_refiner
+from src.grpc.fast_path import match_fast_path
+from src.grpc.tool_calls import collect_turn_tool_calls
 from src.grpc.pb import agent_pb2, agent_pb2_grpc
 from src.utils.logger import logger
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows; fall back to the asyncio loop
+    uvloop = None
+
+# Log banner separator
+_RULE = "=" * 70
+
 
 class AgentServicer(agent_pb2_grpc.AgentServicer):
     """gRPC servicer for agent with LangGraph state management."""
 
-    def __init__(self, graph):
+    def __init__(self, graph_future: futures.Future, loop: asyncio.AbstractEventLoop):
         """
         Initialize agent servicer.
 
         Args:
-            graph: Compiled LangGraph agent with checkpointer
+            graph_future: Future resolving to the compiled LangGraph agent; the
+                          server accepts connections while it is still being built
+            loop: Long-lived event loop (running in a background thread) that
+                  all requests are scheduled on
         """
-        self.graph = graph
+        self._graph_future = graph_future
+        self.loop = loop
+        self.fast_path_hits = 0
         logger.info("[AGENT SERVER] AgentServicer initialized")
 
+    @property
+    def graph(self):
+        """Compiled graph (only read after _wait_until_ready() has returned)."""
+        return self._graph_future.result()
+
+    def _wait_until_ready(self):
+        """
+        Block the calling gRPC worker thread until agent init has finished.
+
+        Requests that arrive during startup queue here instead of being
+        refused; if init failed, its exception is raised.
+        """
+        if not self._graph_future.done():
+            logger.info("[AGENT SERVER] Request waiting for agent initialization...")
+        self._graph_future.result()
+
     def Chat(self, request, context):
         """
         Handle chat request (stateful with LangGraph checkpointer).
@@ -47,30 +84,151 @@ class AgentServicer(agent_pb2_grpc.AgentServicer):
         Returns:
             ChatResponse with agent's reply
         """
-        logger.info(f"\n{'='*70}")
-        logger.info(f"[AGENT SERVER] Received request:")
-        logger.info(f"  - User ID: {request.user_id}")
-        logger.info(f"  - Thread ID: {request.thread_id}")
-        logger.info(f"  - Message: {request.message[:100]}...")
-        logger.info(f"{'='*70}\n")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s", _RULE)
+            logger.info("[AGENT SERVER] Received request:")
+            logger.info("  - User ID: %s", request.user_id)
+            logger.info("  - Thread ID: %s", request.thread_id)
+            logger.info("  - Message: %s...", request.message[:100])
+            logger.info("%s\n", _RULE)
 
         try:
-            # Run async graph invocation in event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            response = loop.run_until_complete(
-                self._ainvoke_agent(request.message, request.user_id, request.thread_id)
-            )
-            loop.close()
+            self._wait_until_ready()
 
-            return response
+            # Schedule on the shared agent loop instead of creating a loop per request
+            future = asyncio.run_coroutine_threadsafe(
+                self._ainvoke_agent(request.message, request.user_id, request.thread_id),
+                self.loop
+            )
+            return future.result()
 
         except Exception as e:
-            logger.exception(f"[AGENT SERVER] Error during chat invocation")
+            logger.exception("[AGENT SERVER] Error during chat invocation")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Agent error: {str(e)}")
             return agent_pb2.ChatResponse(content=f"Xin lỗi, đã xảy ra lỗi: {str(e)}")
 
+    def ChatStream(self, request, context):
+        """
+        Handle streaming chat request.
+
+        Yields ChatChunk deltas as the LLM produces the answer; the last chunk
+        carries the full ChatResponse. The graph runs on the shared agent loop
+        and hands chunks to this gRPC worker thread through a queue.
+
+        Args:
+            request: ChatRequest with message, user_id, thread_id
+            context: gRPC context
+
+        Yields:
+            ChatChunk messages
+        """
+        logger.info("[AGENT SERVER] Received streaming request (thread: %s)", request.thread_id)
+
+        chunks = queue.SimpleQueue()
+        done = object()
+
+        async def produce():
+            try:
+                async for chunk in self._astream_agent(request.message, request.user_id, request.thread_id):
+                    chunks.put(chunk)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(done)
+
+        future = None
+        try:
+            self._wait_until_ready()
+            future = asyncio.run_coroutine_threadsafe(produce(), self.loop)
+
+            while (item := chunks.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        except Exception as e:
+            logger.exception("[AGENT SERVER] Error during streaming chat invocation")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Agent error: {str(e)}")
+
+        finally:
+            # Client went away mid-stream: stop the graph run
+            if future is not None and not future.done():
+                future.cancel()
+
+    async def _astream_agent(self, message: str, user_id: str, thread_id: str):
+        """
+        Stream agent graph output asynchronously.
+
+        Args:
+            message: User's message
+            user_id: User ID (for credential lookup)
+            thread_id: Thread ID (for state persistence)
+
+        Yields:
+            ChatChunk protobuf messages (text deltas, then the final response)
+        """
+        config = self._thread_config(thread_id)
+
+        canned = match_fast_path(message)
+        if canned is not None:
+            response = await self._reply_fast_path(message, canned, config)
+            yield agent_pb2.ChatChunk(delta=canned)
+            yield agent_pb2.ChatChunk(response=response)
+            return
+
+        final_state = None
+        async for mode, payload in self.graph.astream(
+            {
+                "messages": [("user", message)],
+                "user_id": user_id
+            },
+            config=config,
+            stream_mode=["messages", "values"],
+            durability=settings.checkpointer.DURABILITY
+        ):
+            if mode == "messages":
+                # Only text tokens produced by the LLM node (not tool outputs)
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") == "agent" and (delta := chunk.text):
+                    yield agent_pb2.ChatChunk(delta=delta)
+            else:
+                final_state = payload
+
+        yield agent_pb2.ChatChunk(response=self._build_response(final_state["messages"]))
+
+    @staticmethod
+    def _thread_config(thread_id: str) -> dict:
+        """Build config with thread_id for checkpointer."""
+        return {
+            "configurable": {"thread_id": thread_id},
+            "recursion_limit": 50  # Increased from default 25 to handle complex tool chains
+        }
+
+    @staticmethod
+    def _build_response(messages) -> agent_pb2.ChatResponse:
+        """Build the ChatResponse for a finished turn from the graph's messages."""
+        # Extract agent's response (last message)
+        # .text flattens list-of-blocks content (e.g. Gemini, reasoning models)
+        # into a plain string, so the proto field always gets a str
+        agent_message = messages[-1]
+        content = agent_message.text
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n[AGENT SERVER] Response sent:")
+            logger.info("  - Content length: %d chars", len(content))
+            logger.info("  - Preview: %s...", content[:200])
+
+        return agent_pb2.ChatResponse(
+            content=content,
+            tool_calls=[agent_pb2.ToolCall(**call) for call in collect_turn_tool_calls(messages)],
+            reasoning_steps=[],
+            sources=[],
+            tokens_used=0,  # TODO: Add token counting
+            latency_ms=0
+        )
+
     async def _ainvoke_agent(self, message: str, user_id: str, thread_id: str):
         """
         Invoke agent graph asynchronously.
@@ -83,11 +241,11 @@ class AgentServicer(agent_pb2_grpc.AgentServicer):
         Returns:
             ChatResponse protobuf message
         """
-        # Build config with thread_id for checkpointer
-        config = {
-            "configurable": {"thread_id": thread_id},
-            "recursion_limit": 50  # Increased from default 25 to handle complex tool chains
-        }
+        config = self._thread_config(thread_id)
+
+        canned = match_fast_path(message)
+        if canned is not None:
+            return await self._reply_fast_path(message, canned, config)
 
         # Invoke graph (will automatically load state from checkpointer if exists)
         result = await self.graph.ainvoke(
@@ -95,24 +253,36 @@ class AgentServicer(agent_pb2_grpc.AgentServicer):
                 "messages": [("user", message)],
                 "user_id": user_id
             },
-            config=config
+            config=config,
+            # Write checkpoints off the critical path of each super-step
+            durability=settings.checkpointer.DURABILITY
         )
 
-        # Extract agent's response (last message)
-        agent_message = result["messages"][-1]
-        content = agent_message.content
+        return self._build_response(result["messages"])
 
-        logger.info(f"\n[AGENT SERVER] Response sent:")
-        logger.info(f"  - Content length: {len(content)} chars")
-        logger.info(f"  - Preview: {content[:200]}...")
+    async def _reply_fast_path(self, message: str, content: str, config: dict):
+        """
+        Answer a trivial turn without invoking the LLM.
+
+        The exchange is still written to the thread's checkpoint so later turns
+        see it in their history.
+        """
+        self.fast_path_hits += 1
+        logger.info("[AGENT SERVER] Fast-path reply (total: %d)", self.fast_path_hits)
+
+        if self.graph.checkpointer is not None:
+            await self.graph.aupdate_state(
+                config,
+                {"messages": [HumanMessage(content=message), AIMessage(content=content)]},
+                as_node="agent"
+            )
 
-        # Build ChatResponse
         return agent_pb2.ChatResponse(
             content=content,
-            tool_calls=[],  # TODO: Extract tool calls from messages if needed
+            tool_calls=[],
             reasoning_steps=[],
             sources=[],
-            tokens_used=0,  # TODO: Add token counting
+            tokens_used=0,
             latency_ms=0
         )
 
@@ -128,23 +298,49 @@ async def _initialize_agent():
     logger.info("Initializing LangGraph Agent Server")
     logger.info("="*70 + "\n")
 
-    # Step 1: Create LLM
-    logger.info("[1/5] Creating LLM...")
-    llm = create_llm(
-        provider=settings.llm.PROVIDER,
-        model=settings.llm.MODEL
-    )
-    logger.info(f"✅ LLM created: {settings.llm.PROVIDER}/{settings.llm.MODEL}\n")
+    # Steps 1, 2 and 4 are independent (LLM client, MCP server round-trip,
+    # checkpointer), so run them concurrently; sync factories go to threads.
+    async def _create_llm():
+        logger.info("[1/5] Creating LLM...")
+        llm = await asyncio.to_thread(
+            create_llm,
+            provider=settings.llm.PROVIDER,
+            model=settings.llm.MODEL
+        )
+        logger.info(f"✅ LLM created: {settings.llm.PROVIDER}/{settings.llm.MODEL}\n")
+        return llm
 
-    # Step 2: Load MCP tools
-    logger.info("[2/5] Loading MCP tools...")
-    try:
-        mcp_tools = await load_mcp_tools()
-        logger.info(f"✅ MCP tools loaded: {len(mcp_tools)} tools\n")
-    except Exception as e:
-        logger.warning(f"⚠️  MCP tools failed to load: {e}")
-        logger.warning("⚠️  Continuing with native tools only...\n")
-        mcp_tools = []
+    async def _load_mcp_tools():
+        logger.info("[2/5] Loading MCP tools...")
+        try:
+            mcp_tools = await load_mcp_tools()
+            logger.info(f"✅ MCP tools loaded: {len(mcp_tools)} tools\n")
+            return mcp_tools
+        except Exception as e:
+            logger.warning(f"⚠️  MCP tools failed to load: {e}")
+            logger.warning("⚠️  Continuing with native tools only...\n")
+            return []
+
+    async def _create_checkpointer():
+        logger.info("[4/5] Creating checkpointer...")
+        try:
+            checkpointer = await asyncio.to_thread(
+                create_checkpointer, backend=settings.checkpointer.BACKEND
+            )
+            logger.info("✅ Checkpointer created\n")
+            return checkpointer
+        except Exception as e:
+            logger.warning(f"⚠️  Checkpointer failed: {e}")
+            logger.warning("⚠️  Running without persistence...\n")
+            return None
+
+    llm, mcp_tools, checkpointer, _ = await asyncio.gather(
+        _create_llm(),
+        _load_mcp_tools(),
+        _create_checkpointer(),
+        # Load the acronym dictionary now instead of on the first request
+        asyncio.to_thread(get_query_refiner),
+    )
 
     # Step 3: Add native tools
     logger.info("[3/5] Adding native tools...")
@@ -154,16 +350,6 @@ async def _initialize_agent():
     logger.info(f"   - MCP tools: {len(mcp_tools)}")
     logger.info(f"   - Native tools: {len(native_tools)}\n")
 
-    # Step 4: Create checkpointer
-    logger.info("[4/5] Creating checkpointer...")
-    try:
-        checkpointer = create_checkpointer(backend=settings.checkpointer.BACKEND)
-        logger.info("✅ Checkpointer created\n")
-    except Exception as e:
-        logger.warning(f"⚠️  Checkpointer failed: {e}")
-        logger.warning("⚠️  Running without persistence...\n")
-        checkpointer = None
-
     # Step 5: Create agent graph
     logger.info("[5/5] Creating agent graph...")
     graph = create_agent_graph(
@@ -172,7 +358,8 @@ async def _initialize_agent():
         checkpointer=checkpointer,
         tool_timeout=120  # 2 minutes for MCP tools (handles cold start)
     )
-    logger.info("✅ Agent graph created\n")
+    logger.info("✅ Agent graph created")
+    logger.info(f"   - System prompt hash: {SYSTEM_PROMPT_HASH}\n")
 
     logger.info("="*70)
     logger.info("✅ Agent server initialization complete!")
@@ -183,16 +370,22 @@ async def _initialize_agent():
 
 def serve():
     """Start gRPC server."""
-    # Initialize agent (runs async initialization)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    graph = loop.run_until_complete(_initialize_agent())
-    loop.close()
+    # One event loop for the whole process, running in a background thread.
+    # gRPC worker threads submit coroutines to it, so async resources created
+    # at startup stay bound to a live loop.
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, name="agent-event-loop", daemon=True)
+    loop_thread.start()
+    logger.info(f"[AGENT SERVER] Event loop: {type(loop).__module__}.{type(loop).__name__}")
+
+    # Initialize agent in the background (runs async initialization); the
+    # port is bound right away and early requests wait for this future
+    init_future = asyncio.run_coroutine_threadsafe(_initialize_agent(), loop)
 
     # Create gRPC server
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
     agent_pb2_grpc.add_AgentServicer_to_server(
-        AgentServicer(graph),
+        AgentServicer(init_future, loop),
         server
     )
 
@@ -205,10 +398,22 @@ def serve():
     logger.info(f"[AGENT SERVER] ✅ Server running on port {port}\n")
 
     try:
+        # Fail fast (as before) if the agent cannot be built
+        init_future.result()
         server.wait_for_termination()
     except KeyboardInterrupt:
         logger.info("\n[AGENT SERVER] Shutting down...")
         server.stop(0)
+    except Exception:
+        logger.exception("[AGENT SERVER] Agent initialization failed")
+        server.stop(0)
+        raise
+    finally:
+        try:
+            asyncio.run_coroutine_threadsafe(close_mcp_session(), loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"[AGENT SERVER] Failed to close MCP session: {e}")
+        loop.call_soon_threadsafe(loop.stop)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+"""Canned replies for trivial turns that need no LLM call."""
+
+import re
+
+# Trivial turns answered without an LLM call (the system prompt already says
+# greetings and "who are you" need no tools). Patterns match the WHOLE message,
+# so "chào bạn, cho hỏi học phí" still goes through the agent.
+_TRAILER = r"\s*(?:bạn|nhé|nha|ạ|bot)?\s*[!.?~]*\s*$"
+FAST_PATH_REPLIES = (
+    (
+        re.compile(r"^\s*(?:xin chào|chào|hello|hi|hey)" + _TRAILER, re.IGNORECASE),
+        "Xin chào! Mình là trợ lý hỗ trợ sinh viên Trường Đại học Công nghệ Thông tin - ĐHQG TP.HCM. "
+        "Bạn cần hỏi gì về quy chế, chương trình đào tạo, điểm số hay thời khóa biểu?",
+    ),
+    (
+        re.compile(r"^\s*(?:cảm ơn|cám ơn|thanks|thank you|tks)" + _TRAILER, re.IGNORECASE),
+        "Không có gì! Nếu cần hỗ trợ thêm, bạn cứ hỏi nhé.",
+    ),
+    (
+        re.compile(r"^\s*(?:tạm biệt|bye|goodbye)" + _TRAILER, re.IGNORECASE),
+        "Tạm biệt! Chúc bạn học tập tốt.",
+    ),
+    (
+        re.compile(r"^\s*(?:bạn là ai|bạn là gì|bạn giúp được gì|bạn làm được gì)" + _TRAILER, re.IGNORECASE),
+        "Mình là trợ lý hỗ trợ sinh viên Trường Đại học Công nghệ Thông tin - ĐHQG TP.HCM. "
+        "Mình có thể tra cứu quy chế, quy định, chương trình đào tạo các ngành, "
+        "và xem điểm số, thời khóa biểu của bạn.",
+    ),
+)
+
+
+def match_fast_path(message: str):
+    """Return a canned reply if the message is a trivial turn, else None."""
+    for pattern, reply in FAST_PATH_REPLIES:
+        if pattern.match(message):
+            return reply
+    return None
@@ -53,3 +53,11 @@ class ChatResponse(_message.Message):
     tokens_used: int
     latency_ms: int
     def __init__(self, content: _Optional[str] = ..., tool_calls: _Optional[_Iterable[_Union[ToolCall, _Mapping]]] = ..., reasoning_steps: _Optional[_Iterable[str]] = ..., sources: _Optional[_Iterable[_Union[Source, _Mapping]]] = ..., tokens_used: _Optional[int] = ..., latency_ms: _Optional[int] = ...) -> None: ...
+
+class ChatChunk(_message.Message):
+    __slots__ = ("delta", "response")
+    DELTA_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    delta: str
+    response: ChatResponse
+    def __init__(self, delta: _Optional[str] = ..., response: _Optional[_Union[ChatResponse, _Mapping]] = ...) -> None: ...
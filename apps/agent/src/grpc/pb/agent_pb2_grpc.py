@@ -40,6 +40,11 @@ class AgentStub(object):
                 request_serializer=agent__pb2.ChatRequest.SerializeToString,
                 response_deserializer=agent__pb2.ChatResponse.FromString,
                 _registered_method=True)
+        self.ChatStream = channel.unary_stream(
+                '/agent.Agent/ChatStream',
+                request_serializer=agent__pb2.ChatRequest.SerializeToString,
+                response_deserializer=agent__pb2.ChatChunk.FromString,
+                _registered_method=True)
 
 
 class AgentServicer(object):
@@ -55,6 +60,13 @@ class AgentServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ChatStream(self, request, context):
+        """Streaming chat: trả về từng đoạn text khi LLM sinh ra, chunk cuối chứa ChatResponse đầy đủ
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AgentServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -63,6 +75,11 @@ def add_AgentServicer_to_server(servicer, server):
                     request_deserializer=agent__pb2.ChatRequest.FromString,
                     response_serializer=agent__pb2.ChatResponse.SerializeToString,
             ),
+            'ChatStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ChatStream,
+                    request_deserializer=agent__pb2.ChatRequest.FromString,
+                    response_serializer=agent__pb2.ChatChunk.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'agent.Agent', rpc_method_handlers)
@@ -101,3 +118,30 @@ class Agent(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ChatStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/agent.Agent/ChatStream',
+            agent__pb2.ChatRequest.SerializeToString,
+            agent__pb2.ChatChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
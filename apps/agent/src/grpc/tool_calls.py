@@ -0,0 +1,84 @@
+"""
+Tool-call metadata returned in ChatResponse.tool_calls.
+
+The gateway stores these in MongoDB next to the chat message, so nothing
+secret may go out: the DAA cookie comes back from get_user_credential and
+is then passed as the `cookie` argument of get_grades / get_schedule.
+"""
+
+import json
+import re
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+REDACTED = "[redacted]"
+
+# Tools whose output IS a credential: only the call itself is reported
+CREDENTIAL_TOOLS = frozenset({"get_user_credential"})
+
+# Argument names whose values are never echoed back
+_SECRET_ARG_RE = re.compile(r"cookie|password|passwd|secret|token|api_?key|credential", re.IGNORECASE)
+
+# Max chars of tool output kept per call (retrieval results can be tens of KB)
+TOOL_OUTPUT_MAX_CHARS = 2000
+
+
+def _redact(text: str, secrets: set) -> str:
+    """Replace every known secret value inside `text`."""
+    for secret in secrets:
+        text = text.replace(secret, REDACTED)
+    return text
+
+
+def collect_turn_tool_calls(messages) -> list[dict]:
+    """
+    Collect the tool calls made during the latest turn, with secrets removed.
+
+    Walks back from the end of the history only as far as the latest user
+    message, so the cost depends on the turn's length, not the thread's.
+
+    Returns:
+        One dict per call (tool_name, args_json, output), in execution order.
+        Secret-looking arguments and credential tool outputs are replaced by
+        REDACTED, wherever they show up, and outputs are capped at
+        TOOL_OUTPUT_MAX_CHARS.
+    """
+    outputs = {}
+    tool_calls = []
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            break
+        if isinstance(message, ToolMessage):
+            outputs[message.tool_call_id] = message.text
+        elif isinstance(message, AIMessage) and message.tool_calls:
+            # Reversed walk: prepend so calls come out in execution order
+            tool_calls[:0] = message.tool_calls
+
+    # Secret values seen this turn, so copies of them are caught anywhere
+    secrets = set()
+    for call in tool_calls:
+        if call["name"] in CREDENTIAL_TOOLS and outputs.get(call["id"]):
+            secrets.add(outputs[call["id"]])
+        for name, value in call.get("args", {}).items():
+            if _SECRET_ARG_RE.search(name) and isinstance(value, str) and value:
+                secrets.add(value)
+
+    collected = []
+    for call in tool_calls:
+        args = {
+            name: REDACTED if _SECRET_ARG_RE.search(name) else value
+            for name, value in call.get("args", {}).items()
+        }
+        if call["name"] in CREDENTIAL_TOOLS:
+            output = REDACTED
+        else:
+            output = outputs.get(call["id"], "")
+            if len(output) > TOOL_OUTPUT_MAX_CHARS:
+                output = output[:TOOL_OUTPUT_MAX_CHARS] + "…"
+
+        collected.append({
+            "tool_name": call["name"],
+            "args_json": _redact(json.dumps(args, ensure_ascii=False), secrets),
+            "output": _redact(output, secrets),
+        })
+    return collected
@@ -4,10 +4,18 @@ Query refinement for expanding acronyms before retrieval.
 
 import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+# Candidate acronym tokens: 2+ letters (ASCII + Vietnamese), compiled once at import
+_ACRONYM_CANDIDATE_RE = re.compile(r'\b([A-ZĐÂĂÊÔƠƯa-zđâăêôơư]{2,})\b')
+
+# Max distinct (query, partial) results memoized per QueryRefiner
+REFINE_CACHE_SIZE = 10_000
+
+
 class QueryRefiner:
     """
     Expands known acronyms in user queries to improve retrieval.
@@ -38,6 +46,27 @@ class QueryRefiner:
         with open(acronym_path, 'r', encoding='utf-8') as f:
             self.acronyms = yaml.safe_load(f) or {}
 
+        # refine() is pure w.r.t. the (static) acronym dictionary and students
+        # repeat the same FAQ-style questions a lot, so memoize it per instance
+        self.refine = lru_cache(maxsize=REFINE_CACHE_SIZE)(self.refine)
+
+    def _find_acronyms(self, query: str) -> list[str]:
+        """
+        Find likely acronyms in query, in order of appearance.
+
+        A candidate (2+ letters) counts as an acronym if it is:
+        1. All uppercase (UIT, CNTT, TKB)
+        2. All lowercase, 2-5 chars AND in the dictionary (case-insensitive)
+        """
+        found_acronyms = []
+        for word in _ACRONYM_CANDIDATE_RE.findall(query):
+            if word.isupper():
+                found_acronyms.append(word)
+            elif word.islower() and 2 <= len(word) <= 5:
+                if word.upper() in self.acronyms:
+                    found_acronyms.append(word)
+        return found_acronyms
+
     def refine(self, query: str, partial: bool = True) -> Optional[str]:
         """
         Expand known acronyms in query (case-insensitive).
@@ -51,63 +80,41 @@ class QueryRefiner:
             - Expanded query (with known acronyms expanded)
             - None if partial=False and contains unknown acronyms
         """
-        # Find all potential acronyms (2+ letters, case-insensitive)
-        # Pattern: word boundary + letters (uppercase or lowercase)
-        acronym_pattern = r'\b([A-ZĐÂĂÊÔƠƯa-zđâăêôơư]{2,})\b'
-        found_words = re.findall(acronym_pattern, query)
-
-        # Filter: only words that are likely acronyms
-        found_acronyms = []
-        for word in found_words:
-            # Check if it's likely an acronym:
-            # 1. All uppercase (UIT, CNTT, TKB)
-            if word.isupper():
-                found_acronyms.append(word)
-            # 2. All lowercase 2-5 chars AND exists in dictionary (case-insensitive)
-            elif word.islower() and 2 <= len(word) <= 5:
-                if word.upper() in self.acronyms:
-                    found_acronyms.append(word)
+        found_acronyms = self._find_acronyms(query)
 
         if not found_acronyms:
             # No acronyms → return original
             return query
 
-        # Separate known vs unknown acronyms
-        known_acronyms = []
-        unknown_acronyms = []
+        # Known acronyms: uppercase key -> spelling first used in the query.
+        # Skip empty meanings (TODO entries in YAML)
+        known = {}
+        has_unknown = False
         for acr in found_acronyms:
             acr_upper = acr.upper()
-            # Skip empty meanings (TODO entries in YAML)
-            if acr_upper in self.acronyms and self.acronyms[acr_upper]:
-                known_acronyms.append(acr)
+            if self.acronyms.get(acr_upper):
+                known.setdefault(acr_upper, acr)
             else:
-                unknown_acronyms.append(acr)
+                has_unknown = True
 
         # If has unknown and partial=False → return None
-        if unknown_acronyms and not partial:
+        if has_unknown and not partial:
             return None
 
-        # Expand known acronyms (partial mode)
-        expanded_query = query
-        expanded_set = set()
-
-        for acronym in known_acronyms:
-            acr_upper = acronym.upper()
-
-            if acr_upper in expanded_set:
-                continue
-
-            full_form = self.acronyms[acr_upper]
-
-            # Pattern: replace "acronym" with "acronym (full_form)"
-            pattern = r'\b' + re.escape(acronym) + r'\b'
-            replacement = f"{acronym} ({full_form})"
+        if not known:
+            return query
 
-            # Replace all occurrences
-            expanded_query = re.sub(pattern, replacement, expanded_query, flags=re.IGNORECASE)
-            expanded_set.add(acr_upper)
+        def expand(match: re.Match) -> str:
+            # "acronym" -> "acronym (full_form)", any casing of a found acronym
+            word = match.group(0)
+            acr_upper = word.upper()
+            spelling = known.get(acr_upper)
+            if spelling is None:
+                return word
+            return f"{spelling} ({self.acronyms[acr_upper]})"
 
-        return expanded_query
+        # Expand all occurrences in a single pass over the query
+        return _ACRONYM_CANDIDATE_RE.sub(expand, query)
 
     def get_unknown_acronyms(self, query: str) -> list[str]:
         """
@@ -121,19 +128,6 @@ class QueryRefiner:
         Returns:
             List of unknown acronyms found in query
         """
-        # Same logic as refine() to find acronyms
-        acronym_pattern = r'\b([A-ZĐÂĂÊÔƠƯa-zđâăêôơư]{2,})\b'
-        found_words = re.findall(acronym_pattern, query)
-
-        # Filter likely acronyms (same logic as refine())
-        found_acronyms = []
-        for word in found_words:
-            if word.isupper():
-                found_acronyms.append(word)
-            elif word.islower() and 2 <= len(word) <= 5:
-                if word.upper() in self.acronyms:
-                    found_acronyms.append(word)
-
         # Return unique unknown acronyms (case-insensitive check)
-        unknown = [acr for acr in found_acronyms if acr.upper() not in self.acronyms]
+        unknown = [acr for acr in self._find_acronyms(query) if acr.upper() not in self.acronyms]
         return list(set(unknown))  # Remove duplicates
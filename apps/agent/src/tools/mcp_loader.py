@@ -2,21 +2,151 @@
 Load MCP tools from retrieval server using langchain-mcp-adapters.
 """
 
+import asyncio
+
+import anyio
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools as load_session_tools
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 from src.config.settings import settings
 from src.utils.logger import logger
 
 
+# Long-lived MCP session (when settings.mcp.PERSISTENT_SESSION is on)
+_persistent_session = None
+
+# Raised by the session's memory streams once its transport has shut down
+_TRANSPORT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
+
+def _is_session_dropped(error: Exception) -> bool:
+    """True if a tool call failed because the session died, not the tool itself."""
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, _TRANSPORT_ERRORS)
+
+
+async def _hold_session(client: MultiServerMCPClient, ready: asyncio.Future, stop: asyncio.Event):
+    """
+    Open one MCP session, publish it, and keep it open until stopped.
+
+    The session's transport uses anyio task groups, which must be entered and
+    exited by the same task, so the whole lifetime lives in this coroutine.
+    """
+    try:
+        async with client.session("uit") as session:
+            ready.set_result(session)
+            await stop.wait()
+    except Exception as e:
+        if not ready.done():
+            ready.set_exception(e)
+        else:
+            logger.error(f"[MCP LOADER] Persistent MCP session closed with error: {e}")
+    finally:
+        # Also covers the transport cancelling this task before the handshake
+        if not ready.done():
+            ready.set_exception(ConnectionError("MCP session closed before it was ready"))
+
+
+class _PersistentSession:
+    """
+    Stand-in for one long-lived MCP session that reopens it when it drops.
+
+    Tools are bound to this object instead of the raw session, so after a
+    reconnect (MCP server restart, idle connection dropped by a proxy) they
+    keep working without being reloaded. A tool call that fails because the
+    session dropped is retried once on a fresh session (the MCP tools are
+    read-only, so a retry is safe); any other error is the tool's own and is
+    raised as-is.
+    """
+
+    def __init__(self, client: MultiServerMCPClient):
+        self._client = client
+        self._session = None
+        self._task = None
+        self._stop = None
+        self._lock = asyncio.Lock()
+
+    async def open(self):
+        """Start the session task and wait for the session to be ready."""
+        ready = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(_hold_session(self._client, ready, self._stop))
+        try:
+            self._session = await ready
+        except Exception:
+            self._task = None
+            self._stop = None
+            raise
+
+    async def close(self):
+        """Stop the session task (no-op if it was never opened)."""
+        if self._task is None:
+            return
+
+        self._stop.set()
+        # wait() instead of await: the task may already have ended cancelled
+        await asyncio.wait({self._task})
+        self._task = None
+        self._stop = None
+        self._session = None
+
+    async def _reconnect(self, stale):
+        async with self._lock:
+            if self._session is not stale:
+                # Another tool call already reconnected
+                return
+            logger.warning("[MCP LOADER] Persistent MCP session dropped, reconnecting")
+            await self.close()
+            await self.open()
+            logger.info("[MCP LOADER] Persistent MCP session reconnected")
+
+    async def call_tool(self, *args, **kwargs):
+        session = self._session
+        if session is not None and self._task is not None and not self._task.done():
+            try:
+                return await session.call_tool(*args, **kwargs)
+            except Exception as e:
+                if not _is_session_dropped(e):
+                    raise
+                logger.warning(f"[MCP LOADER] Tool call failed on dropped session: {e!r}")
+
+        await self._reconnect(session)
+        return await self._session.call_tool(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # list_tools() etc. go straight to the current session
+        return getattr(self._session, name)
+
+
+async def close_mcp_session():
+    """Close the persistent MCP session, if one was opened."""
+    global _persistent_session
+    if _persistent_session is None:
+        return
+
+    await _persistent_session.close()
+    _persistent_session = None
+    logger.info("[MCP LOADER] Persistent MCP session closed")
+
+
 async def load_mcp_tools():
     """
     Load MCP tools from retrieval server.
 
+    With settings.mcp.PERSISTENT_SESSION enabled, the tools share one MCP
+    session (one HTTP connection + initialize handshake) that is reopened if it
+    drops; otherwise every tool call opens its own session.
+
     Returns:
         List of LangChain tools loaded from MCP server
 
     Raises:
         Exception: If MCP server is not reachable
     """
+    global _persistent_session
+
     # Get MCP server URL from settings (supports both local and Docker)
     mcp_url = settings.mcp.SERVER_URL
 
@@ -34,8 +164,18 @@ async def load_mcp_tools():
     try:
         logger.info(f"[MCP LOADER] Connecting to MCP server at {mcp_url}")
 
-        # Get tools from server
-        tools = await client.get_tools()
+        if settings.mcp.PERSISTENT_SESSION:
+            session = _PersistentSession(client)
+            await session.open()
+            try:
+                tools = await load_session_tools(session)
+            except Exception:
+                await session.close()
+                raise
+            _persistent_session = session
+        else:
+            # Get tools from server
+            tools = await client.get_tools()
 
         logger.info(f"[MCP LOADER] ✅ Loaded {len(tools)} tools from MCP server:")
         for tool in tools:
@@ -1,7 +1,9 @@
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 def setup_logger(name: str, log_file: str = "agent.log", level=logging.INFO):
     """
@@ -34,12 +36,18 @@ def setup_logger(name: str, log_file: str = "agent.log", level=logging.INFO):
         log_path, maxBytes=10*1024*1024, backupCount=5, encoding='utf-8' # 10MB per file
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # Callers (the agent event loop, gRPC worker threads) only enqueue records;
+    # file and console I/O happens on the listener thread.
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    atexit.register(listener.stop)
 
     return logger
 
@@ -0,0 +1,157 @@
+"""
+Put the app root on sys.path so tests import `src.` the way main.py does.
+
+The unit tests exercise our own logic, not the third-party stack around it.
+When a heavy dependency is not installed, a minimal fake stands in for the
+parts of its API that `src` touches, so the suite runs in a plain environment.
+Installed packages are always used as-is.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+_FAKED = set()
+
+
+def _fake_module(name: str, **attrs):
+    """Register a fake `name` (and its parent packages) unless it is installed."""
+    top = name.split(".")[0]
+    if top not in _FAKED:
+        if importlib.util.find_spec(top) is not None:
+            return
+        _FAKED.add(top)
+    parts = name.split(".")
+    for i in range(1, len(parts) + 1):
+        sys.modules.setdefault(".".join(parts[:i]), types.ModuleType(".".join(parts[:i])))
+    for i in range(1, len(parts)):
+        setattr(sys.modules[".".join(parts[:i])], parts[i], sys.modules[".".join(parts[: i + 1])])
+    for key, value in attrs.items():
+        setattr(sys.modules[name], key, value)
+
+
+class _Placeholder:
+    """Stand-in for classes that are imported but never used by the tests."""
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+# --- dotenv / LLM providers ---------------------------------------------------
+
+_fake_module("dotenv", load_dotenv=lambda *args, **kwargs: False)
+_fake_module("langchain_openai", ChatOpenAI=_Placeholder)
+_fake_module("langchain_google_genai", ChatGoogleGenerativeAI=_Placeholder)
+
+
+# --- langchain_core messages -------------------------------------------------
+
+class _FakeBaseMessage:
+    type = "base"
+
+    def __init__(self, content="", id=None, **kwargs):
+        self.content = content
+        self.id = id
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    @property
+    def text(self) -> str:
+        if isinstance(self.content, str):
+            return self.content
+        return "".join(
+            block if isinstance(block, str) else block.get("text", "")
+            for block in self.content
+        )
+
+    def model_copy(self, update=None):
+        copy = type(self).__new__(type(self))
+        copy.__dict__.update(self.__dict__, **(update or {}))
+        return copy
+
+
+class _FakeAIMessage(_FakeBaseMessage):
+    type = "ai"
+
+    def __init__(self, content="", tool_calls=None, **kwargs):
+        super().__init__(content, tool_calls=tool_calls or [], **kwargs)
+
+
+class _FakeToolMessage(_FakeBaseMessage):
+    type = "tool"
+
+    def __init__(self, content="", tool_call_id=None, **kwargs):
+        super().__init__(content, tool_call_id=tool_call_id, **kwargs)
+
+
+_fake_module(
+    "langchain_core.messages",
+    BaseMessage=_FakeBaseMessage,
+    AIMessage=_FakeAIMessage,
+    HumanMessage=type("HumanMessage", (_FakeBaseMessage,), {"type": "human"}),
+    SystemMessage=type("SystemMessage", (_FakeBaseMessage,), {"type": "system"}),
+    ToolMessage=_FakeToolMessage,
+    RemoveMessage=type("RemoveMessage", (_FakeBaseMessage,), {"type": "remove"}),
+)
+
+
+# --- MCP client ---------------------------------------------------------------
+
+class _FakeAnyioError(Exception):
+    pass
+
+
+class _FakeErrorData:
+    def __init__(self, code: int, message: str, data=None):
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class _FakeMcpError(Exception):
+    def __init__(self, error):
+        super().__init__(error.message)
+        self.error = error
+
+
+_fake_module(
+    "anyio",
+    ClosedResourceError=type("ClosedResourceError", (_FakeAnyioError,), {}),
+    BrokenResourceError=type("BrokenResourceError", (_FakeAnyioError,), {}),
+    EndOfStream=type("EndOfStream", (_FakeAnyioError,), {}),
+)
+_fake_module("mcp.shared.exceptions", McpError=_FakeMcpError)
+_fake_module("mcp.types", CONNECTION_CLOSED=-32000, ErrorData=_FakeErrorData)
+_fake_module("langchain_mcp_adapters.client", MultiServerMCPClient=_Placeholder)
+_fake_module("langchain_mcp_adapters.tools", load_mcp_tools=None)
+
+
+# --- langgraph ----------------------------------------------------------------
+
+class _FakeMemorySaver:
+    """In-memory checkpoint store with the MemorySaver methods we override."""
+
+    def __init__(self, **kwargs):
+        self.storage = {}
+
+    def get_tuple(self, config):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint = self.storage.get(thread_id)
+        return None if checkpoint is None else (config, checkpoint)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        self.storage[config["configurable"]["thread_id"]] = checkpoint
+        return config
+
+    def delete_thread(self, thread_id):
+        self.storage.pop(thread_id, None)
+
+
+_fake_module("langgraph.graph.message", add_messages=lambda left, right: left + right)
+_fake_module("langgraph.checkpoint.memory", MemorySaver=_FakeMemorySaver)
+_fake_module("langgraph.checkpoint.base", empty_checkpoint=lambda: {"channel_values": {}})
@@ -0,0 +1,59 @@
+"""
+BoundedMemorySaver: least recently used threads are deleted past the cap.
+"""
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.graph.checkpointer import BoundedMemorySaver
+
+
+def _config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _put(saver: BoundedMemorySaver, thread_id: str):
+    saver.put(_config(thread_id), empty_checkpoint(), {}, {})
+
+
+def test_put_evicts_least_recently_used_thread():
+    saver = BoundedMemorySaver(max_threads=2)
+    _put(saver, "t1")
+    _put(saver, "t2")
+    _put(saver, "t3")
+
+    assert saver.get_tuple(_config("t1")) is None
+    assert saver.get_tuple(_config("t2")) is not None
+    assert saver.get_tuple(_config("t3")) is not None
+
+
+def test_get_tuple_counts_as_use():
+    saver = BoundedMemorySaver(max_threads=2)
+    _put(saver, "t1")
+    _put(saver, "t2")
+
+    # Reading t1 makes t2 the least recently used thread
+    assert saver.get_tuple(_config("t1")) is not None
+    _put(saver, "t3")
+
+    assert saver.get_tuple(_config("t2")) is None
+    assert saver.get_tuple(_config("t1")) is not None
+
+
+def test_get_tuple_of_unknown_thread_does_not_evict():
+    saver = BoundedMemorySaver(max_threads=1)
+    _put(saver, "t1")
+
+    assert saver.get_tuple(_config("missing")) is None
+    assert saver.get_tuple(_config("t1")) is not None
+
+
+def test_delete_thread_forgets_lru_entry():
+    saver = BoundedMemorySaver(max_threads=2)
+    _put(saver, "t1")
+    _put(saver, "t2")
+    saver.delete_thread("t1")
+    _put(saver, "t3")
+
+    # t1's slot was freed, so nothing else had to go
+    assert saver.get_tuple(_config("t2")) is not None
+    assert saver.get_tuple(_config("t3")) is not None
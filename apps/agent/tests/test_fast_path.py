@@ -0,0 +1,45 @@
+"""
+match_fast_path: canned replies only for messages that are nothing but a
+greeting / thanks / goodbye / "who are you".
+"""
+
+import pytest
+
+from src.grpc.fast_path import FAST_PATH_REPLIES, match_fast_path
+
+GREETING, THANKS, GOODBYE, WHO_ARE_YOU = (reply for _, reply in FAST_PATH_REPLIES)
+
+
+@pytest.mark.parametrize(
+    "message, reply",
+    [
+        ("chào", GREETING),
+        ("Xin chào bạn!", GREETING),
+        ("  hello bot  ", GREETING),
+        ("HI!!", GREETING),
+        ("cảm ơn nhé", THANKS),
+        ("Cám ơn ạ.", THANKS),
+        ("thank you", THANKS),
+        ("tạm biệt", GOODBYE),
+        ("bye~", GOODBYE),
+        ("bạn là ai?", WHO_ARE_YOU),
+        ("Bạn làm được gì", WHO_ARE_YOU),
+    ],
+)
+def test_trivial_messages_get_canned_reply(message, reply):
+    assert match_fast_path(message) == reply
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "chào bạn, cho hỏi học phí năm 2025",
+        "cảm ơn, vậy điều kiện tốt nghiệp là gì?",
+        "hiện tại mình học ngành gì",
+        "history của quy chế",
+        "bạn là ai mà biết điểm của mình",
+        "",
+    ],
+)
+def test_real_questions_go_to_agent(message):
+    assert match_fast_path(message) is None
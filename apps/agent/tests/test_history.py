@@ -0,0 +1,149 @@
+"""
+History handling in the agent node: turn windowing, trimming of stale tool
+outputs and RemoveMessage pruning of turns that fell out of the window.
+"""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, SystemMessage, ToolMessage
+
+from src.graph import nodes
+
+
+def _turn(n: int, tool_output: str = "kết quả") -> list:
+    """One user turn: question, tool call, tool output, answer."""
+    return [
+        HumanMessage(content=f"câu hỏi {n}", id=f"h{n}"),
+        AIMessage(
+            content="",
+            id=f"a{n}",
+            tool_calls=[{"name": "retrieve_regulation", "args": {"query": f"q{n}"}, "id": f"call{n}"}],
+        ),
+        ToolMessage(content=tool_output, tool_call_id=f"call{n}", id=f"t{n}"),
+        AIMessage(content=f"trả lời {n}", id=f"r{n}"),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# _window_history
+# ---------------------------------------------------------------------------
+
+def test_window_history_keeps_last_turns():
+    messages = _turn(1) + _turn(2) + _turn(3)
+
+    windowed = nodes._window_history(messages, max_turns=2)
+
+    assert windowed == messages[4:]
+    assert isinstance(windowed[0], HumanMessage)
+
+
+def test_window_history_returns_short_history_unchanged():
+    messages = _turn(1)
+
+    assert nodes._window_history(messages, max_turns=2) is messages
+
+
+# ---------------------------------------------------------------------------
+# _trim_stale_tool_outputs
+# ---------------------------------------------------------------------------
+
+def test_trim_cuts_earlier_turns_only():
+    messages = _turn(1, "x" * 50) + _turn(2, "y" * 50)
+
+    nodes._trim_stale_tool_outputs(messages, limit=10)
+
+    assert messages[2].content == "x" * 10 + nodes.STALE_TOOL_OUTPUT_MARKER
+    assert messages[2].tool_call_id == "call1"
+    # Current turn untouched
+    assert messages[6].content == "y" * 50
+
+
+def test_trim_keeps_short_outputs():
+    messages = _turn(1, "ngắn") + _turn(2)
+
+    nodes._trim_stale_tool_outputs(messages, limit=10)
+
+    assert messages[2].content == "ngắn"
+
+
+def test_trim_flattens_text_blocks():
+    blocks = [{"type": "text", "text": "a" * 8}, "b" * 8]
+    messages = _turn(1, blocks) + _turn(2)
+
+    nodes._trim_stale_tool_outputs(messages, limit=10)
+
+    assert messages[2].content == "a" * 8 + "bb" + nodes.STALE_TOOL_OUTPUT_MARKER
+
+
+def test_trim_skips_non_text_blocks():
+    blocks = [{"type": "text", "text": "a" * 50}, {"type": "image", "url": "https://example.com/x.png"}]
+    messages = _turn(1, blocks) + _turn(2)
+
+    nodes._trim_stale_tool_outputs(messages, limit=10)
+
+    assert messages[2].content == blocks
+
+
+def test_trim_without_user_message_is_noop():
+    messages = [ToolMessage(content="x" * 50, tool_call_id="call1")]
+
+    nodes._trim_stale_tool_outputs(messages, limit=10)
+
+    assert messages[0].content == "x" * 50
+
+
+# ---------------------------------------------------------------------------
+# agent_node pruning
+# ---------------------------------------------------------------------------
+
+class _IdentityRefiner:
+    def refine(self, query, partial=False):
+        return query
+
+
+class _RecordingLLM:
+    def __init__(self):
+        self.messages = None
+
+    def invoke(self, messages, **kwargs):
+        self.messages = messages
+        return AIMessage(content="trả lời", id="new")
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    monkeypatch.setattr(nodes, "get_query_refiner", lambda: _IdentityRefiner())
+    monkeypatch.setattr(nodes, "USE_PROMPT_CACHE_KEY", False)
+    monkeypatch.setattr(nodes.settings.llm, "HISTORY_MAX_TURNS", 2)
+    monkeypatch.setattr(nodes.settings.llm, "HISTORY_TOOL_OUTPUT_CHARS", 0)
+    return _RecordingLLM()
+
+
+def _state():
+    history = _turn(1) + _turn(2) + [HumanMessage(content="câu hỏi 3", id="h3")]
+    return {"messages": history, "user_id": "21520001"}, history
+
+
+def test_agent_node_removes_turns_outside_window(llm, monkeypatch):
+    monkeypatch.setattr(nodes.settings.llm, "PRUNE_HISTORY", True)
+    state, history = _state()
+
+    update = nodes.agent_node(state, llm)
+
+    removals = [m for m in update["messages"] if isinstance(m, RemoveMessage)]
+    assert [m.id for m in removals] == ["h1", "a1", "t1", "r1"]
+    assert update["messages"][-1].id == "new"
+    # Static prompt + user context, then the two kept turns
+    assert isinstance(llm.messages[0], SystemMessage)
+    assert isinstance(llm.messages[1], SystemMessage)
+    assert llm.messages[2:] == history[4:]
+
+
+def test_agent_node_keeps_state_when_pruning_disabled(llm, monkeypatch):
+    monkeypatch.setattr(nodes.settings.llm, "PRUNE_HISTORY", False)
+    state, history = _state()
+
+    update = nodes.agent_node(state, llm)
+
+    assert not any(isinstance(m, RemoveMessage) for m in update["messages"])
+    # The window still applies to what the LLM sees
+    assert llm.messages[2:] == history[4:]
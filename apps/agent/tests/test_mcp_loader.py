@@ -0,0 +1,85 @@
+"""
+_PersistentSession: reconnect and retry only when the session itself dropped.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, ErrorData
+
+from src.tools.mcp_loader import _PersistentSession
+
+
+class _FakeSession:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = 0
+
+    async def call_tool(self, name, arguments=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return f"{name} ok"
+
+
+class _FakeClient:
+    """Hands out the given sessions in order, one per client.session()."""
+
+    def __init__(self, *sessions):
+        self.sessions = list(sessions)
+        self.opened = 0
+
+    @asynccontextmanager
+    async def session(self, server_name):
+        session = self.sessions[self.opened]
+        self.opened += 1
+        yield session
+
+
+def _call(client, name="retrieve_regulation"):
+    async def run():
+        persistent = _PersistentSession(client)
+        await persistent.open()
+        try:
+            return await persistent.call_tool(name, {"query": "học phí"})
+        finally:
+            await persistent.close()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        McpError(ErrorData(code=CONNECTION_CLOSED, message="Connection closed")),
+        anyio.ClosedResourceError(),
+        anyio.BrokenResourceError(),
+    ],
+)
+def test_dropped_session_is_reopened_and_call_retried(error):
+    dropped, fresh = _FakeSession(error), _FakeSession()
+    client = _FakeClient(dropped, fresh)
+
+    assert _call(client) == "retrieve_regulation ok"
+    assert client.opened == 2
+    assert (dropped.calls, fresh.calls) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        McpError(ErrorData(code=-32602, message="Invalid params")),
+        ValueError("bad tool input"),
+    ],
+)
+def test_tool_errors_are_raised_without_reconnecting(error):
+    session = _FakeSession(error)
+    client = _FakeClient(session)
+
+    with pytest.raises(type(error)):
+        _call(client)
+    assert client.opened == 1
+    assert session.calls == 1
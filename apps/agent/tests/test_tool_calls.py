@@ -0,0 +1,73 @@
+"""
+collect_turn_tool_calls: only the latest turn, in order, and no credentials.
+"""
+
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from src.grpc.tool_calls import REDACTED, TOOL_OUTPUT_MAX_CHARS, collect_turn_tool_calls
+
+COOKIE = "PHPSESSID=abc123secret; student_id=22520001"
+
+
+def _call(call_id: str, name: str, **args) -> dict:
+    return {"id": call_id, "name": name, "args": args}
+
+
+def _grades_turn(grades_output: str = "Điểm TB: 8.5") -> list:
+    return [
+        HumanMessage(content="điểm của mình thế nào?"),
+        AIMessage(content="", tool_calls=[_call("c1", "get_user_credential", user_id="u1", source="daa")]),
+        ToolMessage(content=COOKIE, tool_call_id="c1"),
+        AIMessage(content="", tool_calls=[_call("c2", "get_grades", cookie=COOKIE)]),
+        ToolMessage(content=grades_output, tool_call_id="c2"),
+        AIMessage(content="Điểm trung bình của bạn là 8.5."),
+    ]
+
+
+def test_cookie_never_appears_in_tool_calls():
+    # The grades output echoing the cookie must be caught too
+    calls = collect_turn_tool_calls(_grades_turn(grades_output=f"Đã đăng nhập với {COOKIE}"))
+
+    assert [call["tool_name"] for call in calls] == ["get_user_credential", "get_grades"]
+    for call in calls:
+        for value in call.values():
+            assert "abc123secret" not in value
+    assert calls[0]["output"] == REDACTED
+    assert json.loads(calls[1]["args_json"]) == {"cookie": REDACTED}
+
+
+def test_non_secret_args_and_outputs_are_kept():
+    calls = collect_turn_tool_calls(_grades_turn())
+
+    assert json.loads(calls[0]["args_json"]) == {"user_id": "u1", "source": "daa"}
+    assert calls[1]["output"] == "Điểm TB: 8.5"
+
+
+def test_only_latest_turn_is_collected():
+    messages = [
+        HumanMessage(content="quy chế?"),
+        AIMessage(content="", tool_calls=[_call("old", "retrieve_regulation", query="quy chế")]),
+        ToolMessage(content="...", tool_call_id="old"),
+        AIMessage(content="Quy chế là ..."),
+        *_grades_turn(),
+    ]
+
+    assert [call["tool_name"] for call in collect_turn_tool_calls(messages)] == [
+        "get_user_credential",
+        "get_grades",
+    ]
+
+
+def test_long_output_is_capped():
+    messages = [
+        HumanMessage(content="học phí?"),
+        AIMessage(content="", tool_calls=[_call("c1", "retrieve_regulation", query="học phí")]),
+        ToolMessage(content="x" * (TOOL_OUTPUT_MAX_CHARS * 3), tool_call_id="c1"),
+        AIMessage(content="..."),
+    ]
+
+    (call,) = collect_turn_tool_calls(messages)
+
+    assert len(call["output"]) == TOOL_OUTPUT_MAX_CHARS + 1
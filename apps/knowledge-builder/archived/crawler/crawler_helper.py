@@ -2,29 +2,136 @@
 Helper functions for the crawler module.
 """
 
+import hashlib
 import json
 import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlparse
 
+try:
+    import orjson  # Optional: faster JSON encoding (installed transitively via chromadb)
+except ImportError:
+    orjson = None
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 from datetime import datetime
 
 # --- FIX: Import the centralized settings object ---
 from src.config import settings
 
+# Extensions treated as downloadable attachments (lowercase, with leading dot).
+# Kept here because the crawler settings no longer carry DOWNLOADABLE_EXTENSIONS.
+_DOWNLOADABLE_EXTS = frozenset({
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.zip', '.rar'
+})
+
+_SLASH_TO_DASH = str.maketrans('/', '-')
+
+# Hidden folder under RAW_DATA_DIR holding content-addressed page blobs
+BLOBS_DIR_NAME = '.blobs'
+
+# Pooled HTTP sessions: attachments come from the same host, so keep-alive
+# connections are reused instead of paying a TCP + TLS handshake per file.
+# requests.Session is not guaranteed thread-safe, so each download worker
+# thread gets its own.
+_DOWNLOAD_WORKERS = 8
+_COPY_BUFFER_SIZE = 1 << 20
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's pooled session, creating it on first use."""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+        ))
+        session.mount('http://', HTTPAdapter())
+        _thread_local.session = session
+    return session
+
+
+def _dumps_json(data: dict) -> bytes:
+    """Serialize data to pretty UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _loads_json(payload: bytes):
+    """Parse UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload.decode('utf-8'))
+
+
+def _bulk_write(pending_writes: list) -> None:
+    """Write pre-serialized (path, bytes) pairs, one open/write per file."""
+    for path, payload in pending_writes:
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+
+def _store_blob(content_hash: str, content_bytes: bytes) -> str:
+    """
+    Store content in the content-addressed blob store (raw/.blobs/ab/cdef...).
+
+    Returns the blob path; writing is skipped when the blob already exists.
+    """
+    blob_dir = os.path.join(str(settings.paths.RAW_DATA_DIR), BLOBS_DIR_NAME, content_hash[:2])
+    blob_path = os.path.join(blob_dir, content_hash[2:])
+    if os.path.exists(blob_path):
+        return blob_path
+
+    os.makedirs(blob_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=blob_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content_bytes)
+        os.replace(tmp_path, blob_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return blob_path
+
+
+def _link_or_copy(blob_path: str, target_path: str) -> None:
+    """
+    Point target_path at a blob via symlink, falling back to a copy (e.g. on Windows).
+
+    The link is relative, so it keeps resolving when the data dir is moved,
+    mounted elsewhere (containers) or copied without dereferencing links.
+    """
+    if os.path.lexists(target_path):
+        os.remove(target_path)
+    try:
+        os.symlink(os.path.relpath(blob_path, os.path.dirname(target_path)), target_path)
+    except OSError:
+        shutil.copyfile(blob_path, target_path)
+
+
 def should_exclude_node_url(url: str) -> bool:
     """Check if URL should be excluded (node/id format)."""
     return bool(re.search(r'/node/\d+', url))
 
 
+@lru_cache(maxsize=8192)
 def get_folder_name_from_url(url: str) -> str:
     """Convert URL to folder name by extracting path after domain and replacing / with -"""
-    parsed = urlparse(url)
-    path = parsed.path.strip('/')
+    # urlparse handles ;params and //host URLs; lru_cache makes repeats free
+    path = urlparse(url).path.strip('/')
     if not path:
         return 'root'
-    return path.replace('/', '-')
+    return path.translate(_SLASH_TO_DASH)
 
 
 def create_or_get_folder_for_url(url: str, base_dir: str) -> str:
@@ -44,6 +151,49 @@ def create_or_get_folder_for_url(url: str, base_dir: str) -> str:
     return full_path
 
 
+def load_existing_metadata(folder_path: str) -> dict | None:
+    """Load the metadata saved by a previous crawl of this page, if any."""
+    metadata_file = os.path.join(folder_path, 'metadata_generator.json')
+    if not os.path.exists(metadata_file):
+        return None
+    try:
+        with open(metadata_file, 'rb') as f:
+            return _loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def should_skip_crawl(
+    content_bytes: bytes,
+    existing_metadata: dict | None,
+    content_file: str
+) -> tuple[bool, str]:
+    """
+    Decide whether a re-crawled page is unchanged since the last save.
+
+    Compares the byte length first and only hashes when the lengths match,
+    so most changed pages never pay for a SHA-256 pass.
+
+    Args:
+        content_bytes: UTF-8 encoded page content
+        existing_metadata: Metadata from the previous crawl (None if new page)
+        content_file: The page's content.md (may be a link into the blob store)
+
+    Returns:
+        (skip, reason)
+    """
+    if not existing_metadata:
+        return False, "New page"
+    if not os.path.exists(content_file):
+        # Missing, or a link whose blob is gone: rewrite it even if unchanged
+        return False, "Content file missing"
+    if len(content_bytes) != existing_metadata.get('content_length'):
+        return False, "Length changed"
+    if hashlib.sha256(content_bytes).hexdigest() != existing_metadata.get('content_hash'):
+        return False, "Content changed"
+    return True, "Content unchanged"
+
+
 def save_crawled_data(url: str, title: str, content: str, source_urls: list = None):
     """
     Saves crawled data into an organized folder structure with essential metadata_generator.
@@ -53,25 +203,38 @@ def save_crawled_data(url: str, title: str, content: str, source_urls: list = No
         title: Title of the content
         content: Markdown content
         source_urls: Optional list of source URLs (for backwards compatibility)
-    """
-    print(f"[INFO] Saving data for {url}")
 
+    Returns:
+        Folder path if data was written, None if the page is unchanged
+    """
     # --- FIX: Use the path from the settings object ---
     folder_path = create_or_get_folder_for_url(url, str(settings.paths.RAW_DATA_DIR))
+
+    content_bytes = content.encode('utf-8')
     content_file = os.path.join(folder_path, 'content.md')
-    with open(content_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    skip, reason = should_skip_crawl(content_bytes, load_existing_metadata(folder_path), content_file)
+    if skip:
+        print(f"[INFO] {reason}, skipping save for {url}")
+        return None
+
+    print(f"[INFO] Saving data for {url} ({reason})")
+    content_hash = hashlib.sha256(content_bytes).hexdigest()
+
+    # Content is stored once per hash; pages that alias the same content share the blob
+    blob_path = _store_blob(content_hash, content_bytes)
+    _link_or_copy(blob_path, content_file)
 
     # --- FIX: Create the simplified, essential metadata_generator object ---
     metadata = {
         "original_url": url,
         "title": title,
         "crawled_at": datetime.now().isoformat() + "Z",
+        "content_length": len(content_bytes),
+        "content_hash": content_hash,
     }
 
     metadata_file = os.path.join(folder_path, 'metadata_generator.json')
-    with open(metadata_file, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    _bulk_write([(metadata_file, _dumps_json(metadata))])
 
     print(f"[INFO] Data saved to: {folder_path}")
     return folder_path
@@ -95,11 +258,9 @@ def save_user_crawled_data(username: str, data_type: str, url: str, title: str,
     data_folder = os.path.join(user_folder, data_type)
     os.makedirs(data_folder, exist_ok=True)
     
-    # Save content
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     content_file = os.path.join(data_folder, f'{data_type}_{timestamp}.md')
-    with open(content_file, 'w', encoding='utf-8') as f:
-        f.write(content)
     
     # Save metadata_generator
     metadata = {
@@ -107,12 +268,14 @@ def save_user_crawled_data(username: str, data_type: str, url: str, title: str,
         "data_type": data_type,
         "original_url": url,
         "title": title,
-        "crawled_at": datetime.now().isoformat() + "Z",
+        "crawled_at": now.isoformat() + "Z",
     }
     
     metadata_file = os.path.join(data_folder, f'metadata_{timestamp}.json')
-    with open(metadata_file, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    _bulk_write([
+        (content_file, content.encode('utf-8')),
+        (metadata_file, _dumps_json(metadata)),
+    ])
     
     print(f"[INFO] User data saved to: {data_folder}")
     return data_folder
@@ -120,22 +283,25 @@ def save_user_crawled_data(username: str, data_type: str, url: str, title: str,
 
 def extract_title_from_content(content: str) -> str:
     """Extract the main title from cleaned content"""
-    lines = content.split('\n')
-    for line in lines:
-        if line.startswith('# '):
-            return line[2:].strip()
-    return ""
+    # Locate the first "# " line directly instead of splitting the whole page
+    if content.startswith('# '):
+        start = 2
+    else:
+        idx = content.find('\n# ')
+        if idx < 0:
+            return ""
+        start = idx + 3
+    end = content.find('\n', start)
+    return content[start:end if end >= 0 else len(content)].strip()
 
 
 def filter_downloadable_links(links: list) -> list:
     """Filter internal links to get only downloadable files (pdf, doc, xls, etc.)"""
-    downloadable_links = []
-    for link in links:
-        href = link.get('href', '')
-        # --- FIX: Use downloadable extensions from the settings object ---
-        if any(href.lower().endswith(ext) for ext in settings.crawler.DOWNLOADABLE_EXTENSIONS):
-            downloadable_links.append(href)
-    return downloadable_links
+    # One set lookup on the last extension instead of an endswith scan per extension
+    return [
+        href for href in (link.get('href', '') for link in links)
+        if '.' + href.rpartition('.')[2].lower() in _DOWNLOADABLE_EXTS
+    ]
 
 
 def download_file(url: str, save_folder: str) -> bool:
@@ -146,12 +312,13 @@ def download_file(url: str, save_folder: str) -> bool:
 
         print(f"[INFO] Downloading: {file_name} from {url}")
         # --- FIX: Use request timeout from the settings object ---
-        response = requests.get(url, stream=True, timeout=settings.crawler.REQUEST_TIMEOUT, verify=False)
+        response = _get_session().get(url, stream=True, timeout=settings.crawler.REQUEST_TIMEOUT, verify=False)
         response.raise_for_status()
 
+        # Copy in 1 MiB blocks inside shutil (C loop) instead of 8 KiB Python iterations
+        response.raw.decode_content = True
         with open(save_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            shutil.copyfileobj(response.raw, f, length=_COPY_BUFFER_SIZE)
 
         print(f"[SUCCESS] Downloaded file to: {save_path}")
         return True
@@ -159,3 +326,20 @@ def download_file(url: str, save_folder: str) -> bool:
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Failed to download {url}. Error: {e}")
         return False
+
+
+def download_files(urls: list, save_folder: str) -> int:
+    """
+    Download several files concurrently (one pooled session per worker).
+
+    Args:
+        urls: Absolute file URLs
+        save_folder: Folder to save files into
+
+    Returns:
+        Number of files downloaded successfully
+    """
+    if not urls:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, len(urls))) as pool:
+        return sum(pool.map(lambda u: download_file(u, save_folder), urls))
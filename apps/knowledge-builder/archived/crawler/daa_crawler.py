@@ -1,6 +1,8 @@
 """
 Crawler implementation for daa.uit.edu.vn.
 """
+import asyncio
+
 from .filters.daa_filter import DaaUrlFilter
 from crawl4ai import (
     AsyncWebCrawler, BrowserConfig, CacheMode, CrawlerRunConfig,
@@ -14,7 +16,7 @@ MAX_PAGES_PER_DOMAIN = settings.env.MAX_PAGES_PER_DOMAIN
 
 from .base_crawler import BaseCrawler
 from .crawler_helper import (
-    create_or_get_folder_for_url, download_file, extract_title_from_content,
+    create_or_get_folder_for_url, download_files, extract_title_from_content,
     filter_downloadable_links, save_crawled_data, should_exclude_node_url
 )
 from src.utils.url_utils import make_absolute_url
@@ -29,28 +31,14 @@ class DaaCrawler(BaseCrawler):
 
         url_filter = DaaUrlFilter()
 
-        def _is_important(url: str) -> bool:
-            return url_filter.is_important(url)
-
-        def _get_priority(url: str) -> float:
-            # get_priority trả về int 0-100 theo code của bạn
-            try:
-                return float(url_filter.get_priority(url) or 0)
-            except Exception:
-                return 50.0
-
         def custom_url_scorer(url: str) -> float:
-            """Trả về score trong [0.0, 1.0] dựa trên filter.get_priority."""
+            """Trả về score trong [0.0, 1.0] dựa trên filter.classify."""
             try:
-                if not _is_important(url):
+                # classify() = is_important + get_priority trong một lần duyệt URL
+                priority = url_filter.classify(url)
+                if priority is None:
                     return 0.0
-                p = _get_priority(url)
-                # Clip defensively
-                if p < 0:
-                    p = 0.0
-                if p > 100:
-                    p = 100.0
-                return p / 100.0
+                return priority / 100.0
             except Exception as e:
                 print(f"[WARN] url_scorer error for {url}: {e}")
                 return 0.5
@@ -95,11 +83,13 @@ class DaaCrawler(BaseCrawler):
                     print(f"[INFO] No content found: {result.url}")
                     continue
                 
-                if not url_filter.is_important(result.url):
+                if url_filter.classify(result.url) is None:
                     print(f"[SKIP] Unimportant URL: {result.url}")
                     continue
                 title = extract_title_from_content(result.markdown) or f"Page {i + 1}"
-                folder_saved = save_crawled_data(
+                # Disk writes run in a worker thread so they don't block the event loop
+                folder_saved = await asyncio.to_thread(
+                    save_crawled_data,
                     url=result.url,
                     title=title,
                     content=result.markdown,
@@ -111,10 +101,8 @@ class DaaCrawler(BaseCrawler):
                     # --- FIX: Use settings.paths.RAW_DATA_DIR ---
                     page_folder = create_or_get_folder_for_url(result.url, str(settings.paths.RAW_DATA_DIR))
                     downloadable_links = filter_downloadable_links(result.links["internal"])
-                    for file_url in downloadable_links:
-                        absolute_file_url = make_absolute_url(file_url, result.url)
-                        if download_file(absolute_file_url, page_folder):
-                            downloaded_files_count += 1
+                    file_urls = [make_absolute_url(file_url, result.url) for file_url in downloadable_links]
+                    downloaded_files_count = await asyncio.to_thread(download_files, file_urls, page_folder)
 
                 crawled_pages.append({
                     'url': result.url, 'title': title, 'downloaded_files': downloaded_files_count,
@@ -2,9 +2,23 @@
 URL filter specifically for daa.uit.edu.vn domain.
 """
 import re
+from functools import lru_cache
+from typing import Optional
+
 from .base_filter import BaseUrlFilter
 
 
+_YEAR_RE = re.compile(r'\d{4}')
+_LITERAL_SEGMENT_RE = re.compile(r'/([\w-]+)/')
+_REJECT = -1
+
+
+def _literal_segment(pattern: str) -> str | None:
+    """Return 'seg' for a plain '/seg/' pattern, None if it needs a regex."""
+    m = _LITERAL_SEGMENT_RE.fullmatch(pattern)
+    return m.group(1).lower() if m else None
+
+
 class DaaUrlFilter(BaseUrlFilter):
     """
     Filter URLs cho domain DAA.
@@ -39,9 +53,68 @@ class DaaUrlFilter(BaseUrlFilter):
         r'/taxonomy/',            # Taxonomy
     ]
     
+    # Base score theo pattern (thứ tự weight giảm dần)
+    PRIORITY_WEIGHTS = {
+        'thong-bao': 50,
+        'quy-dinh': 45,
+        'lich-thi': 40,
+        'tot-nghiep': 40,
+        'hoc-tap': 35,
+        'ke-hoach': 30,
+        'huong-dan': 30,
+    }
+
+    # Segment table: patterns of the form '/segment/' are matched by splitting
+    # the URL on '/' and doing one dict lookup per segment (no regex engine).
+    # Value: _REJECT for blacklist, otherwise the priority weight (0 = whitelist only).
+    _SEGMENT_TABLE = {
+        **{seg: 0 for seg in map(_literal_segment, IMPORTANT_PATTERNS) if seg},
+        **PRIORITY_WEIGHTS,
+        **{seg: _REJECT for seg in map(_literal_segment, EXCLUDE_PATTERNS) if seg},
+    }
+
+    # Regex fallback for the patterns that really need metacharacters
+    # (/node/\d+, \?page=\d+); only run when the segment walk did not reject.
+    # Matched against the lowercased URL, so no IGNORECASE case folding.
+    _EXCLUDE_FALLBACK_RE = re.compile(
+        '|'.join(f'(?:{p})' for p in EXCLUDE_PATTERNS if not _literal_segment(p))
+    )
+
     # Các năm được chấp nhận (thông tin gần đây)
-    VALID_YEARS = ['2022', '2023', '2024', '2025']
+    VALID_YEARS = frozenset(('2022', '2023', '2024', '2025'))
+
+    # Bonus cho năm gần đây (năm mới nhất trước)
+    _YEAR_BONUS = (('2025', 30), ('2024', 20), ('2023', 10))
     
+    @staticmethod
+    @lru_cache(maxsize=200_000)
+    def classify(url: str) -> Optional[int]:
+        """
+        Quyết định crawl và tính priority trong một lần duyệt URL.
+
+        Lowercases the URL once, walks its segments once, and returns the
+        priority only for URLs that pass is_important. The result depends
+        only on the URL string, so it is cached per URL at class level
+        (DAA pages are heavily cross-linked); see cache_info().
+
+        Returns:
+            None nếu URL bị reject, ngược lại priority score (0-100)
+        """
+        cls = DaaUrlFilter
+        lowered = url.lower()
+        rejected, accepted, weight = cls._walk_segments(lowered)
+
+        if rejected or not accepted or cls._EXCLUDE_FALLBACK_RE.search(lowered):
+            return None
+        if not cls._has_valid_year(url) and _YEAR_RE.search(url):
+            return None
+        return cls._score(url, weight)
+
+    @classmethod
+    def cache_info(cls):
+        """Hit/miss stats of the per-URL classify() cache."""
+        return cls.classify.cache_info()
+
     def is_important(self, url: str) -> bool:
         """
         Kiểm tra URL có quan trọng không.
@@ -51,53 +124,25 @@ class DaaUrlFilter(BaseUrlFilter):
         2. Check whitelist → accept nếu match VÀ có năm hợp lệ
         3. Mặc định → reject
         """
-        # Step 1: Check blacklist
-        for pattern in self.EXCLUDE_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False
-        
-        # Step 2: Check whitelist
-        for pattern in self.IMPORTANT_PATTERNS:
-            if re.search(pattern, url, re.IGNORECASE):
-                # Nếu có năm trong URL, phải là năm hợp lệ
-                if self._has_year(url):
-                    return self._has_valid_year(url)
-                # Nếu không có năm, chấp nhận
-                return True
-        
-        # Step 3: Default reject
-        return False
+        return self.classify(url) is not None
     
     def get_priority(self, url: str) -> int:
         """
         Tính priority score (0-100).
         Càng cao càng quan trọng.
         """
-        score = 0
-        
-        # Base score theo pattern
-        priority_weights = {
-            r'/thong-bao/': 50,
-            r'/quy-dinh/': 45,
-            r'/lich-thi/': 40,
-            r'/tot-nghiep/': 40,
-            r'/hoc-tap/': 35,
-            r'/ke-hoach/': 30,
-            r'/huong-dan/': 30,
-        }
-        
-        for pattern, weight in priority_weights.items():
-            if re.search(pattern, url, re.IGNORECASE):
-                score += weight
-                break
+        return self._score(url, self._walk_segments(url.lower())[2])
+
+    @classmethod
+    def _score(cls, url: str, weight: int) -> int:
+        """Base weight (từ pattern) + bonus năm gần đây - penalty URL dài, clamp 0-100."""
+        score = weight
         
         # Bonus cho năm gần đây
-        if '2025' in url:
-            score += 30
-        elif '2024' in url:
-            score += 20
-        elif '2023' in url:
-            score += 10
+        for year, bonus in cls._YEAR_BONUS:
+            if year in url:
+                score += bonus
+                break
         
         # Penalty cho URL quá dài (có thể là lỗi)
         if len(url) > 150:
@@ -105,13 +150,34 @@ class DaaUrlFilter(BaseUrlFilter):
         
         return max(0, min(100, score))
     
-    def _has_year(self, url: str) -> bool:
-        """Check if URL contains a 4-digit year."""
-        return bool(re.search(r'\d{4}', url))
-    
-    def _has_valid_year(self, url: str) -> bool:
+    @classmethod
+    def _walk_segments(cls, url: str) -> tuple[bool, bool, int]:
+        """
+        Classify URL segments in one pass over url.split('/').
+
+        Expects an already lowercased URL.
+
+        Only segments enclosed by '/' on both sides count, which is exactly
+        what a '/segment/' pattern matches anywhere in the URL.
+
+        Returns:
+            (rejected, accepted, weight)
+        """
+        rejected = accepted = False
+        weight = 0
+        for seg in url.split('/')[1:-1]:
+            rule = cls._SEGMENT_TABLE.get(seg)
+            if rule is None:
+                continue
+            if rule == _REJECT:
+                rejected = True
+            else:
+                accepted = True
+                if rule > weight:
+                    weight = rule
+        return rejected, accepted, weight
+
+    @classmethod
+    def _has_valid_year(cls, url: str) -> bool:
         """Check if URL contains a valid year."""
-        for year in self.VALID_YEARS:
-            if year in url:
-                return True
-        return False
\ No newline at end of file
+        return any(year in url for year in cls.VALID_YEARS)
@@ -1,9 +1,15 @@
 """Commands package - CLI command handlers."""
 
-from commands.pipeline import run_pipeline
-from commands.stage import run_stage
-from commands.status import run_status
-from commands.migrate import run_migrate
+import importlib
+
+# Exported lazily so `ukb status` doesn't import every pipeline stage
+# (PyMuPDF, LlamaIndex, ChromaDB, ...) just to read .pipeline.json files
+_LAZY_IMPORTS = {
+    "run_pipeline": "commands.pipeline",
+    "run_stage": "commands.stage",
+    "run_status": "commands.status",
+    "run_migrate": "commands.migrate",
+}
 
 __all__ = [
     "run_pipeline",
@@ -11,3 +17,13 @@ __all__ = [
     "run_status",
     "run_migrate",
 ]
+
+
+def __getattr__(name):
+    """Import exported names on first access (PEP 562)."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -143,6 +143,12 @@ class Indexing:
         """Load indexing configs from environment."""
         load_dotenv()
         self.EMBED_MODEL = os.getenv("EMBED_MODEL", "text-embedding-3-small")
+        # Shortened embeddings (text-embedding-3-*), e.g. 768; 0 = model default.
+        # Must match the MCP server's EMBED_DIMENSIONS; changing it needs a reindex
+        self.EMBED_DIMENSIONS = int(os.getenv("EMBED_DIMENSIONS", "0")) or None
+        # Chunks per embeddings request (LlamaIndex default is 100). OpenAI accepts
+        # up to 2048 inputs / 300k tokens per request; most documents fit in one
+        self.EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "512"))
         self.COLLECTIONS = os.getenv("COLLECTIONS", "regulation,curriculum").split(",")
 
 
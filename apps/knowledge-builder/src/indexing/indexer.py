@@ -80,7 +80,9 @@ class DocumentIndexer:
 
         embed_model = OpenAIEmbedding(
             model=settings.indexing.EMBED_MODEL,
-            api_key=settings.credentials.OPENAI_API_KEY
+            api_key=settings.credentials.OPENAI_API_KEY,
+            dimensions=settings.indexing.EMBED_DIMENSIONS,
+            embed_batch_size=settings.indexing.EMBED_BATCH_SIZE
         )
 
         # Use RegulationNodeSplitter for intelligent chunking
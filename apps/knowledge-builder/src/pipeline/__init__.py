@@ -2,15 +2,32 @@
 Pipeline package - Stage-based processing and indexing pipelines.
 """
 
-from pipeline.processing_pipeline import ProcessingPipeline
-from pipeline.indexing_pipeline import IndexingPipeline
-from pipeline.core.pipeline_state import PipelineState, StageInfo
-from pipeline.core.stage import Stage
+import importlib
+
+# Exported lazily: importing pipeline.core.* (e.g. PipelineState) must not
+# pull in every stage's heavy dependencies
+_LAZY_IMPORTS = {
+    "ProcessingPipeline": "pipeline.processing_pipeline",
+    "IndexingPipeline": "pipeline.indexing_pipeline",
+    "PipelineState": "pipeline.core.pipeline_state",
+    "StageInfo": "pipeline.core.pipeline_state",
+    "Stage": "pipeline.core.stage",
+}
 
 __all__ = [
-    'ProcessingPipeline',
-    'IndexingPipeline',
-    'PipelineState',
-    'StageInfo',
-    'Stage'
+    "ProcessingPipeline",
+    "IndexingPipeline",
+    "PipelineState",
+    "StageInfo",
+    "Stage",
 ]
+
+
+def __getattr__(name):
+    """Import exported names on first access (PEP 562)."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -7,6 +7,7 @@ and provides incremental execution capabilities.
 
 import json
 import hashlib
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -140,6 +141,10 @@ class PipelineState:
         self.migrated_from_legacy: bool = False
         self.metadata: Dict[str, Any] = {}
 
+        # Deferred save bookkeeping (see deferred_save)
+        self._save_depth = 0
+        self._save_pending = False
+
     def add_stage(
         self,
         name: str,
@@ -262,8 +267,37 @@ class PipelineState:
         """Compute SHA256 hash of content."""
         return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
 
+    @contextmanager
+    def deferred_save(self):
+        """
+        Coalesce save() calls into a single write.
+
+        Inside the block save() only marks the state dirty; the file is
+        written once when the outermost block exits (also on exceptions).
+
+        Usage:
+            >>> with state.deferred_save():
+            ...     state.add_stage("filter", "rejected")
+            ...     state.save()  # deferred
+            ...     state.add_stage("filter", "failed")
+            ...     state.save()  # deferred
+            >>> # .pipeline.json written once here
+        """
+        self._save_depth += 1
+        try:
+            yield self
+        finally:
+            self._save_depth -= 1
+            if self._save_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self.save()
+
     def save(self) -> None:
-        """Save state to .pipeline.json."""
+        """Save state to .pipeline.json (deferred inside deferred_save())."""
+        if self._save_depth:
+            self._save_pending = True
+            return
+
         self.doc_dir.mkdir(parents=True, exist_ok=True)
 
         data = {
@@ -215,40 +215,43 @@ class Stage(ABC):
         state.add_stage(self.name, PipelineState.STATUS_IN_PROGRESS)
         state.save()
 
-        try:
-            # Compute input hash
-            input_content = input_path.read_text(encoding='utf-8')
-            input_hash = self.compute_hash(input_content)
-
-            # Execute stage
-            print(f"   [{self.name.upper()}] Processing...")
-            metadata = self.execute(input_path, output_path, state, **kwargs)
-
-            # Mark as completed
-            state.add_stage(
-                self.name,
-                PipelineState.STATUS_COMPLETED,
-                output_file=output_filename,
-                input_hash=input_hash,
-                cost=metadata.get("cost", 0.0),
-                metadata=metadata
-            )
-            state.save()
-
-            print(f"   [{self.name.upper()}] Completed -> {output_filename}")
-            return True
-
-        except Exception as e:
-            # Mark as failed
-            state.add_stage(
-                self.name,
-                PipelineState.STATUS_FAILED,
-                metadata={"error": str(e)}
-            )
-            state.save()
-
-            print(f"   [{self.name.upper()}] Failed: {e}")
-            raise
+        # Stages may save() mid-execute (e.g. filter rejection); write the
+        # final status once instead of once per save() call
+        with state.deferred_save():
+            try:
+                # Compute input hash
+                input_content = input_path.read_text(encoding='utf-8')
+                input_hash = self.compute_hash(input_content)
+
+                # Execute stage
+                print(f"   [{self.name.upper()}] Processing...")
+                metadata = self.execute(input_path, output_path, state, **kwargs)
+
+                # Mark as completed
+                state.add_stage(
+                    self.name,
+                    PipelineState.STATUS_COMPLETED,
+                    output_file=output_filename,
+                    input_hash=input_hash,
+                    cost=metadata.get("cost", 0.0),
+                    metadata=metadata
+                )
+                state.save()
+
+                print(f"   [{self.name.upper()}] Completed -> {output_filename}")
+                return True
+
+            except Exception as e:
+                # Mark as failed
+                state.add_stage(
+                    self.name,
+                    PipelineState.STATUS_FAILED,
+                    metadata={"error": str(e)}
+                )
+                state.save()
+
+                print(f"   [{self.name.upper()}] Failed: {e}")
+                raise
 
     def get_input_path(self, state: PipelineState, previous_stage: Optional[str] = None) -> Path:
         """
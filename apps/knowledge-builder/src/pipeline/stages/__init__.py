@@ -2,15 +2,21 @@
 Processing and indexing stages.
 """
 
-from pipeline.stages.parse_stage import ParseStage
-from pipeline.stages.clean_stage import CleanStage
-from pipeline.stages.normalize_stage import NormalizeStage
-from pipeline.stages.filter_stage import FilterStage
-from pipeline.stages.fix_markdown_stage import FixMarkdownStage
-from pipeline.stages.flatten_table_stage import FlattenTableStage
-from pipeline.stages.metadata_stage import MetadataStage
-from pipeline.stages.chunk_stage import ChunkStage
-from pipeline.stages.embed_index_stage import EmbedIndexStage
+import importlib
+
+# Exported lazily: importing one stage module must not import the others
+# (processing doesn't need ChromaDB, indexing doesn't need PyMuPDF)
+_LAZY_IMPORTS = {
+    "ParseStage": "pipeline.stages.parse_stage",
+    "CleanStage": "pipeline.stages.clean_stage",
+    "NormalizeStage": "pipeline.stages.normalize_stage",
+    "FilterStage": "pipeline.stages.filter_stage",
+    "FixMarkdownStage": "pipeline.stages.fix_markdown_stage",
+    "FlattenTableStage": "pipeline.stages.flatten_table_stage",
+    "MetadataStage": "pipeline.stages.metadata_stage",
+    "ChunkStage": "pipeline.stages.chunk_stage",
+    "EmbedIndexStage": "pipeline.stages.embed_index_stage",
+}
 
 __all__ = [
     "ParseStage",
@@ -23,3 +29,13 @@ __all__ = [
     "ChunkStage",
     "EmbedIndexStage",
 ]
+
+
+def __getattr__(name):
+    """Import exported names on first access (PEP 562)."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -86,7 +86,9 @@ class EmbedIndexStage(Stage):
 
             self.embed_model = OpenAIEmbedding(
                 model=settings.indexing.EMBED_MODEL,
-                api_key=settings.credentials.OPENAI_API_KEY
+                api_key=settings.credentials.OPENAI_API_KEY,
+                dimensions=settings.indexing.EMBED_DIMENSIONS,
+                embed_batch_size=settings.indexing.EMBED_BATCH_SIZE
             )
             LlamaSettings.embed_model = self.embed_model
 
@@ -0,0 +1,6 @@
+"""Put the app root on sys.path so tests can import the `archived` crawler package."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
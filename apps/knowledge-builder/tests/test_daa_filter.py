@@ -0,0 +1,120 @@
+"""
+DaaUrlFilter.classify must decide and score exactly like the original
+regex-based is_important/get_priority it replaced.
+"""
+
+import re
+
+import pytest
+
+from archived.crawler.filters.daa_filter import DaaUrlFilter
+
+
+class _LegacyDaaUrlFilter:
+    """The original per-pattern re.search implementation, kept as the oracle."""
+
+    VALID_YEARS = ['2022', '2023', '2024', '2025']
+
+    PRIORITY_WEIGHTS = {
+        r'/thong-bao/': 50,
+        r'/quy-dinh/': 45,
+        r'/lich-thi/': 40,
+        r'/tot-nghiep/': 40,
+        r'/hoc-tap/': 35,
+        r'/ke-hoach/': 30,
+        r'/huong-dan/': 30,
+    }
+
+    def is_important(self, url: str) -> bool:
+        for pattern in DaaUrlFilter.EXCLUDE_PATTERNS:
+            if re.search(pattern, url, re.IGNORECASE):
+                return False
+
+        for pattern in DaaUrlFilter.IMPORTANT_PATTERNS:
+            if re.search(pattern, url, re.IGNORECASE):
+                if re.search(r'\d{4}', url):
+                    return any(year in url for year in self.VALID_YEARS)
+                return True
+
+        return False
+
+    def get_priority(self, url: str) -> int:
+        score = 0
+        for pattern, weight in self.PRIORITY_WEIGHTS.items():
+            if re.search(pattern, url, re.IGNORECASE):
+                score += weight
+                break
+
+        if '2025' in url:
+            score += 30
+        elif '2024' in url:
+            score += 20
+        elif '2023' in url:
+            score += 10
+
+        if len(url) > 150:
+            score -= 20
+
+        return max(0, min(100, score))
+
+
+BASE = "https://daa.uit.edu.vn"
+
+URLS = [
+    f"{BASE}/",
+    f"{BASE}/thong-bao/lich-nghi-tet-2025",
+    f"{BASE}/Thong-Bao/Lich-Nghi-Tet-2025",
+    f"{BASE}/thong-bao",
+    f"{BASE}/thong-bao/",
+    f"{BASE}/quy-dinh/quy-che-dao-tao",
+    f"{BASE}/quy-dinh/quy-che-dao-tao-2019",
+    f"{BASE}/quy-dinh/2022/quy-che",
+    f"{BASE}/thong-bao/quy-dinh/2024/dang-ky-hoc-phan",
+    f"{BASE}/lich-thi/hk1-2023-2024",
+    f"{BASE}/tot-nghiep/xet-tot-nghiep-dot-1",
+    f"{BASE}/hoc-tap/hoc-vu",
+    f"{BASE}/ke-hoach/ke-hoach-nam-hoc-2025",
+    f"{BASE}/huong-dan/dang-ky-hoc-phan",
+    f"{BASE}/bieu-mau/don-xin-hoan-thi",
+    f"{BASE}/mau-bieu/2023/don",
+    f"{BASE}/ban-hanh/quyet-dinh-2021",
+    f"{BASE}/gioi-thieu/lich-su",
+    f"{BASE}/node/1234",
+    f"{BASE}/thong-bao/node/99",
+    f"{BASE}/NODE/99/thong-bao/",
+    f"{BASE}/thong-bao/tin-tuc?page=3",
+    f"{BASE}/thong-bao/user/",
+    f"{BASE}/quy-dinh/print/",
+    f"{BASE}/taxonomy/term/5",
+    f"{BASE}/admin/thong-bao/",
+    f"{BASE}/thong-bao/" + "rat-dai-" * 20 + "2025",
+    f"{BASE}/huong-dan/" + "x" * 150,
+    f"{BASE}/thong-bao/nam-hoc-2024-2025",
+]
+
+
+@pytest.mark.parametrize("url", URLS)
+def test_classify_matches_legacy_filter(url):
+    legacy = _LegacyDaaUrlFilter()
+    expected = legacy.get_priority(url) if legacy.is_important(url) else None
+
+    assert DaaUrlFilter.classify(url) == expected
+
+
+@pytest.mark.parametrize("url", URLS)
+def test_is_important_and_get_priority_match_legacy_filter(url):
+    legacy = _LegacyDaaUrlFilter()
+    url_filter = DaaUrlFilter()
+
+    assert url_filter.is_important(url) == legacy.is_important(url)
+    assert url_filter.get_priority(url) == legacy.get_priority(url)
+
+
+def test_classify_is_cached_per_url():
+    url = f"{BASE}/thong-bao/cache-check-2025"
+    DaaUrlFilter.classify(url)
+    hits = DaaUrlFilter.cache_info().hits
+
+    DaaUrlFilter.classify(url)
+
+    assert DaaUrlFilter.cache_info().hits == hits + 1
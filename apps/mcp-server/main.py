@@ -8,6 +8,8 @@ Exposes tools for:
 MCP Protocol: https://modelcontextprotocol.io/
 FastMCP: https://github.com/jlowin/fastmcp
 """
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 from fastapi import FastAPI
 
@@ -18,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.tools.retrieval_tools import register_retrieval_tools
 from src.tools.daa_scraping_tools import register_daa_tools
+from src.scraper.daa_scraper import DaaScraper
 
 # Initialize FastMCP server
 mcp = FastMCP("UIT MCP Server")
@@ -31,13 +34,22 @@ print("[MCP SERVER] All tools registered successfully")
 # Create MCP ASGI app
 mcp_app = mcp.http_app(path='/mcp')
 
+
+@asynccontextmanager
+async def lifespan(app):
+    """Run the MCP lifespan, then release the shared scraper browser."""
+    async with mcp_app.lifespan(app):
+        yield
+    await DaaScraper.close_shared_browser()
+
+
 # Create combined FastAPI app with MCP routes
 # Note: Not passing lifespan to avoid type mismatch (Starlette vs FastAPI)
 # MCP routes are mounted, their lifespan will still work
 app = FastAPI(
     title="UIT MCP Server",
     routes=mcp_app.routes,
-    lifespan=mcp_app.lifespan
+    lifespan=lifespan
 )
 
 # Add custom endpoints (must be after app creation, before uvicorn loads)
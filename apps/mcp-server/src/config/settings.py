@@ -46,6 +46,9 @@ class Retrieval:
         """Load retrieval configs from environment."""
         load_dotenv()
         self.EMBED_MODEL = os.getenv("EMBED_MODEL", "text-embedding-3-small")
+        # Shortened embeddings (text-embedding-3-*), e.g. 768; 0 = model default.
+        # Must match the dimensions the collections were indexed with
+        self.EMBED_DIMENSIONS = int(os.getenv("EMBED_DIMENSIONS", "0")) or None
         self.MODAL_RERANKER_URL = os.getenv(
             "MODAL_RERANKER_URL",
             "https://giakiet05--viranker-reranker-rerank-endpoint.modal.run"
@@ -59,6 +62,24 @@ class Retrieval:
         self.USE_CONTEXT_DISTILLATION = os.getenv("USE_CONTEXT_DISTILLATION", "false").lower() == "true"
         self.DISTILLATION_MODEL = os.getenv("DISTILLATION_MODEL", "gpt-5-nano")
         self.DISTILLATION_MIN_CHUNKS = int(os.getenv("DISTILLATION_MIN_CHUNKS", "3"))  # Only distill if >= N chunks
+        self.DISTILLATION_MIN_CHARS = int(os.getenv("DISTILLATION_MIN_CHARS", "1500"))  # Only distill if context >= N chars
+
+        # Reranker score cache (same query + candidate set); TTL 0 = disabled
+        self.RERANK_CACHE_MAX_ENTRIES = int(os.getenv("RERANK_CACHE_MAX_ENTRIES", "4096"))
+        self.RERANK_CACHE_TTL_SECONDS = float(os.getenv("RERANK_CACHE_TTL_SECONDS", "300"))
+        # Reranker input cap (~512 tokens of Vietnamese text); 0 = no limit
+        self.RERANK_MAX_TEXT_CHARS = int(os.getenv("RERANK_MAX_TEXT_CHARS", "3072"))
+
+        # Exact-match result cache (same normalized query + collection)
+        self.USE_RESULT_CACHE = os.getenv("USE_RESULT_CACHE", "true").lower() == "true"
+        self.RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1024"))
+        self.RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
+
+        # Semantic cache (reuse results for near-duplicate queries)
+        self.USE_SEMANTIC_CACHE = os.getenv("USE_SEMANTIC_CACHE", "false").lower() == "true"
+        self.SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+        self.SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "512"))
+        self.SEMANTIC_CACHE_TTL_SECONDS = float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "3600"))
 
 
 class Settings:
@@ -30,13 +30,33 @@ Example:
      Chương trình tài năng (CTTN) cần 550 điểm."
 """
 
+import logging
 from typing import List
+from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.schema import NodeWithScore
 from llama_index.llms.openai import OpenAI
 from ..config.settings import Settings
+from ..utils.logger import logger
 
 settings = Settings()
 
+# Static instructions go in the system message so every distillation call
+# starts with the same prefix (OpenAI caches repeated prompt prefixes);
+# only the question and chunks in the user message change per call.
+DISTILLATION_SYSTEM_PROMPT = """Bạn là chuyên gia trích xuất thông tin. Nhiệm vụ của bạn là TÌM và TRÍCH XUẤT **CHỈ** những thông tin TRỰC TIẾP liên quan đến câu hỏi của người dùng.
+
+NGUYÊN TẮC:
+1. Chỉ trích xuất câu/đoạn văn TRỰC TIẾP trả lời câu hỏi
+2. KHÔNG thêm, sửa, hoặc diễn giải - copy y nguyên từ context
+3. KHÔNG tóm tắt - giữ nguyên chi tiết quan trọng (số liệu, điều kiện, v.v.)
+4. Nếu thông tin nằm ở nhiều chunks khác nhau, trích xuất TẤT CẢ
+5. Loại bỏ info KHÔNG liên quan (ví dụ: hỏi về TOEIC thì bỏ phần học phí)
+6. Giữ cấu trúc rõ ràng (bullet points nếu có nhiều điểm)
+
+Chỉ trả về text được trích xuất, KHÔNG giải thích."""
+
+DISTILLATION_SYSTEM_MESSAGE = ChatMessage(role=MessageRole.SYSTEM, content=DISTILLATION_SYSTEM_PROMPT)
+
 
 class ContextDistiller:
     """
@@ -56,7 +76,7 @@ class ContextDistiller:
             api_key=settings.credentials.OPENAI_API_KEY,
             timeout=120.0  # 2 minutes for distillation
         )
-        print(f"[CONTEXT-DISTILL] Initialized with model: {self.model}")
+        logger.info(f"[CONTEXT-DISTILL] Initialized with model: {self.model}")
     
     def distill(self, query: str, nodes: List[NodeWithScore]) -> str:
         """
@@ -76,10 +96,10 @@ class ContextDistiller:
         # Skip distillation if too few chunks
         min_chunks = settings.retrieval.DISTILLATION_MIN_CHUNKS
         if len(nodes) < min_chunks:
-            print(f"[CONTEXT-DISTILL] Skipping - only {len(nodes)} chunks (min: {min_chunks})")
+            logger.debug("[CONTEXT-DISTILL] Skipping - only %d chunks (min: %d)", len(nodes), min_chunks)
             return self._format_chunks_raw(nodes)
         
-        print(f"[CONTEXT-DISTILL] Distilling {len(nodes)} chunks for query: {query[:100]}...")
+        logger.debug("[CONTEXT-DISTILL] Distilling %d chunks for query: %.100s...", len(nodes), query)
         
         try:
             # Build context from chunks
@@ -90,68 +110,67 @@ class ContextDistiller:
             
             full_context = "\n".join(chunks_text)
             
-            # Distillation prompt
-            prompt = self._build_distillation_prompt(query, full_context)
+            # Skip the LLM round-trip if the chunks are already short
+            min_chars = settings.retrieval.DISTILLATION_MIN_CHARS
+            if len(full_context) < min_chars:
+                logger.debug("[CONTEXT-DISTILL] Skipping - context only %d chars (min: %d)", len(full_context), min_chars)
+                return self._format_chunks_raw(nodes)
+            
+            # Distillation messages (static system prefix + per-query user message)
+            messages = self._build_distillation_messages(query, full_context)
             
             # Call LLM with timeout protection
-            print(f"[CONTEXT-DISTILL] Calling {self.model} for distillation...")
-            response = self.llm.complete(prompt)
-            distilled = response.text.strip()
+            logger.debug("[CONTEXT-DISTILL] Calling %s for distillation...", self.model)
+            response = self.llm.chat(messages)
+            distilled = (response.message.content or "").strip()
             
             # Validation: Check if distillation actually reduced content
             original_len = len(full_context)
             distilled_len = len(distilled)
             
             if distilled_len == 0:
-                print(f"[ERROR] Distillation returned empty string, using raw chunks")
+                logger.warning("[CONTEXT-DISTILL] Distillation returned empty string, using raw chunks")
                 return self._format_chunks_raw(nodes)
             
             reduction_ratio = 1 - (distilled_len / original_len)
             
-            print(f"[CONTEXT-DISTILL] Reduced from {original_len} to {distilled_len} chars ({reduction_ratio:.1%} reduction)")
+            logger.info(
+                "[CONTEXT-DISTILL] Reduced from %d to %d chars (%.1f%% reduction)",
+                original_len, distilled_len, reduction_ratio * 100
+            )
             
             # If distillation failed to reduce (model returned everything), use raw
             if reduction_ratio < 0.1:  # Less than 10% reduction
-                print(f"[WARNING] Distillation did not reduce content enough, using raw chunks")
+                logger.warning("[CONTEXT-DISTILL] Distillation did not reduce content enough, using raw chunks")
                 return self._format_chunks_raw(nodes)
             
-            print(f"[CONTEXT-DISTILL] ✓ Distillation successful")
             return distilled
             
         except Exception as e:
-            print(f"[ERROR] Context distillation failed: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
-            print(f"[CONTEXT-DISTILL] Falling back to raw chunks")
+            logger.error(
+                f"[CONTEXT-DISTILL] Context distillation failed, falling back to raw chunks: {type(e).__name__}: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             return self._format_chunks_raw(nodes)
     
-    def _build_distillation_prompt(self, query: str, context: str) -> str:
+    def _build_distillation_messages(self, query: str, context: str) -> List[ChatMessage]:
         """
-        Build prompt for context distillation.
+        Build chat messages for context distillation.
         
         Args:
             query: User's question
             context: Full context from all chunks
             
         Returns:
-            Distillation prompt
+            [shared system message, user message with question and context]
         """
-        return f"""Bạn là chuyên gia trích xuất thông tin. Nhiệm vụ của bạn là TÌM và TRÍCH XUẤT **CHỈ** những thông tin TRỰC TIẾP liên quan đến câu hỏi sau.
-
-CÂU HỎI: {query}
-
-NGUYÊN TẮC:
-1. Chỉ trích xuất câu/đoạn văn TRỰC TIẾP trả lời câu hỏi
-2. KHÔNG thêm, sửa, hoặc diễn giải - copy y nguyên từ context
-3. KHÔNG tóm tắt - giữ nguyên chi tiết quan trọng (số liệu, điều kiện, v.v.)
-4. Nếu thông tin nằm ở nhiều chunks khác nhau, trích xuất TẤT CẢ
-5. Loại bỏ info KHÔNG liên quan (ví dụ: hỏi về TOEIC thì bỏ phần học phí)
-6. Giữ cấu trúc rõ ràng (bullet points nếu có nhiều điểm)
+        user_prompt = f"""CÂU HỎI: {query}
 
 CONTEXT ĐỂ TRÍCH XUẤT:
 {context}
 
-THÔNG TIN LIÊN QUAN (chỉ trả về text được trích xuất, KHÔNG giải thích):"""
+THÔNG TIN LIÊN QUAN:"""
+        return [DISTILLATION_SYSTEM_MESSAGE, ChatMessage(role=MessageRole.USER, content=user_prompt)]
     
     def _format_chunks_raw(self, nodes: List[NodeWithScore]) -> str:
         """
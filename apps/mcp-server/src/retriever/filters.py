@@ -3,10 +3,11 @@ Filtering and utility functions for retrieval pipeline.
 
 Contains:
 - Text normalization (Unicode NFC)
+- Cache key normalization
 - Program context filtering (Chính quy vs Từ xa)
-- Node deduplication
 """
 
+import re
 import unicodedata
 from typing import List
 
@@ -36,6 +37,31 @@ def normalize_vietnamese_text(text: str) -> str:
     return unicodedata.normalize('NFC', text)
 
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_PUNCT = ' ?!.,;:…'
+
+
+def normalize_query_key(query: str) -> str:
+    """
+    Normalize a query into a cache key.
+
+    Queries come from the agent, which already rewrites the user message into
+    a standalone query, so only surface noise is removed: Unicode form, case,
+    repeated whitespace and trailing punctuation.
+
+    Example:
+        'Điều kiện  tốt nghiệp?' and 'điều kiện tốt nghiệp' -> same key
+
+    Args:
+        query: Query passed to a retrieval tool
+
+    Returns:
+        Normalized key (not meant to be used as a search query)
+    """
+    key = normalize_vietnamese_text(query).casefold()
+    return _WHITESPACE_RE.sub(' ', key).strip(_TRAILING_PUNCT)
+
+
 def filter_by_program_context(query: str, nodes: List[NodeWithScore]) -> List[NodeWithScore]:
     """
     Filter nodes based on program context (Chính quy vs Từ xa) derived from query.
@@ -51,12 +77,11 @@ def filter_by_program_context(query: str, nodes: List[NodeWithScore]) -> List[No
 
     # Case 1: User explicitly asks for "Từ xa"
     if "từ xa" in query_lower:
-        filtered = []
-        for node in nodes:
-            title = node.node.metadata.get("title", "").lower()
-            # Keep if title mentions "từ xa"
-            if "từ xa" in title:
-                filtered.append(node)
+        # Keep if title mentions "từ xa"
+        filtered = [
+            node for node in nodes
+            if "từ xa" in node.node.metadata.get("title", "").lower()
+        ]
 
         if filtered:
             logger.info(f"[FILTER] Applied 'Từ xa' filter: {len(nodes)} -> {len(filtered)} nodes")
@@ -64,43 +89,14 @@ def filter_by_program_context(query: str, nodes: List[NodeWithScore]) -> List[No
 
     # Case 2: User explicitly asks for "Chính quy"
     if "chính quy" in query_lower:
-        filtered = []
-        for node in nodes:
-            title = node.node.metadata.get("title", "").lower()
-            # Exclude if title mentions "từ xa" (Safety net)
-            if "từ xa" not in title:
-                filtered.append(node)
+        # Exclude if title mentions "từ xa" (Safety net)
+        filtered = [
+            node for node in nodes
+            if "từ xa" not in node.node.metadata.get("title", "").lower()
+        ]
 
         if len(filtered) < len(nodes):
             logger.info(f"[FILTER] Applied 'Chính quy' filter (excluded 'Từ xa'): {len(nodes)} -> {len(filtered)} nodes")
             return filtered
 
     return nodes
-
-
-def deduplicate_nodes(nodes: List[NodeWithScore]) -> List[NodeWithScore]:
-    """
-    Deduplicate nodes by node ID.
-
-    When the same chunk is retrieved from multiple indexes (e.g., dense + BM25),
-    keep only the node with the highest score.
-
-    Args:
-        nodes: List of retrieved nodes
-
-    Returns:
-        Deduplicated list of nodes
-    """
-    node_map = {}
-
-    for node in nodes:
-        node_id = node.node.node_id
-
-        if node_id not in node_map:
-            node_map[node_id] = node
-        else:
-            # Keep node with higher score
-            if node.score > node_map[node_id].score:
-                node_map[node_id] = node
-
-    return list(node_map.values())
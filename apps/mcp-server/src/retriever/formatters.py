@@ -8,12 +8,8 @@ from typing import List, Literal, Dict
 
 from llama_index.core.schema import NodeWithScore
 
-from .schemas import (
-    RegulationDocument,
-    CurriculumDocument,
-    RegulationRetrievalResult,
-    CurriculumRetrievalResult
-)
+from .schemas import RegulationDocument, CurriculumDocument
+from .ttl_cache import TTLCache
 
 
 class ResultFormatter:
@@ -23,6 +19,20 @@ class ResultFormatter:
     Converts raw nodes to structured Pydantic models.
     """
 
+    def __init__(self, cache_max_entries: int = 10_000, cache_ttl_seconds: float = 3600):
+        """
+        Initialize ResultFormatter.
+
+        Args:
+            cache_max_entries: Max formatted documents cached by node id
+            cache_ttl_seconds: Seconds before a cached document expires
+                               (re-indexed chunks may keep their node id)
+        """
+        # (collection_type, node_id) -> validated document dict. A few hot
+        # chunks show up in most answers; their content stripping and
+        # Pydantic validation only needs to happen once.
+        self._doc_cache = TTLCache(max_items=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+
     @staticmethod
     def _strip_metadata_from_content(content: str) -> str:
         """
@@ -46,15 +56,58 @@ class ResultFormatter:
         Returns:
             Clean content without metadata
         """
-        # Split by separator "---"
-        if "---" in content:
-            parts = content.split("---", 1)
-            if len(parts) == 2:
-                return parts[1].strip()
+        # Slice after the first separator "---" (single scan, no split list)
+        idx = content.find("---")
+        if idx >= 0:
+            return content[idx + 3:].strip()
 
         # Fallback: if no separator found, return original content
         return content
 
+    def _build_document(
+        self,
+        node: NodeWithScore,
+        score: float,
+        collection_type: Literal["regulation", "curriculum"]
+    ) -> Dict:
+        """Build and validate one document dict from a node."""
+        metadata = node.node.metadata
+        raw_content = node.node.get_content()
+
+        # Strip prepended metadata from content
+        clean_content = self._strip_metadata_from_content(raw_content)
+
+        if collection_type == "regulation":
+            # Build RegulationDocument
+            doc_dict = {
+                "content": clean_content,
+                "title": metadata.get("title", ""),
+                "regulation_number": metadata.get("regulation_number"),
+                "hierarchy": metadata.get("hierarchy", ""),
+                "effective_date": metadata.get("effective_date"),
+                "document_type": metadata.get("document_type", "original"),
+                "year": metadata.get("year"),
+                "pdf_file": metadata.get("pdf_file"),
+                "score": score
+            }
+            # Validate with Pydantic
+            return RegulationDocument(**doc_dict).model_dump()
+
+        # Build CurriculumDocument
+        doc_dict = {
+            "content": clean_content,
+            "title": metadata.get("title", ""),
+            "year": metadata.get("year"),
+            "major": metadata.get("major"),
+            "major_code": metadata.get("major_code"),
+            "program_type": metadata.get("program_type"),
+            "program_name": metadata.get("program_name"),
+            "source_url": metadata.get("source_url"),
+            "score": score
+        }
+        # Validate with Pydantic
+        return CurriculumDocument(**doc_dict).model_dump()
+
     def format(
         self,
         query: str,
@@ -75,58 +128,27 @@ class ResultFormatter:
         documents = []
 
         for node in nodes:
-            metadata = node.node.metadata
-            raw_content = node.node.get_content()
-
-            # Strip prepended metadata from content
-            clean_content = self._strip_metadata_from_content(raw_content)
-
-            if collection_type == "regulation":
-                # Build RegulationDocument
-                doc_dict = {
-                    "content": clean_content,
-                    "title": metadata.get("title", ""),
-                    "regulation_number": metadata.get("regulation_number"),
-                    "hierarchy": metadata.get("hierarchy", ""),
-                    "effective_date": metadata.get("effective_date"),
-                    "document_type": metadata.get("document_type", "original"),
-                    "year": metadata.get("year"),
-                    "pdf_file": metadata.get("pdf_file"),
-                    "score": round(float(node.score), 2)
-                }
-                # Validate with Pydantic
-                doc = RegulationDocument(**doc_dict)
-                documents.append(doc.model_dump())
-
-            elif collection_type == "curriculum":
-                # Build CurriculumDocument
-                doc_dict = {
-                    "content": clean_content,
-                    "title": metadata.get("title", ""),
-                    "year": metadata.get("year"),
-                    "major": metadata.get("major"),
-                    "major_code": metadata.get("major_code"),
-                    "program_type": metadata.get("program_type"),
-                    "program_name": metadata.get("program_name"),
-                    "source_url": metadata.get("source_url"),
-                    "score": round(float(node.score), 2)
-                }
-                # Validate with Pydantic
-                doc = CurriculumDocument(**doc_dict)
-                documents.append(doc.model_dump())
-
-        # Build result based on collection type
-        if collection_type == "regulation":
-            result_obj = RegulationRetrievalResult(
-                query=query,
-                total_retrieved=len(documents),
-                documents=documents
-            )
-        else:  # curriculum
-            result_obj = CurriculumRetrievalResult(
-                query=query,
-                total_retrieved=len(documents),
-                documents=documents
-            )
-
-        return result_obj.model_dump()
+            score = round(float(node.score), 2)
+            cache_key = (collection_type, node.node.node_id)
+
+            cached = self._doc_cache.get(cache_key)
+            if cached is not None and 0.0 <= score <= 1.0:
+                # Only the score differs per request (same bounds as the schema)
+                doc = dict(cached)
+                doc["score"] = score
+            else:
+                doc = self._build_document(node, score, collection_type)
+                # Store a copy: the returned dicts go to callers and result caches
+                self._doc_cache.set(cache_key, dict(doc))
+
+            documents.append(doc)
+
+        # Same shape as RegulationRetrievalResult / CurriculumRetrievalResult.
+        # Documents are validated above and the tool layer validates the full
+        # result once more, so don't build (and re-validate) the model here too
+        return {
+            "query": query,
+            "total_retrieved": len(documents),
+            "documents": documents,
+            "distilled_context": None,
+        }
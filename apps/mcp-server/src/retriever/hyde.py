@@ -13,6 +13,40 @@ from typing import Literal
 from ..utils.logger import logger
 
 
+_HYDE_CONTEXTS = {
+    "regulation": "quy định, quy chế, văn bản hành chính của Đại học UIT",
+    "curriculum": "chương trình đào tạo, môn học, học phần của các ngành tại UIT",
+}
+
+_HYDE_PROMPT_HEAD = """Bạn là chuyên gia về {context}.
+
+Câu hỏi: """
+
+_HYDE_PROMPT_TAIL = """
+
+Hãy viết một đoạn văn ngắn (100-200 từ) MÔ TẢ câu trả lời có thể có cho câu hỏi trên.
+Không cần chính xác 100%, chỉ cần viết DẠNG văn bản mà câu trả lời sẽ có.
+
+Quy tắc:
+- Viết như thể bạn đang TRẢ LỜI câu hỏi (không nói "Câu trả lời sẽ bao gồm...")
+- Sử dụng các từ khóa và thuật ngữ liên quan
+- Giữ phong cách giống văn bản {context}
+- Ngắn gọn, súc tích (100-200 từ)
+
+Đoạn văn:"""
+
+# Static parts rendered once per collection at import; per query only the
+# user's text is spliced in (never passed through str.format, so braces in
+# a query cannot break rendering)
+_HYDE_PROMPTS = {
+    collection_type: (
+        _HYDE_PROMPT_HEAD.format(context=context),
+        _HYDE_PROMPT_TAIL.format(context=context),
+    )
+    for collection_type, context in _HYDE_CONTEXTS.items()
+}
+
+
 class HyDEGenerator:
     """
     HyDE generator for query expansion.
@@ -57,25 +91,8 @@ class HyDEGenerator:
             Hypothetical document text (100-200 words)
         """
         # Customize prompt based on collection type
-        if collection_type == "regulation":
-            context = "quy định, quy chế, văn bản hành chính của Đại học UIT"
-        else:  # curriculum
-            context = "chương trình đào tạo, môn học, học phần của các ngành tại UIT"
-
-        prompt = f"""Bạn là chuyên gia về {context}.
-
-Câu hỏi: {query}
-
-Hãy viết một đoạn văn ngắn (100-200 từ) MÔ TẢ câu trả lời có thể có cho câu hỏi trên.
-Không cần chính xác 100%, chỉ cần viết DẠNG văn bản mà câu trả lời sẽ có.
-
-Quy tắc:
-- Viết như thể bạn đang TRẢ LỜI câu hỏi (không nói "Câu trả lời sẽ bao gồm...")
-- Sử dụng các từ khóa và thuật ngữ liên quan
-- Giữ phong cách giống văn bản {context}
-- Ngắn gọn, súc tích (100-200 từ)
-
-Đoạn văn:"""
+        head, tail = _HYDE_PROMPTS.get(collection_type, _HYDE_PROMPTS["curriculum"])
+        prompt = head + query + tail
 
         try:
             logger.info(f"[HYDE] Generating hypothetical document for: {query[:60]}...")
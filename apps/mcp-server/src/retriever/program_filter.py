@@ -9,7 +9,9 @@ Giải quyết vấn đề nhầm lẫn giữa các ngành tương tự:
 Strategy: Hard filtering based on document_id pattern matching
 """
 
+from functools import lru_cache
 from typing import Optional, List
+
 from llama_index.core.schema import NodeWithScore
 from ..utils.logger import logger
 
@@ -121,8 +123,30 @@ PROGRAM_KEYWORDS = {
 }
 
 
+# University names stripped from queries before matching (longest first,
+# so the full name is removed before its substrings)
+UNIVERSITY_NAMES = (
+    "trường đại học công nghệ thông tin",
+    "đại học công nghệ thông tin",
+    "đhcntt",
+    "uit",
+    "trường",
+)
+
+# Flattened (program_slug, keyword, keyword_lower), built once at import
+# instead of re-walking and re-lowercasing PROGRAM_KEYWORDS per query
+_KEYWORD_INDEX = tuple(
+    (program_slug, keyword, keyword.lower())
+    for program_slug, keywords in PROGRAM_KEYWORDS.items()
+    for keyword in keywords
+)
+
+
 # ========== HELPER FUNCTIONS ==========
 
+# Same query is classified on every retry / repeated FAQ; the result only
+# depends on the query text and the static keyword table
+@lru_cache(maxsize=2048)
 def extract_program_from_query(query: str) -> Optional[str]:
     """
     Extract program name from user query.
@@ -156,28 +180,18 @@ def extract_program_from_query(query: str) -> Optional[str]:
 
     # STEP 1: Remove university name to avoid confusion
     # "Trường Đại học Công nghệ Thông tin" could be confused with program "Công nghệ Thông tin"
-    university_names = [
-        "trường đại học công nghệ thông tin",
-        "đại học công nghệ thông tin",
-        "đhcntt",
-        "uit",
-        "trường",
-    ]
-
     cleaned_query = query_lower
-    for uni_name in university_names:
+    for uni_name in UNIVERSITY_NAMES:
         cleaned_query = cleaned_query.replace(uni_name, " ")  # Replace with space to avoid joining words
 
     # STEP 2: Find all matches with position and length
     # Format: (program_slug, keyword, position, length)
     matches = []
 
-    for program_slug, keywords in PROGRAM_KEYWORDS.items():
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            pos = cleaned_query.find(keyword_lower)
-            if pos != -1:
-                matches.append((program_slug, keyword, pos, len(keyword_lower)))
+    for program_slug, keyword, keyword_lower in _KEYWORD_INDEX:
+        pos = cleaned_query.find(keyword_lower)
+        if pos != -1:
+            matches.append((program_slug, keyword, pos, len(keyword_lower)))
 
     # STEP 3: If no matches, return None
     if not matches:
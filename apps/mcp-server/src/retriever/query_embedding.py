@@ -0,0 +1,26 @@
+"""
+Memoized query embeddings.
+
+The semantic cache and the dense retriever both embed the incoming query,
+and FAQ-style questions repeat a lot. Routing every query embedding through
+one LRU cache means each distinct query string costs a single embedding API
+call, however many components (or requests) need it.
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+from llama_index.core import Settings as LlamaSettings
+
+# Max distinct query strings kept (1536 floats each for text-embedding-3-small)
+QUERY_EMBEDDING_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def get_query_embedding(query: str) -> Tuple[float, ...]:
+    """
+    Embed a query with the shared embedding model, memoized by query text.
+
+    Returns a tuple so the cached value cannot be mutated by callers.
+    """
+    return tuple(LlamaSettings.embed_model.get_query_embedding(query))
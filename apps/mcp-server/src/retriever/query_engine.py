@@ -2,7 +2,7 @@
 QueryEngine - Orchestrates blended retrieval and re-ranking.
 
 This engine uses a blended retrieval approach:
-1. Retrieves from multiple indexes (dense vector, BM25, sparse vector)
+1. Retrieves from multiple indexes (dense vector, BM25 for regulations)
 2. Merges and deduplicates results
 3. Re-ranks with a reranker model
 4. Returns top-k most relevant documents
@@ -14,6 +14,10 @@ Design Philosophy:
 - Configurable: All parameters tunable via settings
 """
 
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import List, Dict, Optional, Literal
 from dataclasses import dataclass
 
@@ -24,8 +28,12 @@ from .retrievers import DenseRetriever, BM25RetrieverWrapper
 from .reranker import Reranker
 from .hyde import HyDEGenerator
 from .context_distillation import create_context_distiller
+from .result_cache import create_result_cache
+from .semantic_cache import create_semantic_cache
 from .filters import normalize_vietnamese_text, filter_by_program_context
 from .formatters import ResultFormatter
+from .program_filter import apply_program_filter
+from ..config.settings import settings
 from ..utils.logger import logger
 
 
@@ -47,10 +55,7 @@ class QueryEngine:
 
     Current support:
     - Dense vector retrieval (OpenAI embeddings)
-
-    Future support (will be automatically included in blended retrieval):
-    - BM25 lexical search
-    - Sparse vector retrieval (SPLADE)
+    - BM25 lexical search (regulation collection)
     """
 
     def __init__(
@@ -64,7 +69,9 @@ class QueryEngine:
         min_score_threshold: float = 0.25,  # Minimum score for initial retrieval
         use_modal: bool = False,  # Use Modal GPU for reranking (faster)
         use_hyde: bool = False,  # Use HyDE (Hypothetical Document Embeddings)
-        hyde_model: str = "gpt-5-nano"  # Model for HyDE generation
+        hyde_model: str = "gpt-5-nano",  # Model for HyDE generation
+        confident_skip_score: float = 0.85,  # Skip reranking above this dense top-1 score...
+        confident_skip_gap: float = 0.15  # ...when it leads the runner-up by this much
     ):
         """
         Initialize QueryEngine.
@@ -81,6 +88,10 @@ class QueryEngine:
             use_modal: Use Modal GPU for reranking (default: False, use local CPU)
             use_hyde: Use HyDE for query expansion (default: False)
             hyde_model: Model for generating hypothetical documents (default: gpt-5-nano)
+            confident_skip_score: Dense top-1 score above which reranking may be skipped
+                                  (default: 0.85, set > 1 to always rerank)
+            confident_skip_gap: Required lead of the dense top-1 over the runner-up
+                                (default: 0.15)
         """
         self.collections = collections
         self.use_reranker = use_reranker
@@ -92,30 +103,37 @@ class QueryEngine:
         self.use_modal = use_modal
         self.use_hyde = use_hyde
         self.hyde_model = hyde_model
+        self.confident_skip_score = confident_skip_score
+        self.confident_skip_gap = confident_skip_gap
 
         # Initialize retrievers
         self.dense_retriever = DenseRetriever(
             similarity_top_k=retrieval_top_k,
             min_score_threshold=min_score_threshold
         )
+        self.dense_retriever.prepare(list(collections.values()))
         self.bm25_retriever = BM25RetrieverWrapper(similarity_top_k=retrieval_top_k)
+        # BM25 runs here while the calling thread does dense retrieval
+        # (a few workers so concurrent batch_retrieve queries don't queue)
+        self._retrieval_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bm25")
 
         # Initialize formatter
         self.formatter = ResultFormatter()
 
         # Initialize reranker if enabled
         if self.use_reranker:
-            from ..config.settings import settings
             self.reranker = Reranker(
                 use_modal=use_modal,
                 reranker_model=self.reranker_model,
                 rerank_score_threshold=rerank_score_threshold,
-                modal_reranker_url=settings.retrieval.MODAL_RERANKER_URL if use_modal else None
+                modal_reranker_url=settings.retrieval.MODAL_RERANKER_URL if use_modal else None,
+                cache_max_entries=settings.retrieval.RERANK_CACHE_MAX_ENTRIES,
+                cache_ttl_seconds=settings.retrieval.RERANK_CACHE_TTL_SECONDS,
+                max_text_chars=settings.retrieval.RERANK_MAX_TEXT_CHARS
             )
 
         # Initialize HyDE generator if enabled
         if self.use_hyde:
-            from ..config.settings import settings
             self.hyde_generator = HyDEGenerator(
                 model=hyde_model,
                 api_key=settings.credentials.OPENAI_API_KEY
@@ -124,12 +142,18 @@ class QueryEngine:
         # Initialize context distiller if enabled
         self.context_distiller = create_context_distiller()
 
+        # Initialize result caches if enabled (exact match, then semantic)
+        self.result_cache = create_result_cache()
+        self.semantic_cache = create_semantic_cache()
+
         logger.info(f"[QUERY ENGINE] Initialized with:")
         logger.info(f"  - Collections: {list(collections.keys())}")
         reranker_mode = "Modal GPU" if use_modal else "Local CPU"
         logger.info(f"  - Reranker: {self.reranker_model if use_reranker else 'disabled'} ({reranker_mode})")
         logger.info(f"  - HyDE: {'enabled' if use_hyde else 'disabled'}")
         logger.info(f"  - Context Distillation: {'enabled' if self.context_distiller else 'disabled'}")
+        logger.info(f"  - Result Cache: {'enabled' if self.result_cache else 'disabled'}")
+        logger.info(f"  - Semantic Cache: {'enabled' if self.semantic_cache else 'disabled'}")
         logger.info(f"  - Retrieval top_k: {retrieval_top_k}")
         logger.info(f"  - Final top_k: {top_k}")
         logger.info(f"  - Min score threshold: {min_score_threshold}")
@@ -174,46 +198,40 @@ class QueryEngine:
         else:
             retrieval_query = original_query
 
-        logger.info(f"\n{'='*70}")
-        logger.info(f"[QUERY ENGINE] Blended Retrieval")
-        logger.info(f"[QUERY ENGINE] Original Query: {original_query}")
+        # One line per request; the detail below is DEBUG and lazily formatted
+        logger.info("[QUERY ENGINE] Blended retrieval (%s): %s", collection_type, original_query)
         if self.use_hyde:
-            logger.info(f"[QUERY ENGINE] HyDE Query: {retrieval_query[:100]}...")
-        logger.info(f"[QUERY ENGINE] Collection: {collection_type}")
-        logger.info(f"{'='*70}\n")
+            logger.debug("[QUERY ENGINE] HyDE Query: %.100s...", retrieval_query)
 
         selected_collection = self.collections[collection_type]
         
-        # Lists to hold candidates from different sources
-        dense_nodes = []
+        # BM25 candidates (regulation only)
         bm25_nodes = []
 
-        # 1. Dense vector retrieval (using HyDE query if enabled)
-        logger.info("[QUERY ENGINE] Retrieving from dense vector index...")
+        # 1 + 2. Dense vector retrieval (using HyDE query if enabled) and BM25
+        # run concurrently: dense waits on the embedding API / ChromaDB, so
+        # BM25 scoring overlaps with it instead of adding to it
+        bm25_future = None
+        if collection_type == "regulation":
+            bm25_future = self._retrieval_pool.submit(self.bm25_retriever.retrieve, retrieval_query)
+
         dense_nodes = self.dense_retriever.retrieve(retrieval_query, selected_collection)
-        logger.info(f"  → Found {len(dense_nodes)} dense nodes")
+        logger.debug("[QUERY ENGINE] Found %d dense nodes", len(dense_nodes))
 
-        # 2. BM25 retrieval
-        if collection_type == "regulation":
-            bm25_nodes = self.bm25_retriever.retrieve(retrieval_query)
-            logger.info(f"  → Found {len(bm25_nodes)} BM25 nodes")
+        if bm25_future is not None:
+            bm25_nodes = bm25_future.result()
+            logger.debug("[QUERY ENGINE] Found %d BM25 nodes", len(bm25_nodes))
 
         # 3. Deduplicate (Union of candidates)
         # We keep the node structure. If a node is in both, it doesn't matter which 'score' we keep
         # because we will overwrite it with the Reranker score anyway.
+        # Single pass: dense nodes come first, so they win over BM25 duplicates.
         combined_nodes_map = {}
-        
-        # Add dense nodes first
-        for node in dense_nodes:
-            combined_nodes_map[node.node.node_id] = node
-            
-        # Add BM25 nodes (if new)
-        for node in bm25_nodes:
-            if node.node.node_id not in combined_nodes_map:
-                combined_nodes_map[node.node.node_id] = node
-        
+        for node in chain(dense_nodes, bm25_nodes):
+            combined_nodes_map.setdefault(node.node.node_id, node)
+
         candidates = list(combined_nodes_map.values())
-        logger.info(f"\n[QUERY ENGINE] Total unique candidates for reranking: {len(candidates)}")
+        logger.debug("[QUERY ENGINE] Total unique candidates for reranking: %d", len(candidates))
 
         # 3.5 Apply Program Context Filter (Chính quy vs Từ xa)
         # This is critical to avoid mixing regulations from different systems
@@ -221,7 +239,15 @@ class QueryEngine:
 
         # 4. Rerank (IMPORTANT: Use ORIGINAL query for reranking, not HyDE query)
         should_rerank = use_reranker if use_reranker is not None else self.use_reranker
-        
+
+        if should_rerank and not bm25_nodes and self._is_confident(candidates):
+            # Dense-only candidates with a clear winner: the cross-encoder
+            # would not change the answer, so skip the reranker round-trip
+            # (scores are all cosine here, so they stay comparable)
+            logger.info("[QUERY ENGINE] Confident dense top-1, skipping reranker")
+            candidates = apply_program_filter(original_query, candidates)
+            should_rerank = False
+
         if should_rerank and candidates:
             # Pass ALL candidates to reranker (don't pre-filter by raw score)
             # Use original query for reranking (not hypothetical doc)
@@ -230,17 +256,18 @@ class QueryEngine:
         else:
             # If no reranker, we have a problem merging scores.
             # For now, fallback to just dense nodes or naive sort if forced.
-            logger.warning("[WARNING] Reranker disabled in Hybrid mode. Scores are not comparable.")
+            if bm25_nodes:
+                logger.warning("[WARNING] Reranker disabled in Hybrid mode. Scores are not comparable.")
             # Fallback: Prioritize Dense nodes, append unique BM25 nodes
             # (Assuming Vector is generally better than BM25 for ranking)
-            candidates.sort(key=lambda x: x.score, reverse=True) 
-            top_nodes = candidates
+            # Only top_k survive step 5, so select them without sorting everything
+            top_nodes = heapq.nlargest(self.top_k, candidates, key=lambda x: x.score)
             reranked = False
 
         # 5. Final top-k selection
         final_nodes = top_nodes[:self.top_k]
 
-        logger.info(f"[QUERY ENGINE] Final result: {len(final_nodes)} nodes (reranked: {reranked})\n")
+        logger.info("[QUERY ENGINE] Final result: %d nodes (reranked: %s)", len(final_nodes), reranked)
 
         return RetrievalResult(
             nodes=final_nodes,
@@ -250,6 +277,14 @@ class QueryEngine:
             final_count=len(final_nodes)
         )
 
+    def _is_confident(self, nodes: List[NodeWithScore]) -> bool:
+        """Whether the best node clearly outscores the rest (reranking is moot)."""
+        if len(nodes) < 2:
+            return False
+
+        first, second = heapq.nlargest(2, (node.score for node in nodes))
+        return first >= self.confident_skip_score and first - second >= self.confident_skip_gap
+
     def _rerank(self, query: str, nodes: List[NodeWithScore]) -> List[NodeWithScore]:
         """
         Rerank nodes using Reranker component.
@@ -290,6 +325,25 @@ class QueryEngine:
             Errors in distillation are caught and logged, falling back to raw chunks.
         """
         try:
+            # Serve repeated queries from the exact-match cache (no embedding call)
+            if self.result_cache:
+                cached = self.result_cache.get(query, collection_type)
+                if cached is not None:
+                    # Cached under the normalized key; echo this caller's wording
+                    cached["query"] = query
+                    return cached
+
+            # Serve near-duplicate queries from the semantic cache. Embeds the
+            # same text dense retrieval uses, so (without HyDE) a miss reuses
+            # the memoized embedding instead of a second API call
+            query_embedding = None
+            semantic_query = normalize_vietnamese_text(query)
+            if self.semantic_cache:
+                cached, query_embedding = self.semantic_cache.lookup(semantic_query, collection_type)
+                if cached is not None:
+                    cached["query"] = query
+                    return cached
+
             # Retrieve nodes using existing pipeline
             result = self._retrieve(query, collection_type=collection_type)
             
@@ -308,13 +362,22 @@ class QueryEngine:
                     logger.error(f"[QUERY ENGINE] Context distillation failed: {e}")
                     # Continue without distilled context - formatted_result is still valid
                     logger.info("[QUERY ENGINE] Continuing with raw chunks only")
+
+            if formatted_result.get('documents'):
+                if self.result_cache:
+                    self.result_cache.put(query, collection_type, formatted_result)
+                if self.semantic_cache:
+                    self.semantic_cache.store(
+                        semantic_query, query_embedding, collection_type, formatted_result
+                    )
             
             return formatted_result
             
         except Exception as e:
-            logger.error(f"[QUERY ENGINE] Retrieval failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(
+                f"[QUERY ENGINE] Retrieval failed: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             # Return minimal valid response to prevent tool call hanging
             return {
                 'query': query,
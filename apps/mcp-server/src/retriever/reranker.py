@@ -4,11 +4,14 @@ Reranker component for QueryEngine.
 Supports both local CPU and Modal GPU reranking with ViRanker (Vietnamese reranking model).
 """
 
+import logging
 from typing import List
 
+import requests
 from llama_index.core.schema import NodeWithScore
 
 from .program_filter import apply_program_filter
+from .ttl_cache import TTLCache
 from ..utils.logger import logger
 
 
@@ -26,7 +29,10 @@ class Reranker:
         use_modal: bool = True,
         reranker_model: str = "namdp-ptit/ViRanker",
         rerank_score_threshold: float = 0.1,
-        modal_reranker_url: str = None
+        modal_reranker_url: str = None,
+        cache_max_entries: int = 4096,
+        cache_ttl_seconds: float = 0,
+        max_text_chars: int = 3072
     ):
         """
         Initialize Reranker.
@@ -36,11 +42,23 @@ class Reranker:
             reranker_model: Model name (for logging)
             rerank_score_threshold: Minimum score threshold after reranking
             modal_reranker_url: Modal HTTP endpoint URL
+            cache_max_entries: Max cached (query, candidate set) score maps
+            cache_ttl_seconds: Score cache TTL (0 = no caching)
+            max_text_chars: Texts are cut to this many characters before being
+                            sent (0 = no limit). The reranker only reads the first
+                            512 tokens, so the default keeps all of those.
         """
         self.use_modal = use_modal
         self.reranker_model = reranker_model
         self.rerank_score_threshold = rerank_score_threshold
         self.modal_reranker_url = modal_reranker_url
+        self.max_text_chars = max_text_chars
+
+        # (query, sorted node ids) -> {node_id: score}
+        self._score_cache = (
+            TTLCache(max_items=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+            if cache_ttl_seconds > 0 else None
+        )
 
         if use_modal:
             self._setup_modal()
@@ -85,16 +103,36 @@ class Reranker:
         if not nodes:
             return []
 
-        logger.info(f"[RERANKER] Reranking {len(nodes)} nodes with ViRanker...")
+        logger.debug("[RERANKER] Reranking %d nodes with ViRanker...", len(nodes))
 
-        # Prepare texts for reranker
-        texts = [node.node.get_content() for node in nodes]
+        # Same query + same candidates (retries, bursts of one FAQ) -> reuse scores
+        scores = None
+        cache_key = None
+        if self._score_cache is not None:
+            cache_key = (query, tuple(sorted(node.node.node_id for node in nodes)))
+            cached = self._score_cache.get(cache_key)
+            if cached is not None:
+                logger.info("[RERANKER] Score cache hit")
+                scores = [cached[node.node.node_id] for node in nodes]
 
-        # Get reranker scores
-        if self.use_modal:
-            scores = self._rerank_modal(query, texts)
-        else:
-            scores = self._rerank_local(query, texts)
+        if scores is None:
+            # Prepare texts for reranker; the tail beyond max_length tokens is
+            # dropped by the tokenizer anyway, so don't ship or tokenize it
+            texts = [node.node.get_content() for node in nodes]
+            if self.max_text_chars:
+                texts = [text[:self.max_text_chars] for text in texts]
+
+            # Get reranker scores
+            if self.use_modal:
+                scores = self._rerank_modal(query, texts)
+            else:
+                scores = self._rerank_local(query, texts)
+
+            if scores is not None and cache_key is not None:
+                self._score_cache.set(
+                    cache_key,
+                    {node.node.node_id: float(score) for node, score in zip(nodes, scores)}
+                )
 
         # Handle case where reranking failed
         if scores is None:
@@ -108,29 +146,53 @@ class Reranker:
         nodes.sort(key=lambda x: x.score, reverse=True)
 
         # Log top 3 scores
-        logger.info(f"[RERANKER] Top 3 scores:")
-        for i, node in enumerate(nodes[:3]):
-            doc_id = node.node.metadata.get('document_id', 'unknown')
-            logger.info(f"  {i+1}. Score: {node.score:.4f} | Doc: {doc_id[:60]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[RERANKER] Top 3 scores:")
+            for i, node in enumerate(nodes[:3]):
+                doc_id = node.node.metadata.get('document_id', 'unknown')
+                logger.debug("  %d. Score: %.4f | Doc: %.60s...", i + 1, node.score, doc_id)
 
         # Filter out low-confidence results
         filtered_nodes = [node for node in nodes if node.score >= self.rerank_score_threshold]
 
         if len(filtered_nodes) < len(nodes):
-            logger.info(f"[RERANKER] Filtered {len(nodes) - len(filtered_nodes)} low-confidence results (score < {self.rerank_score_threshold})")
+            logger.debug(
+                "[RERANKER] Filtered %d low-confidence results (score < %s)",
+                len(nodes) - len(filtered_nodes), self.rerank_score_threshold
+            )
 
         # Always return at least top-1 chunk if no chunks pass threshold
         if len(filtered_nodes) == 0 and len(nodes) > 0:
-            logger.info(f"[RERANKER] No results passed threshold ({self.rerank_score_threshold}), returning top-1 chunk (score: {nodes[0].score:.4f})")
+            logger.info(
+                "[RERANKER] No results passed threshold (%s), returning top-1 chunk (score: %.4f)",
+                self.rerank_score_threshold, nodes[0].score
+            )
             filtered_nodes = [nodes[0]]
         elif len(filtered_nodes) > 0:
-            logger.info(f"[RERANKER] Reranking complete. Top score: {filtered_nodes[0].score:.4f}, kept {len(filtered_nodes)}/{len(nodes)} nodes")
+            logger.info(
+                "[RERANKER] Reranking complete. Top score: %.4f, kept %d/%d nodes",
+                filtered_nodes[0].score, len(filtered_nodes), len(nodes)
+            )
 
         # Apply program-based filtering to avoid confusion between similar majors
         filtered_nodes = apply_program_filter(query, filtered_nodes)
 
         return filtered_nodes
 
+    def warmup(self):
+        """
+        Send a tiny request so the Modal container is up before the first query.
+
+        Meant to run in a background thread at startup; failures are only logged.
+        """
+        if not self.use_modal:
+            return
+
+        logger.info("[RERANKER] Warming up Modal endpoint...")
+        scores = self._rerank_modal("warmup", ["warmup"])
+        if scores is not None:
+            logger.info("[RERANKER] ✓ Modal endpoint warm")
+
     def _rerank_modal(self, query: str, texts: List[str]) -> List[float]:
         """
         Rerank using Modal GPU endpoint.
@@ -142,11 +204,9 @@ class Reranker:
         Returns:
             List of reranker scores (or None if failed)
         """
-        logger.info(f"[RERANKER] Using Modal GPU (this may take 10-60s on cold start)...")
+        logger.debug("[RERANKER] Using Modal GPU (this may take 10-60s on cold start)...")
 
         try:
-            import requests
-
             # Call HTTP endpoint with longer timeout for cold start
             response = requests.post(
                 self.modal_reranker_url,
@@ -159,7 +219,7 @@ class Reranker:
             )
             response.raise_for_status()
             scores = response.json()["scores"]
-            logger.info(f"[RERANKER] Modal GPU reranking completed")
+            logger.debug("[RERANKER] Modal GPU reranking completed")
             return scores
 
         except requests.exceptions.Timeout:
@@ -0,0 +1,70 @@
+"""
+Exact-match cache for retrieval results.
+
+Sits in front of the semantic cache: a query whose normalized form
+(see normalize_query_key) was answered recently for the same collection is
+served without embedding it, searching, reranking or distilling again.
+
+Entries are bounded (least recently used evicted first) and expire after a
+TTL so re-indexed documents show up without a restart.
+"""
+
+import copy
+from typing import Dict, Optional
+
+from .filters import normalize_query_key
+from .ttl_cache import TTLCache
+from ..config.settings import settings
+from ..utils.logger import logger
+
+
+class ResultCache:
+    """
+    In-memory LRU + TTL cache keyed by (collection, normalized query).
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600):
+        """
+        Initialize ResultCache.
+
+        Args:
+            max_entries: Max cached queries across all collections
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        # (collection, normalized query) -> result
+        self._entries = TTLCache(max_items=max_entries, ttl_seconds=ttl_seconds)
+
+        logger.info(f"[RESULT CACHE] Initialized (max_entries={max_entries}, ttl={ttl_seconds}s)")
+
+    def get(self, query: str, collection_type: str) -> Optional[Dict]:
+        """Return a cached result for this exact (normalized) query, if fresh."""
+        result = self._entries.get((collection_type, normalize_query_key(query)))
+        if result is None:
+            return None
+
+        logger.info("[RESULT CACHE] Hit")
+        # Callers may mutate the result (e.g. add distilled_context)
+        return copy.deepcopy(result)
+
+    def put(self, query: str, collection_type: str, result: Dict) -> None:
+        """Cache a structured retrieval result."""
+        self._entries.set((collection_type, normalize_query_key(query)), copy.deepcopy(result))
+
+
+def create_result_cache() -> Optional[ResultCache]:
+    """
+    Factory function to create the exact-match result cache.
+
+    Returns:
+        ResultCache instance or None if disabled
+    """
+    if not settings.retrieval.USE_RESULT_CACHE:
+        return None
+
+    return ResultCache(
+        max_entries=settings.retrieval.RESULT_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.retrieval.RESULT_CACHE_TTL_SECONDS,
+    )
@@ -3,8 +3,7 @@ Retrieval components for QueryEngine.
 
 Contains all retrieval implementations:
 - DenseRetriever: Vector similarity search
-- BM25Retriever: Lexical keyword search
-- SparseRetriever: SPLADE (future)
+- BM25RetrieverWrapper: Lexical keyword search
 """
 
 import json
@@ -12,9 +11,10 @@ from pathlib import Path
 from typing import List, Optional
 
 from llama_index.core import VectorStoreIndex
-from llama_index.core.schema import NodeWithScore, TextNode
+from llama_index.core.schema import NodeWithScore, QueryBundle, TextNode
 from llama_index.retrievers.bm25 import BM25Retriever
 
+from .query_embedding import get_query_embedding
 from ..utils.logger import logger
 
 
@@ -39,6 +39,9 @@ class DenseRetriever:
         """
         self.similarity_top_k = similarity_top_k
         self.min_score_threshold = min_score_threshold
+        # id(collection) -> (collection, retriever); the index is kept alive
+        # alongside its retriever so the id cannot be reused
+        self._retrievers = {}
         logger.info(f"[DENSE RETRIEVER] Initialized (top_k={similarity_top_k}, min_score={min_score_threshold})")
 
     def retrieve(
@@ -56,10 +59,11 @@ class DenseRetriever:
         Returns:
             List of retrieved nodes with scores
         """
-        logger.info(f"[DENSE RETRIEVER] Querying vector index...")
-        retriever = collection.as_retriever(similarity_top_k=self.similarity_top_k)
-        nodes = retriever.retrieve(query)
-        logger.info(f"[DENSE RETRIEVER] Found {len(nodes)} nodes")
+        retriever = self._get_retriever(collection)
+        # Pass the (memoized) embedding so the retriever doesn't embed again
+        query_bundle = QueryBundle(query_str=query, embedding=list(get_query_embedding(query)))
+        nodes = retriever.retrieve(query_bundle)
+        logger.debug("[DENSE RETRIEVER] Found %d nodes", len(nodes))
 
         # Filter by minimum score threshold
         filtered_nodes = [
@@ -68,10 +72,33 @@ class DenseRetriever:
         ]
 
         if len(filtered_nodes) < len(nodes):
-            logger.info(f"[DENSE RETRIEVER] Filtered {len(nodes) - len(filtered_nodes)} nodes (score < {self.min_score_threshold})")
+            logger.debug(
+                "[DENSE RETRIEVER] Filtered %d nodes (score < %s)",
+                len(nodes) - len(filtered_nodes), self.min_score_threshold
+            )
 
         return filtered_nodes
 
+    def prepare(self, collections: List[VectorStoreIndex]) -> None:
+        """
+        Build the retrievers for all collections up front.
+
+        Keeps retriever construction off the first request of each collection
+        and avoids concurrent first requests (batch_retrieve) building it twice.
+        """
+        for collection in collections:
+            self._get_retriever(collection)
+
+    def _get_retriever(self, collection: VectorStoreIndex):
+        """Return the retriever for a collection, building it on first use."""
+        cached = self._retrievers.get(id(collection))
+        if cached is not None:
+            return cached[1]
+
+        retriever = collection.as_retriever(similarity_top_k=self.similarity_top_k)
+        self._retrievers[id(collection)] = (collection, retriever)
+        return retriever
+
 
 class BM25RetrieverWrapper:
     """
@@ -143,26 +170,28 @@ class BM25RetrieverWrapper:
             try:
                 with open(cf, "r", encoding="utf-8") as f:
                     chunks = json.load(f)
-                    for chunk in chunks:
-                        text = chunk.get("text", "")
-                        metadata = chunk.get("metadata", {})
-
-                        # Add doc_id to metadata if present
-                        if "doc_id" in chunk:
-                            metadata["document_id"] = chunk["doc_id"]
-
-                        node = TextNode(
-                            text=text,
-                            metadata=metadata,
-                            id_=chunk.get("id") or chunk.get("chunk_id")
-                        )
-                        nodes.append(node)
+                nodes.extend([self._chunk_to_node(chunk) for chunk in chunks])
             except Exception as e:
                 logger.warning(f"[BM25 RETRIEVER] Error reading {cf}: {e}")
                 continue
 
         return nodes
 
+    @staticmethod
+    def _chunk_to_node(chunk: dict) -> TextNode:
+        """Build a TextNode from one serialized chunk in chunks.json."""
+        metadata = chunk.get("metadata", {})
+
+        # Add doc_id to metadata if present
+        if "doc_id" in chunk:
+            metadata["document_id"] = chunk["doc_id"]
+
+        return TextNode(
+            text=chunk.get("text", ""),
+            metadata=metadata,
+            id_=chunk.get("id") or chunk.get("chunk_id")
+        )
+
     def retrieve(self, query: str) -> List[NodeWithScore]:
         """
         Retrieve using BM25 lexical search.
@@ -176,22 +205,6 @@ class BM25RetrieverWrapper:
         if not self.retriever:
             return []
 
-        logger.info(f"[BM25 RETRIEVER] Querying BM25 index...")
         nodes = self.retriever.retrieve(query)
-        logger.info(f"[BM25 RETRIEVER] Found {len(nodes)} nodes")
+        logger.debug("[BM25 RETRIEVER] Found %d nodes", len(nodes))
         return nodes
-
-
-class SparseRetriever:
-    """
-    Sparse vector retriever (SPLADE).
-
-    TODO: Implement SPLADE retrieval.
-    """
-
-    def __init__(self):
-        logger.info("[SPARSE RETRIEVER] Not implemented yet")
-
-    def retrieve(self, query: str) -> List[NodeWithScore]:
-        """Retrieve using sparse vectors (SPLADE)."""
-        return []
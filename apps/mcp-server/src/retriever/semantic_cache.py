@@ -0,0 +1,172 @@
+"""
+Semantic cache for retrieval results.
+
+Students ask the same FAQ-style questions over and over, phrased slightly
+differently ("điều kiện tốt nghiệp là gì?" vs "điều kiện để tốt nghiệp?").
+Each one normally pays for HyDE, vector search, BM25, Modal reranking and
+(optionally) context distillation.
+
+How it works:
+1. Embed the incoming query (memoized, shared with the dense retriever)
+2. Compare against cached query embeddings of the same collection and scope
+   (cosine); the scope is the program, years and program type the query
+   names, so "KHMT năm 2023" never gets the answer cached for "KHMT năm 2025"
+3. Above the similarity threshold -> return the cached structured result
+4. Otherwise run the pipeline and store (embedding, scope, result)
+
+Entries are bounded (oldest evicted first) and expire after a TTL so
+re-indexed documents show up without a restart.
+"""
+
+import copy
+import re
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .program_filter import extract_program_from_query
+from .query_embedding import get_query_embedding
+from ..config.settings import settings
+from ..utils.logger import logger
+
+
+# Years ("2023") and cohorts ("khóa 17", "K17") pick a curriculum version
+_YEAR_RE = re.compile(r"\b((?:19|20)\d{2})\b|\bk(?:h(?:óa|oá|oa)\s*)?(\d{1,2})\b")
+
+# Program-type keywords; each one selects a different set of documents
+PROGRAM_CONTEXT_KEYWORDS = (
+    "chính quy",
+    "từ xa",
+    "tiên tiến",
+    "chất lượng cao",
+    "văn bằng 2",
+    "liên thông",
+)
+
+
+def query_scope(query: str) -> Tuple:
+    """
+    What a query is specifically about, beyond its topic.
+
+    Embeddings of "môn học ngành KHMT năm 2023" and "... năm 2025" are nearly
+    identical, but their answers are not; a cached result is only reused for
+    a query with the same scope.
+
+    Returns:
+        (program slug or None, sorted years/cohorts, sorted program types)
+    """
+    query_lower = query.lower()
+    years = sorted({year or f"k{cohort}" for year, cohort in _YEAR_RE.findall(query_lower)})
+    program_types = sorted(keyword for keyword in PROGRAM_CONTEXT_KEYWORDS if keyword in query_lower)
+    return extract_program_from_query(query), tuple(years), tuple(program_types)
+
+
+class SemanticCache:
+    """
+    In-memory nearest-neighbour cache keyed by query embeddings.
+
+    One bucket per collection, so a regulation answer is never served for a
+    curriculum query, and only entries with the same query_scope() are
+    compared. Lookups are a single matrix-vector product over at most
+    `max_entries` embeddings.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600
+    ):
+        """
+        Initialize SemanticCache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a hit
+            max_entries: Max cached queries per collection
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        # collection -> deque of (unit embedding, scope, result, created_at)
+        self._buckets: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"[SEMANTIC CACHE] Initialized (threshold={similarity_threshold}, "
+            f"max_entries={max_entries}, ttl={ttl_seconds}s)"
+        )
+
+    @staticmethod
+    def _embed(query: str) -> np.ndarray:
+        """Embed and L2-normalize a query so cosine similarity is a dot product."""
+        embedding = np.asarray(get_query_embedding(query), dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else embedding
+
+    def lookup(self, query: str, collection_type: str):
+        """
+        Find a cached result for a semantically equivalent query.
+
+        Returns:
+            (result or None, query embedding) - pass the embedding to store()
+            on a miss to avoid embedding the query twice.
+        """
+        embedding = self._embed(query)
+        scope = query_scope(query)
+
+        with self._lock:
+            bucket = self._buckets.get(collection_type)
+            if not bucket:
+                return None, embedding
+
+            # Drop expired entries (oldest are on the left)
+            cutoff = time.monotonic() - self.ttl_seconds
+            while bucket and bucket[0][3] < cutoff:
+                bucket.popleft()
+
+            candidates = [entry for entry in bucket if entry[1] == scope]
+            if not candidates:
+                return None, embedding
+
+            matrix = np.stack([entry[0] for entry in candidates])
+            similarities = matrix @ embedding
+            best = int(np.argmax(similarities))
+            best_score = float(similarities[best])
+            result = candidates[best][2] if best_score >= self.similarity_threshold else None
+
+        if result is None:
+            logger.info(f"[SEMANTIC CACHE] Miss (best similarity: {best_score:.4f})")
+            return None, embedding
+
+        logger.info(f"[SEMANTIC CACHE] Hit (similarity: {best_score:.4f})")
+        # Callers may mutate the result (e.g. add distilled_context)
+        return copy.deepcopy(result), embedding
+
+    def store(self, query: str, query_embedding: np.ndarray, collection_type: str, result: Dict):
+        """Cache a structured retrieval result under its query embedding and scope."""
+        scope = query_scope(query)
+        with self._lock:
+            bucket = self._buckets.setdefault(collection_type, deque(maxlen=self.max_entries))
+            bucket.append((query_embedding, scope, copy.deepcopy(result), time.monotonic()))
+
+
+def create_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Factory function to create the semantic cache.
+
+    Returns:
+        SemanticCache instance or None if disabled
+    """
+    if not settings.retrieval.USE_SEMANTIC_CACHE:
+        return None
+
+    return SemanticCache(
+        similarity_threshold=settings.retrieval.SEMANTIC_CACHE_THRESHOLD,
+        max_entries=settings.retrieval.SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.retrieval.SEMANTIC_CACHE_TTL_SECONDS,
+    )
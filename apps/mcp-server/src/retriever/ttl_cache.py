@@ -0,0 +1,57 @@
+"""
+Small thread-safe LRU + TTL cache.
+
+Shared building block for the in-process caches of the retrieval pipeline
+(result cache, reranker score cache). Retrieval runs in worker threads
+(asyncio.to_thread), hence the lock.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    OrderedDict-backed cache: least recently used entries are evicted first,
+    entries older than `ttl_seconds` are treated as missing.
+    """
+
+    def __init__(self, max_items: int = 1024, ttl_seconds: float = 3600):
+        """
+        Initialize TTLCache.
+
+        Args:
+            max_items: Max entries kept
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+
+        # key -> (value, created_at)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_items:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
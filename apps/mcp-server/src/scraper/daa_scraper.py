@@ -3,6 +3,10 @@ Simple scraper for daa.uit.edu.vn student portal.
 Uses BeautifulSoup for reliable HTML parsing.
 """
 
+import asyncio
+import json
+import re
+
 from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, BrowserConfig
 from playwright.async_api import async_playwright
 from src.scraper.models.exams import ExamSchedule
@@ -20,6 +24,7 @@ class DaaScraper:
     Features:
     - Cookie-based authentication (recommended) or username/password login
     - Session management (reuse browser for multiple requests)
+    - Cookie mode shares one browser process across instances
     - BeautifulSoup HTML parsing (reliable DOM-based)
     - Pydantic validation
 
@@ -39,6 +44,61 @@ class DaaScraper:
     GRADES_URL = f"{BASE_URL}/sinhvien/kqhoctap"
     EXAMS_URL = f"{BASE_URL}/sinhvien/lichhoc/lichthi"
 
+    # Crawl4AI session opened by _login(); page fetches must reuse it, since
+    # only that page carries the authenticated browser state.
+    LOGIN_SESSION = "daa_session"
+
+    # Cookie-auth browsers are shared across scraper instances (one per
+    # headless mode); each instance only gets its own isolated context.
+    # All of it is bound to the event loop that launched it; see _shared_guard().
+    _shared_playwright = None
+    _shared_browsers: dict = {}
+    _shared_lock: asyncio.Lock | None = None
+    _shared_loop = None
+
+    # HTML sniffing: one case-insensitive pass over the raw page, no .lower() copy
+    _LOGGED_IN_RE = re.compile(r'đăng xuất|logout', re.IGNORECASE)
+    _LOGIN_FORM_RE = re.compile(r'edit-name', re.IGNORECASE)
+
+    # Login script (constant). Reads credentials from window.__daaCreds.
+    _LOGIN_JS = """
+    (async () => {
+        const creds = window.__daaCreds || {};
+        delete window.__daaCreds;
+
+        // Fill credentials
+        let nameInput = document.querySelector('#edit-name') || document.querySelector('input[name="name"]');
+        if (nameInput) nameInput.value = creds.username;
+
+        let passInput = document.querySelector('input[name="pass"]') || document.querySelector('input[type="password"]');
+        if (passInput) passInput.value = creds.password;
+
+        // Solve CAPTCHA (extract answer from label)
+        let captchaLabel = document.querySelector('label[for="edit-english-captcha-answer"]');
+        if (captchaLabel) {
+            let questionText = captchaLabel.textContent || captchaLabel.innerText;
+            let match = questionText.match(/\\(([^)]+)\\)/);
+            if (match && match[1]) {
+                let answer = match[1].trim();
+                let captchaInput = document.querySelector('#edit-english-captcha-answer');
+                if (captchaInput) {
+                    captchaInput.value = answer;
+                    captchaInput.dispatchEvent(new Event('input', { bubbles: true }));
+                }
+            }
+        }
+
+        // Small delay then submit
+        await new Promise(r => setTimeout(r, 500));
+
+        let submitBtn = document.querySelector('#edit-submit') || document.querySelector('input[type="submit"]');
+        if (submitBtn) {
+            submitBtn.click();
+        }
+        // Don't wait here - let the page navigate naturally
+    })();
+    """
+
     def __init__(
         self,
         cookie: str | None = None,
@@ -67,7 +127,6 @@ class DaaScraper:
         self._use_cookie_auth = cookie is not None
 
         # For cookie-based auth, use Playwright directly
-        self._playwright = None
         self._browser = None
         self._context = None
         self._page = None
@@ -92,16 +151,63 @@ class DaaScraper:
         if self.crawler:
             await self.crawler.__aexit__(*args)
 
-        # Close Playwright resources
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        # Close this scraper's context only; the browser is shared
+        if self._context:
+            await self._context.close()
+            self._context = None
+            self._page = None
+
+    @classmethod
+    def _shared_guard(cls) -> asyncio.Lock:
+        """
+        Return the lock guarding the shared browser, created for the running loop.
+
+        A lock (and a Playwright driver) can only be used from the loop it was
+        created on. If the loop has changed since the browser was launched,
+        the old handles are unusable, so drop them and start over.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._shared_loop is not loop:
+            if cls._shared_loop is not None:
+                logger.warning("[DaaScraper] Event loop changed, discarding shared browser")
+            cls._shared_playwright = None
+            cls._shared_browsers = {}
+            cls._shared_lock = asyncio.Lock()
+            cls._shared_loop = loop
+        return cls._shared_lock
+
+    @classmethod
+    async def _get_shared_browser(cls, headless: bool):
+        """Launch the shared Chromium instance on first use (or after a crash)."""
+        async with cls._shared_guard():
+            browser = cls._shared_browsers.get(headless)
+            if browser is not None and browser.is_connected():
+                return browser
+
+            if cls._shared_playwright is None:
+                cls._shared_playwright = await async_playwright().start()
+
+            browser = await cls._shared_playwright.chromium.launch(headless=headless)
+            cls._shared_browsers[headless] = browser
+            logger.info(f"[DaaScraper] Launched shared browser (headless={headless})")
+            return browser
+
+    @classmethod
+    async def close_shared_browser(cls):
+        """Close shared Playwright resources (call on server shutdown)."""
+        async with cls._shared_guard():
+            for browser in cls._shared_browsers.values():
+                if browser.is_connected():
+                    await browser.close()
+            cls._shared_browsers.clear()
+
+            if cls._shared_playwright is not None:
+                await cls._shared_playwright.stop()
+                cls._shared_playwright = None
 
     async def _init_playwright(self):
-        """Initialize Playwright browser for cookie-based auth."""
-        self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        """Open an isolated context on the shared browser for cookie-based auth."""
+        self._browser = await self._get_shared_browser(self.headless)
         self._context = await self._browser.new_context()
         self._page = await self._context.new_page()
 
@@ -139,7 +245,7 @@ class DaaScraper:
 
         # Check if logged in
         content = await self._page.content()
-        if "đăng xuất" in content.lower() or "logout" in content.lower():
+        if self._LOGGED_IN_RE.search(content):
             self._is_logged_in = True
             logger.info(f"[DaaScraper] ✅ Cookie auth successful - {len(cookies)} cookies injected")
         else:
@@ -159,48 +265,18 @@ class DaaScraper:
         4. Verify login success after navigation completes
         """
         # Fill form and submit in ONE go
-        # Don't wait for navigation in JS - let Crawl4AI handle it
-        js_code = f"""
-        (async () => {{
-            // Fill credentials
-            let nameInput = document.querySelector('#edit-name') || document.querySelector('input[name="name"]');
-            if (nameInput) nameInput.value = '{self.username}';
-
-            let passInput = document.querySelector('input[name="pass"]') || document.querySelector('input[type="password"]');
-            if (passInput) passInput.value = '{self.password}';
-
-            // Solve CAPTCHA (extract answer from label)
-            let captchaLabel = document.querySelector('label[for="edit-english-captcha-answer"]');
-            if (captchaLabel) {{
-                let questionText = captchaLabel.textContent || captchaLabel.innerText;
-                let match = questionText.match(/\\(([^)]+)\\)/);
-                if (match && match[1]) {{
-                    let answer = match[1].trim();
-                    let captchaInput = document.querySelector('#edit-english-captcha-answer');
-                    if (captchaInput) {{
-                        captchaInput.value = answer;
-                        captchaInput.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                    }}
-                }}
-            }}
-
-            // Small delay then submit
-            await new Promise(r => setTimeout(r, 500));
-
-            let submitBtn = document.querySelector('#edit-submit') || document.querySelector('input[type="submit"]');
-            if (submitBtn) {{
-                submitBtn.click();
-            }}
-            // Don't wait here - let the page navigate naturally
-        }})();
-        """
+        # Don't wait for navigation in JS - let Crawl4AI handle it.
+        # Credentials are passed as JSON data (not spliced into JS source), so
+        # the login script itself stays constant across calls.
+        creds = json.dumps({"username": self.username, "password": self.password})
+        js_code = [f"window.__daaCreds = {creds};", self._LOGIN_JS]
 
         # Execute with wait_for to handle navigation
         result = await self.crawler.arun(
             url=self.LOGIN_URL,
             config=CrawlerRunConfig(
                 js_code=js_code,
-                session_id="daa_session",
+                session_id=self.LOGIN_SESSION,
                 wait_for="js:() => !window.location.href.includes('/user/login')",
                 page_timeout=60000,  # Increased timeout for navigation
                 delay_before_return_html=2.0
@@ -208,7 +284,7 @@ class DaaScraper:
         )
 
         # Check if login successful
-        if "đăng xuất" in result.html.lower() or "logout" in result.html.lower():
+        if self._LOGGED_IN_RE.search(result.html):
             self._is_logged_in = True
         else:
             raise Exception("DAA login failed - check credentials or CAPTCHA logic")
@@ -227,7 +303,7 @@ class DaaScraper:
             current_url = self._page.url
 
             # Check if session expired
-            if 'edit-name' in html.lower() or 'user/login' in current_url.lower():
+            if self._LOGIN_FORM_RE.search(html) or 'user/login' in current_url.lower():
                 raise Exception("Session expired - cookie may be invalid or expired")
 
             return html
@@ -236,7 +312,7 @@ class DaaScraper:
             result = await self.crawler.arun(
                 url=url,
                 config=CrawlerRunConfig(
-                    session_id="daa_session",
+                    session_id=self.LOGIN_SESSION,
                     delay_before_return_html=2.0
                 )
             )
@@ -244,11 +320,11 @@ class DaaScraper:
             if not result.success:
                 raise Exception(f"Failed to fetch {url}: {result.error_message}")
 
-            if 'edit-name' in result.html.lower() or 'user/login' in result.url.lower():
+            if self._LOGIN_FORM_RE.search(result.html) or 'user/login' in result.url.lower():
                 raise Exception("Session expired - need to re-login")
 
             return result.html
-    
+
     async def get_schedule(self) -> Schedule:
         """
         Get student schedule.
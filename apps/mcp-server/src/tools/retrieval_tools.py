@@ -3,6 +3,11 @@ MCP tools for document retrieval from UIT knowledge base.
 """
 
 import asyncio
+import json
+import logging
+import threading
+from typing import List, Literal
+
 import chromadb
 from fastmcp import FastMCP
 from fastmcp.tools.tool import ToolResult
@@ -12,6 +17,7 @@ from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.core import Settings as LlamaSettings
 
 from ..config.settings import settings
+from ..retriever.filters import normalize_query_key
 from ..retriever.query_engine import QueryEngine
 from ..retriever.schemas import RegulationRetrievalResult, CurriculumRetrievalResult
 from ..utils.logger import logger
@@ -28,6 +34,7 @@ def _init_query_engine() -> QueryEngine:
     LlamaSettings.embed_model = OpenAIEmbedding(
         model=settings.retrieval.EMBED_MODEL,
         api_key=settings.credentials.OPENAI_API_KEY,
+        dimensions=settings.retrieval.EMBED_DIMENSIONS,
     )
 
     # Load ChromaDB collections
@@ -53,18 +60,83 @@ def _init_query_engine() -> QueryEngine:
         hyde_model=settings.retrieval.HYDE_MODEL,
     )
 
+    # Start the reranker's cold start now, off the request path
+    if query_engine.use_reranker:
+        threading.Thread(
+            target=query_engine.reranker.warmup, name="reranker-warmup", daemon=True
+        ).start()
+
     logger.info(
         f"[RETRIEVAL TOOLS] QueryEngine initialized with {len(collections)} collections"
     )
     return query_engine
 
 
+# Max sub-queries of one batch_retrieve call running at the same time
+BATCH_MAX_CONCURRENT = 4
+
+# Max queries accepted by batch_retrieve
+BATCH_MAX_QUERIES = 8
+
+_RESULT_MODELS = {
+    "regulation": RegulationRetrievalResult,
+    "curriculum": CurriculumRetrievalResult,
+}
+
+
+# Compact JSON for tool content: the agent LLM reads it, indentation only costs tokens
+_JSON_SEPARATORS = (",", ":")
+
+
+def _to_tool_result(result_model) -> ToolResult:
+    """
+    Build a ToolResult from a validated retrieval result.
+
+    The model is dumped once; the same dict backs the JSON text (for LangChain)
+    and the structured content (for MCP Inspector).
+    """
+    result = result_model.model_dump()
+    return ToolResult(
+        content=json.dumps(result, ensure_ascii=False, separators=_JSON_SEPARATORS),
+        structured_content=result,
+    )
+
+
 def register_retrieval_tools(mcp: FastMCP):
     """Register retrieval tools to FastMCP instance."""
 
     # Eager load QueryEngine on registration
     query_engine = _init_query_engine()
 
+    # (collection_type, normalized query) -> in-flight retrieval task
+    inflight = {}
+
+    async def run_retrieval(query: str, collection_type: str) -> dict:
+        """
+        Run query_engine.retrieve_structured in a worker thread, single-flight.
+
+        Identical concurrent calls (same normalized query + collection, e.g.
+        several students asking the same FAQ at once) share one pipeline run
+        instead of each paying for HyDE, search, reranking and distillation.
+        Each caller gets its own copy of the result, echoing its own query.
+        """
+        key = (collection_type, normalize_query_key(query))
+        task = inflight.get(key)
+        if task is None:
+            # Run blocking query_engine call in thread pool to avoid blocking event loop
+            task = asyncio.ensure_future(asyncio.to_thread(
+                query_engine.retrieve_structured, query, collection_type=collection_type
+            ))
+            inflight[key] = task
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        else:
+            logger.info(f"[RETRIEVAL TOOLS] Joining in-flight {collection_type} retrieval for: {query[:60]}")
+
+        # Shield: a cancelled caller must not cancel the run other callers await
+        result = await asyncio.shield(task)
+        # Joined callers may have phrased the query differently; each gets its own
+        return {**result, "query": query}
+
     @mcp.tool()
     async def retrieve_regulation(query: str) -> ToolResult:
         """
@@ -90,33 +162,19 @@ def register_retrieval_tools(mcp: FastMCP):
         Returns:
             ToolResult chứa các chunk văn bản liên quan dưới dạng JSON (gồm nội dung và metadata)
         """
-        import json
-        
         try:
-            # Run blocking query_engine call in thread pool to avoid blocking event loop
-            result_dict = await asyncio.to_thread(
-                query_engine.retrieve_structured, query, collection_type="regulation"
-            )
+            result_dict = await run_retrieval(query, "regulation")
 
             # Validate with Pydantic
-            result_model = RegulationRetrievalResult(**result_dict)
-
-            # Serialize to JSON for content (LangChain compatibility)
-            json_content = json.dumps(
-                result_model.model_dump(), ensure_ascii=False, indent=2
-            )
-
-            # Return ToolResult with both text and structured content
-            return ToolResult(
-                content=json_content,  # JSON string for LangChain
-                structured_content=result_model.model_dump(),  # Object for MCP Inspector
-            )
+            return _to_tool_result(RegulationRetrievalResult(**result_dict))
             
         except Exception as e:
-            # Log error and return error response to prevent tool call hanging
-            print(f"[ERROR] retrieve_regulation failed: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            # Log error and return error response to prevent tool call hanging.
+            # Full traceback only at DEBUG: formatting it is synchronous work on the event loop
+            logger.error(
+                f"[RETRIEVAL TOOLS] retrieve_regulation failed: {type(e).__name__}: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             
             # Return error as valid tool result
             error_result = {
@@ -126,7 +184,7 @@ def register_retrieval_tools(mcp: FastMCP):
                 'error': f"{type(e).__name__}: {str(e)}"
             }
             
-            error_json = json.dumps(error_result, ensure_ascii=False, indent=2)
+            error_json = json.dumps(error_result, ensure_ascii=False, separators=_JSON_SEPARATORS)
             
             return ToolResult(
                 content=error_json,
@@ -165,33 +223,19 @@ def register_retrieval_tools(mcp: FastMCP):
         Returns:
            ToolResult chứa các chunk văn bản liên quan dưới dạng JSON (gồm nội dung và metadata)
         """
-        import json
-        
         try:
-            # Run blocking query_engine call in thread pool to avoid blocking event loop
-            result_dict = await asyncio.to_thread(
-                query_engine.retrieve_structured, query, collection_type="curriculum"
-            )
+            result_dict = await run_retrieval(query, "curriculum")
 
             # Validate with Pydantic
-            result_model = CurriculumRetrievalResult(**result_dict)
-
-            # Serialize to JSON for content (LangChain compatibility)
-            json_content = json.dumps(
-                result_model.model_dump(), ensure_ascii=False, indent=2
-            )
-
-            # Return ToolResult with both text and structured content
-            return ToolResult(
-                content=json_content,  # JSON string for LangChain
-                structured_content=result_model.model_dump(),  # Object for MCP Inspector
-            )
+            return _to_tool_result(CurriculumRetrievalResult(**result_dict))
             
         except Exception as e:
-            # Log error and return error response to prevent tool call hanging
-            print(f"[ERROR] retrieve_curriculum failed: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            # Log error and return error response to prevent tool call hanging.
+            # Full traceback only at DEBUG: formatting it is synchronous work on the event loop
+            logger.error(
+                f"[RETRIEVAL TOOLS] retrieve_curriculum failed: {type(e).__name__}: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             
             # Return error as valid tool result
             error_result = {
@@ -201,9 +245,75 @@ def register_retrieval_tools(mcp: FastMCP):
                 'error': f"{type(e).__name__}: {str(e)}"
             }
             
-            error_json = json.dumps(error_result, ensure_ascii=False, indent=2)
+            error_json = json.dumps(error_result, ensure_ascii=False, separators=_JSON_SEPARATORS)
             
             return ToolResult(
                 content=error_json,
                 is_error=True
             )
+
+    @mcp.tool()
+    async def batch_retrieve(
+        queries: List[str],
+        collection_type: Literal["regulation", "curriculum"] = "regulation"
+    ) -> ToolResult:
+        """
+        Truy xuất NHIỀU câu hỏi cùng lúc trong MỘT lần gọi tool.
+
+        DÙNG KHI:
+        - User hỏi về nhiều chủ đề độc lập trong cùng một tin nhắn
+          (ví dụ: "điều kiện tốt nghiệp và quy định chuyển ngành?")
+        - Cần so sánh nhiều ngành/năm (ví dụ: môn học ngành KHMT năm 2023 và 2025)
+
+        Các quy tắc viết query giống hệt `retrieve_regulation()` / `retrieve_curriculum()`.
+
+        Args:
+            queries: Danh sách câu hỏi tìm kiếm (tối đa 8)
+            collection_type: "regulation" (quy định chung) hoặc "curriculum" (chương trình đào tạo)
+
+        Returns:
+            ToolResult chứa danh sách kết quả theo đúng thứ tự queries, dưới dạng JSON
+        """
+        result_model_cls = _RESULT_MODELS[collection_type]
+        semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENT)
+
+        async def retrieve_one(query: str) -> dict:
+            async with semaphore:
+                try:
+                    result_dict = await run_retrieval(query, collection_type)
+                    return result_model_cls(**result_dict).model_dump()
+                except Exception as e:
+                    logger.error(
+                        f"[RETRIEVAL TOOLS] batch_retrieve failed for '{query}': {type(e).__name__}: {e}",
+                        exc_info=logger.isEnabledFor(logging.DEBUG),
+                    )
+                    return {
+                        'query': query,
+                        'total_retrieved': 0,
+                        'documents': [],
+                        'error': f"{type(e).__name__}: {str(e)}"
+                    }
+
+        accepted = queries[:BATCH_MAX_QUERIES]
+        skipped = queries[BATCH_MAX_QUERIES:]
+
+        results = await asyncio.gather(*[
+            retrieve_one(query) for query in accepted
+        ])
+
+        batch_result = {"results": results}
+        if skipped:
+            # Tell the model explicitly so it doesn't treat these as answered
+            logger.warning(
+                f"[RETRIEVAL TOOLS] batch_retrieve got {len(queries)} queries, "
+                f"skipped {len(skipped)} over the limit of {BATCH_MAX_QUERIES}"
+            )
+            batch_result["skipped_queries"] = skipped
+            batch_result["note"] = (
+                f"Chỉ truy xuất {BATCH_MAX_QUERIES} query đầu tiên. Các query trong "
+                f"skipped_queries CHƯA được truy xuất - hãy gọi lại tool cho chúng."
+            )
+        return ToolResult(
+            content=json.dumps(batch_result, ensure_ascii=False, separators=_JSON_SEPARATORS),
+            structured_content=batch_result,
+        )
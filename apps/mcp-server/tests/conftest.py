@@ -0,0 +1,149 @@
+"""
+Put the app root on sys.path so tests import `src.` the way main.py does.
+
+The unit tests exercise our own logic (caches, single-flight, batching), not
+the retrieval stack around it. When a heavy dependency is not installed, a
+minimal fake stands in for the parts of its API that `src` touches, so the
+suite runs in a plain environment. Installed packages are always used as-is.
+"""
+
+import importlib.util
+import math
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+_FAKED = set()
+
+
+def _fake_module(name: str, **attrs):
+    """Register a fake `name` (and its parent packages) unless it is installed."""
+    top = name.split(".")[0]
+    if top not in _FAKED:
+        if importlib.util.find_spec(top) is not None:
+            return
+        _FAKED.add(top)
+    parts = name.split(".")
+    for i in range(1, len(parts) + 1):
+        sys.modules.setdefault(".".join(parts[:i]), types.ModuleType(".".join(parts[:i])))
+    for i in range(1, len(parts)):
+        setattr(sys.modules[".".join(parts[:i])], parts[i], sys.modules[".".join(parts[: i + 1])])
+    for key, value in attrs.items():
+        setattr(sys.modules[name], key, value)
+
+
+class _Placeholder:
+    """Stand-in for classes that are imported but never used by the tests."""
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+# --- dotenv / requests / vector store / LLM stack ----------------------------
+
+_fake_module("dotenv", load_dotenv=lambda *args, **kwargs: False)
+_fake_module("requests", Session=_Placeholder, post=None, RequestException=Exception)
+_fake_module("chromadb", PersistentClient=_Placeholder)
+_fake_module(
+    "llama_index.core",
+    VectorStoreIndex=_Placeholder,
+    Settings=types.SimpleNamespace(embed_model=None, llm=None),
+)
+_fake_module(
+    "llama_index.core.schema",
+    NodeWithScore=_Placeholder,
+    QueryBundle=_Placeholder,
+    TextNode=_Placeholder,
+)
+_fake_module(
+    "llama_index.core.llms",
+    ChatMessage=_Placeholder,
+    MessageRole=types.SimpleNamespace(SYSTEM="system", USER="user", ASSISTANT="assistant"),
+    LLM=_Placeholder,
+)
+_fake_module("llama_index.llms.openai", OpenAI=_Placeholder)
+_fake_module("llama_index.llms.gemini", Gemini=_Placeholder)
+_fake_module("llama_index.llms.ollama", Ollama=_Placeholder)
+_fake_module("llama_index.retrievers.bm25", BM25Retriever=_Placeholder)
+_fake_module("llama_index.vector_stores.chroma", ChromaVectorStore=_Placeholder)
+_fake_module("llama_index.embeddings.openai", OpenAIEmbedding=_Placeholder)
+
+
+# --- fastmcp ------------------------------------------------------------------
+
+class _FakeToolResult:
+    def __init__(self, content=None, structured_content=None, is_error=False):
+        self.content = content
+        self.structured_content = structured_content
+        self.is_error = is_error
+
+
+_fake_module("fastmcp", FastMCP=_Placeholder)
+_fake_module("fastmcp.tools.tool", ToolResult=_FakeToolResult)
+
+
+# --- pydantic -----------------------------------------------------------------
+
+_REQUIRED = object()
+
+
+def _field(default=_REQUIRED, **kwargs):
+    return default
+
+
+class _FakeBaseModel:
+    """Sets annotated fields from kwargs or defaults; no validation."""
+
+    def __init__(self, **data):
+        for cls in reversed(type(self).__mro__):
+            for name in getattr(cls, "__annotations__", {}):
+                if name in data:
+                    value = data[name]
+                else:
+                    value = getattr(cls, name, _REQUIRED)
+                    if value is _REQUIRED:
+                        raise TypeError(f"{type(self).__name__}: missing field '{name}'")
+                setattr(self, name, value)
+
+    def model_dump(self):
+        def dump(value):
+            if isinstance(value, _FakeBaseModel):
+                return value.model_dump()
+            if isinstance(value, list):
+                return [dump(item) for item in value]
+            return value
+
+        return {
+            name: dump(getattr(self, name))
+            for cls in reversed(type(self).__mro__)
+            for name in getattr(cls, "__annotations__", {})
+        }
+
+
+_fake_module("pydantic", BaseModel=_FakeBaseModel, Field=_field, ConfigDict=dict)
+
+
+# --- numpy (just the vector math the semantic cache does) ---------------------
+
+class _FakeArray(list):
+    def __truediv__(self, scalar):
+        return _FakeArray(x / scalar for x in self)
+
+    def __matmul__(self, vector):
+        # Rows @ vector -> dot product per row
+        return _FakeArray(sum(a * b for a, b in zip(row, vector)) for row in self)
+
+
+_fake_module(
+    "numpy",
+    ndarray=_FakeArray,
+    float32=float,
+    asarray=lambda values, dtype=float: _FakeArray(dtype(x) for x in values),
+    stack=lambda rows: _FakeArray(rows),
+    argmax=lambda values: max(range(len(values)), key=values.__getitem__),
+    linalg=types.SimpleNamespace(norm=lambda values: math.sqrt(sum(x * x for x in values))),
+)
@@ -0,0 +1,102 @@
+"""
+batch_retrieve tool: ordering, per-query errors, the query limit and
+single-flight sharing of identical queries.
+"""
+
+import asyncio
+
+import pytest
+
+from src.tools import retrieval_tools
+
+
+class _FakeMCP:
+    """Collects the functions registered with @mcp.tool()."""
+
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self):
+        def register(fn):
+            self.tools[fn.__name__] = fn
+            return fn
+        return register
+
+
+class _FakeQueryEngine:
+    use_reranker = False
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def retrieve_structured(self, query, collection_type):
+        self.calls.append((query, collection_type))
+        if query in self.failing:
+            raise RuntimeError(f"boom: {query}")
+        return {
+            "query": query,
+            "total_retrieved": 0,
+            "documents": [],
+            "distilled_context": None,
+        }
+
+
+@pytest.fixture
+def register(monkeypatch):
+    def _register(engine):
+        monkeypatch.setattr(retrieval_tools, "_init_query_engine", lambda: engine)
+        mcp = _FakeMCP()
+        retrieval_tools.register_retrieval_tools(mcp)
+        return mcp.tools["batch_retrieve"]
+    return _register
+
+
+def test_batch_retrieve_keeps_query_order(register):
+    engine = _FakeQueryEngine()
+    batch_retrieve = register(engine)
+
+    result = asyncio.run(batch_retrieve(["q1", "q2", "q3"], "regulation"))
+
+    assert [r["query"] for r in result.structured_content["results"]] == ["q1", "q2", "q3"]
+    assert "skipped_queries" not in result.structured_content
+    assert {collection for _, collection in engine.calls} == {"regulation"}
+
+
+def test_batch_retrieve_reports_failed_query_without_failing_batch(register):
+    batch_retrieve = register(_FakeQueryEngine(failing={"q2"}))
+
+    results = asyncio.run(batch_retrieve(["q1", "q2"], "curriculum")).structured_content["results"]
+
+    assert "error" not in results[0]
+    assert results[1]["query"] == "q2"
+    assert results[1]["total_retrieved"] == 0
+    assert results[1]["error"] == "RuntimeError: boom: q2"
+
+
+def test_batch_retrieve_reports_queries_over_the_limit(register):
+    engine = _FakeQueryEngine()
+    batch_retrieve = register(engine)
+    limit = retrieval_tools.BATCH_MAX_QUERIES
+    queries = [f"q{i}" for i in range(limit + 2)]
+
+    batch_result = asyncio.run(batch_retrieve(queries, "regulation")).structured_content
+
+    assert len(batch_result["results"]) == limit
+    assert batch_result["skipped_queries"] == queries[limit:]
+    assert batch_result["note"]
+    assert sorted(query for query, _ in engine.calls) == sorted(queries[:limit])
+
+
+def test_batch_retrieve_shares_identical_queries(register):
+    engine = _FakeQueryEngine()
+    batch_retrieve = register(engine)
+
+    results = asyncio.run(
+        batch_retrieve(["Học phí?", "học phí", "quy chế"], "regulation")
+    ).structured_content["results"]
+
+    # Same normalized query -> one pipeline run
+    assert len(engine.calls) == 2
+    # ...but every caller sees its own wording
+    assert [r["query"] for r in results] == ["Học phí?", "học phí", "quy chế"]
@@ -0,0 +1,27 @@
+"""
+QueryEngine.retrieve_structured: cache hits echo the caller's query.
+"""
+
+import pytest
+
+from src.retriever.query_engine import QueryEngine
+from src.retriever.result_cache import ResultCache
+
+
+@pytest.fixture
+def engine():
+    # Only the cache attributes are needed on the hit path
+    engine = QueryEngine.__new__(QueryEngine)
+    engine.result_cache = ResultCache(max_entries=8, ttl_seconds=60)
+    engine.semantic_cache = None
+    return engine
+
+
+def test_result_cache_hit_echoes_callers_query(engine):
+    engine.result_cache.put("Học phí?", "regulation", {"query": "Học phí?", "documents": ["d1"]})
+
+    result = engine.retrieve_structured("học phí", "regulation")
+
+    assert result == {"query": "học phí", "documents": ["d1"]}
+    # The cached entry keeps its own query
+    assert engine.result_cache.get("học phí", "regulation")["query"] == "Học phí?"
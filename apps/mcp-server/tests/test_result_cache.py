@@ -0,0 +1,58 @@
+"""
+ResultCache: hits on the normalized query, per-collection keys, copies,
+LRU eviction and TTL expiry.
+"""
+
+import pytest
+
+from src.retriever import ttl_cache
+from src.retriever.result_cache import ResultCache
+
+
+class _Clock:
+    """Stand-in for the `time` module with a manually advanced monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ttl_cache, "time", clock)
+    return clock
+
+
+def test_hits_on_normalized_query(clock):
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+    cache.put("Điều kiện  tốt nghiệp?", "regulation", {"documents": ["d1"]})
+
+    assert cache.get("điều kiện tốt nghiệp", "regulation") == {"documents": ["d1"]}
+    # Collections are separate
+    assert cache.get("điều kiện tốt nghiệp", "curriculum") is None
+
+
+def test_returns_copies(clock):
+    cache = ResultCache(max_entries=10, ttl_seconds=60)
+    cache.put("q", "regulation", {"documents": ["d1"]})
+
+    cache.get("q", "regulation")["documents"].append("mutated")
+
+    assert cache.get("q", "regulation") == {"documents": ["d1"]}
+
+
+def test_expires_and_evicts(clock):
+    cache = ResultCache(max_entries=2, ttl_seconds=60)
+    cache.put("q1", "regulation", {"n": 1})
+    cache.put("q2", "regulation", {"n": 2})
+    cache.put("q3", "regulation", {"n": 3})
+
+    assert cache.get("q1", "regulation") is None
+    assert cache.get("q2", "regulation") == {"n": 2}
+
+    clock.now += 61
+    assert cache.get("q2", "regulation") is None
+    assert cache.get("q3", "regulation") is None
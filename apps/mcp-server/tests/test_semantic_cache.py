@@ -0,0 +1,116 @@
+"""
+SemanticCache: similarity threshold, TTL expiry, eviction and the query
+scope (program / year / program type) a hit must share.
+"""
+
+import pytest
+
+from src.retriever import semantic_cache
+from src.retriever.semantic_cache import SemanticCache, query_scope
+
+# cos(q, "điều kiện tốt nghiệp") = 0.95 for the paraphrase, 0.8 for the other
+# topic. Any other query embeds exactly like "điều kiện tốt nghiệp", so only
+# the scope can tell them apart.
+_EMBEDDINGS = {
+    "điều kiện để tốt nghiệp": [0.95, 0.31224989991991997],
+    "quy định chuyển ngành": [0.8, 0.6],
+}
+
+
+class _Clock:
+    """Stand-in for the `time` module with a manually advanced monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    monkeypatch.setattr(
+        semantic_cache, "get_query_embedding", lambda query: _EMBEDDINGS.get(query, [1.0, 0.0])
+    )
+    clock = _Clock()
+    monkeypatch.setattr(semantic_cache, "time", clock)
+    return clock
+
+
+def _store(cache, query, collection_type, result):
+    _, embedding = cache.lookup(query, collection_type)
+    cache.store(query, embedding, collection_type, result)
+
+
+def test_hits_above_threshold():
+    cache = SemanticCache(similarity_threshold=0.92, max_entries=8, ttl_seconds=60)
+    _store(cache, "điều kiện tốt nghiệp", "regulation", {"answer": "tn"})
+
+    result, _ = cache.lookup("điều kiện để tốt nghiệp", "regulation")
+
+    assert result == {"answer": "tn"}
+
+
+def test_misses_below_threshold_and_in_other_collection():
+    cache = SemanticCache(similarity_threshold=0.92, max_entries=8, ttl_seconds=60)
+    _store(cache, "điều kiện tốt nghiệp", "regulation", {"answer": "tn"})
+
+    assert cache.lookup("quy định chuyển ngành", "regulation")[0] is None
+    assert cache.lookup("điều kiện tốt nghiệp", "curriculum")[0] is None
+
+
+def test_threshold_is_inclusive():
+    cache = SemanticCache(similarity_threshold=0.8, max_entries=8, ttl_seconds=60)
+    _store(cache, "điều kiện tốt nghiệp", "regulation", {"answer": "tn"})
+
+    assert cache.lookup("quy định chuyển ngành", "regulation")[0] == {"answer": "tn"}
+
+
+def test_expires_entries(clock):
+    cache = SemanticCache(similarity_threshold=0.92, max_entries=8, ttl_seconds=60)
+    _store(cache, "điều kiện tốt nghiệp", "regulation", {"answer": "tn"})
+
+    clock.now += 61
+
+    assert cache.lookup("điều kiện tốt nghiệp", "regulation")[0] is None
+
+
+def test_evicts_oldest_entry():
+    cache = SemanticCache(similarity_threshold=0.99, max_entries=1, ttl_seconds=60)
+    _store(cache, "điều kiện tốt nghiệp", "regulation", {"answer": "tn"})
+    _store(cache, "quy định chuyển ngành", "regulation", {"answer": "cn"})
+
+    assert cache.lookup("điều kiện tốt nghiệp", "regulation")[0] is None
+    assert cache.lookup("quy định chuyển ngành", "regulation")[0] == {"answer": "cn"}
+
+
+@pytest.mark.parametrize(
+    "cached_query, query",
+    [
+        ("môn học ngành Khoa học máy tính năm 2023", "môn học ngành Khoa học máy tính năm 2025"),
+        ("môn học ngành Khoa học máy tính khóa 17", "môn học ngành Khoa học máy tính khóa 18"),
+        ("môn học ngành Khoa học máy tính năm 2025", "môn học ngành Kỹ thuật máy tính năm 2025"),
+        ("học phí hệ chính quy năm 2025", "học phí hệ từ xa năm 2025"),
+        ("học phí năm 2025", "học phí"),
+    ],
+)
+def test_never_hits_across_scopes(cached_query, query):
+    cache = SemanticCache(similarity_threshold=0.5, max_entries=8, ttl_seconds=60)
+    _store(cache, cached_query, "curriculum", {"answer": cached_query})
+
+    assert cache.lookup(query, "curriculum")[0] is None
+
+
+def test_same_scope_still_hits_among_other_scopes():
+    cache = SemanticCache(similarity_threshold=0.92, max_entries=8, ttl_seconds=60)
+    _store(cache, "môn học ngành KHMT năm 2023", "curriculum", {"answer": "2023"})
+    _store(cache, "môn học ngành KHMT năm 2025", "curriculum", {"answer": "2025"})
+
+    result, _ = cache.lookup("các môn của ngành Khoa học máy tính năm 2025", "curriculum")
+
+    assert result == {"answer": "2025"}
+
+
+def test_query_scope_normalizes_cohorts():
+    assert query_scope("CTĐT K17")[1] == query_scope("chương trình khóa 17")[1] == ("k17",)
+    assert query_scope("điều kiện tốt nghiệp") == (None, (), ())
@@ -0,0 +1,64 @@
+"""
+TTLCache: LRU eviction and TTL expiry.
+"""
+
+import pytest
+
+from src.retriever import ttl_cache
+from src.retriever.ttl_cache import TTLCache
+
+
+class _Clock:
+    """Stand-in for the `time` module with a manually advanced monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ttl_cache, "time", clock)
+    return clock
+
+
+def test_evicts_least_recently_used(clock):
+    cache = TTLCache(max_items=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_set_refreshes_existing_key(clock):
+    cache = TTLCache(max_items=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_expires_entries(clock):
+    cache = TTLCache(max_items=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    clock.now += 60
+    assert cache.get("a") == 1
+
+    clock.now += 1
+    assert cache.get("a") is None
+    # Expired entries are dropped on read
+    assert len(cache) == 0
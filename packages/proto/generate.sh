@@ -0,0 +1,45 @@
+#!/usr/bin/env bash
+# Regenerate the gRPC stubs from agent.proto (Go for api-gateway, Python for agent).
+#
+# Tool versions are pinned to the ones the checked-in stubs were generated
+# with. Bump them here and regenerate; never hand-edit the generated files.
+#
+# Requires: protoc 33.x, go, uv
+set -euo pipefail
+
+PROTOC_VERSION=33.0
+PROTOC_GEN_GO_VERSION=v1.36.11
+PROTOC_GEN_GO_GRPC_VERSION=v1.6.0
+
+ROOT="$(cd "$(dirname "$0")/../.." && pwd)"
+PROTO_DIR="$ROOT/packages/proto"
+GO_OUT="$ROOT/apps/api-gateway/internal/platform/grpc/pb"
+PY_OUT="$ROOT/apps/agent/src/grpc/pb"
+
+found="$(protoc --version | awk '{print $2}')"
+if [[ "$found" != "$PROTOC_VERSION" ]]; then
+  echo "protoc $PROTOC_VERSION required, found $found" >&2
+  exit 1
+fi
+
+# Go plugins at the pinned versions, in a throwaway bin dir
+GOBIN="$(mktemp -d)"
+trap 'rm -rf "$GOBIN"' EXIT
+GOBIN="$GOBIN" go install "google.golang.org/protobuf/cmd/protoc-gen-go@$PROTOC_GEN_GO_VERSION"
+GOBIN="$GOBIN" go install "google.golang.org/grpc/cmd/protoc-gen-go-grpc@$PROTOC_GEN_GO_GRPC_VERSION"
+
+PATH="$GOBIN:$PATH" protoc -I "$PROTO_DIR" \
+  --go_out="$GO_OUT" --go_opt=paths=source_relative \
+  --go-grpc_out="$GO_OUT" --go-grpc_opt=paths=source_relative \
+  "$PROTO_DIR/agent.proto"
+
+# Python stubs: grpcio-tools (and its bundled protoc) is pinned by apps/agent/uv.lock
+(cd "$ROOT/apps/agent" && uv run python -m grpc_tools.protoc -I "$PROTO_DIR" \
+  --python_out="$PY_OUT" --pyi_out="$PY_OUT" --grpc_python_out="$PY_OUT" \
+  "$PROTO_DIR/agent.proto")
+
+# grpc_tools emits a top-level import; the stubs live in the src.grpc.pb package
+sed -i.bak 's/^import agent_pb2 as agent__pb2$/from . import agent_pb2 as agent__pb2/' "$PY_OUT/agent_pb2_grpc.py"
+rm "$PY_OUT/agent_pb2_grpc.py.bak"
+
+echo "Generated stubs in $GO_OUT and $PY_OUT"